@@ -1,6 +1,46 @@
-from .access import *
+import importlib
+import types
+
 from .utils import *
 from .exceptions import *
-from .procore import Procore
 
-__version__ = "0.7.0"
\ No newline at end of file
+__version__ = "0.7.0"
+
+# imported on first use so short-lived processes only pay for what they touch
+_lazy = {
+    "Procore": ".procore",
+    "AsyncProcore": ".aio",
+    "ResponseCache": ".utils.cache",
+    "ConditionalCache": ".utils.cache",
+    "IncrementalSync": ".sync",
+    "SyncState": ".sync",
+    "DirectorySync": ".sync",
+    "CompanyScope": ".scope",
+}
+# record models (Rfi, Task, Document, ...) live in ProPyCore.models only - names like Task and Submittal are
+# already taken by the endpoint classes
+
+def _public(namespace):
+    return {name for name, value in namespace.items() if not name.startswith("_") and not isinstance(value, types.ModuleType)}
+
+def __getattr__(name):
+    if name in _lazy:
+        value = getattr(importlib.import_module(_lazy[name], __name__), name)
+    elif name == "__all__":
+        # built on first star import, which then resolves each name through this function
+        access = importlib.import_module(".access", __name__)
+        value = sorted(_public(globals()) | set(_lazy) | _public(vars(access)))
+    elif name.startswith("__"):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    else:
+        # endpoint classes (RFI, Folders, ...) re-exported from ProPyCore.access
+        try:
+            value = getattr(importlib.import_module(".access", __name__), name)
+        except AttributeError:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy) | set(dir(importlib.import_module(".access", __name__))))
@@ -1,26 +1,77 @@
-import urllib
-import requests
+import json
+import math
+import threading
+import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 from ..exceptions import raise_exception
+from ..utils.credentials import AccessToken
+from ..utils.multipart import MultipartEncoder
+from ..utils.session import ProcoreSession, rewind_body, rewind_files
+
+# headers of the last GET response, per thread, so pagination can read Total/Per-Page
+_last_response = threading.local()
 
 class Base:
     """
     Base class for Procore API access
     """
-    
-    def __init__(self, access_token, server_url) -> None:
+
+    # number of pages fetched at once when paginating
+    page_workers = 4
+
+    def __init__(self, access_token, server_url, session=None) -> None:
         """
         Initializes important API access parameters
 
         Creates
         -------
-        __access_token : str
-            token to access Procore resources
+        __access_token : str or AccessToken
+            token to access Procore resources - an AccessToken is read on every request so refreshes are picked up
         __server_url : str
             base url to send GET/POST requests
+        __session : ProcoreSession
+            pooled session to send requests through - shared when handed over by the Procore object
         """
         self.__access_token = access_token
         self.__server_url = server_url
+        self.__session = session if session is not None else ProcoreSession()
+
+    def _send(self, method, url, headers, **kwargs):
+        """
+        Sends the request with the current access token
+
+        A 401 with a shared AccessToken refreshes the token (once across threads) and re-sends the request once.
+
+        Parameters
+        ----------
+        method : str
+            session method to call - get, post, patch, or delete
+        url : str
+            full request url
+        headers : dict
+            headers beyond Authorization
+        **kwargs
+            passed through to the session, e.g. json, data, files
+
+        Returns
+        -------
+        response : HTTP response object
+        """
+        send = getattr(self.__session, method)
+
+        token = self.__access_token.value if isinstance(self.__access_token, AccessToken) else self.__access_token
+        response = send(url, headers={"Authorization": f"Bearer {token}", **headers}, **kwargs)
+
+        if response.status_code == 401 and isinstance(self.__access_token, AccessToken):
+            token = self.__access_token.refresh(stale=token)
+            rewind_files(kwargs.get("files"))
+            rewind_body(kwargs.get("data"))
+            response = send(url, headers={"Authorization": f"Bearer {token}", **headers}, **kwargs)
+
+        return response
 
     def get_request(self, api_url, additional_headers=None, params=None):
         """
@@ -45,18 +96,180 @@ class Base:
         else:
             url = self.__server_url + api_url + "?" + urllib.parse.urlencode(params, doseq=True)
 
-        headers = {"Authorization": f"Bearer {self.__access_token}"}
+        headers = {}
         if additional_headers is not None:
             for key, value in additional_headers.items():
                 headers[key] = value
 
-        response = requests.get(url, headers=headers)
-        
+        # serve reference data from the response cache when the session has one
+        cache = getattr(self.__session, "cache", None)
+        ttl = cache.ttl_for(api_url) if cache is not None else None
+        if ttl is not None:
+            cached = cache.get(url, headers.get("Procore-Company-Id"))
+            if cached is not None:
+                body, _last_response.headers = cached
+                return json.loads(body)
+
+        # revalidate what we already have instead of downloading it again
+        conditional = getattr(self.__session, "conditional_cache", None)
+        if conditional is not None:
+            headers.update(conditional.validators(url, headers.get("Procore-Company-Id")))
+
+        response = self._send("get", url, headers)
+        _last_response.headers = response.headers
+
+        if response.status_code == 304 and conditional is not None:
+            stored = conditional.not_modified(url, headers.get("Procore-Company-Id"))
+            if stored is not None:
+                body, _last_response.headers = stored
+                return json.loads(body)
+
+            # evicted while the request was in flight - fetch it in full
+            for name in ("If-None-Match", "If-Modified-Since"):
+                headers.pop(name, None)
+            response = self._send("get", url, headers)
+            _last_response.headers = response.headers
+
         if response.ok:
+            if ttl is not None:
+                cache.set(url, api_url, headers.get("Procore-Company-Id"), response.text, response.headers, ttl)
+            if conditional is not None:
+                conditional.store(url, headers.get("Procore-Company-Id"), response.text, response.headers)
             return response.json()
         else:
             raise_exception(response)
+
+    def _invalidate_cache(self, api_url):
+        """
+        Drops cached responses for the collection a POST/PATCH/DELETE just changed
+        """
+        cache = getattr(self.__session, "cache", None)
+        if cache is None:
+            return
+
+        collection = api_url.split("?")[0].rstrip("/")
+        if collection.rsplit("/", 1)[-1].isdigit():
+            collection = collection.rsplit("/", 1)[0]
+
+        cache.invalidate(collection + "*")
     
+    def iter_pages(self, api_url, additional_headers=None, params=None, per_page=100, page=1):
+        """
+        Yields every page of a list endpoint in page order
+
+        The first page is requested on its own. If the response carries the Total and Per-Page
+        headers, the remaining pages are requested in parallel on a pool of page_workers threads.
+        Otherwise pages are requested speculatively in growing batches (1, 2, 4, ... page_workers)
+        until an empty page is found.
+
+        Parameters
+        ----------
+        api_url : str
+            endpoint for the specific API call
+        additional_headers : dict, default None
+            additional headers beyond Authorization
+        params : dict, default None
+            GET parameters to include with every page
+        per_page : int, default 100
+            number of items to request per page
+        page : int, default 1
+            first page to request
+
+        Yields
+        ------
+        selection : list of dict
+            items on a single page
+        """
+        def fetch(page_number):
+            page_params = dict(params) if params is not None else {}
+            page_params["page"] = page_number
+            page_params["per_page"] = per_page
+
+            return self.get_request(
+                api_url=api_url,
+                additional_headers=additional_headers,
+                params=page_params
+            )
+
+        _last_response.headers = None
+        selection = fetch(page)
+        headers = getattr(_last_response, "headers", None)
+        if len(selection) == 0:
+            return
+        yield selection
+
+        total, page_size = _page_info(headers)
+        workers = max(1, self.page_workers)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = deque()
+        try:
+            if total is not None:
+                # known page count - keep a sliding window of page_workers requests in flight
+                remaining = iter(range(page + 1, math.ceil(total / page_size) + 1))
+                futures.extend(executor.submit(fetch, page_number) for page_number in islice(remaining, workers))
+                while futures:
+                    selection = futures.popleft().result()
+                    page_number = next(remaining, None)
+                    if page_number is not None:
+                        futures.append(executor.submit(fetch, page_number))
+
+                    if len(selection) > 0:
+                        yield selection
+            else:
+                # unknown page count - look ahead in growing batches until an empty page
+                page += 1
+                window = 1
+                while True:
+                    futures.extend(executor.submit(fetch, page + i) for i in range(window))
+                    while futures:
+                        selection = futures.popleft().result()
+                        if len(selection) == 0:
+                            return
+                        yield selection
+
+                    page += window
+                    window = min(window * 2, workers)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def find_first(self, records, key, identifier, fallback=None):
+        """
+        Returns the first streamed record matching the identifier and stops requesting pages
+
+        Parameters
+        ----------
+        records : generator of dict
+            records from one of the iter_* methods - ideally narrowed by a server-side filter
+        key : str or callable
+            field to compare, or a function returning the value to compare from a record
+        identifier : int or str
+            value to look for
+        fallback : callable, default None
+            returns an unfiltered generator to scan when the filtered records came back empty,
+            in case the server-side filter does not behave as an exact match
+
+        Returns
+        -------
+        record : dict or None
+            matching record, None when it could not be found
+        """
+        n_records = 0
+        try:
+            for record in records:
+                n_records += 1
+                value = key(record) if callable(key) else record.get(key)
+                if value == identifier:
+                    return record
+        finally:
+            records.close() # cancels any pages still being fetched
+
+        if n_records == 0 and fallback is not None:
+            return self.find_first(fallback(), key, identifier)
+
+        return None
+
     def post_request(self, api_url, additional_headers=None, params=None, data=None, files=None):
         """
         Create a HTTP Post request
@@ -70,7 +283,7 @@ class Base:
         data : dict, default None
             POST data to send
         files : list of tuple, default None
-            open files to send to Procore
+            open files to send to Procore - streamed as multipart/form-data, so they must stay open until this returns
 
         Returns
         -------
@@ -84,7 +297,7 @@ class Base:
             url = self.__server_url + api_url + "?" + urllib.parse.urlencode(params)
 
         # Get Headers
-        headers = {"Authorization": f"Bearer {self.__access_token}"}
+        headers = {}
         if additional_headers is not None:
             for key, value in additional_headers.items():
                 headers[key] = value
@@ -92,10 +305,10 @@ class Base:
         # Make the request with file if necessary
         if files is None:
             headers["Content-Type"] = "application/json"
-            response = requests.request(
-                "POST",
+            response = self._send(
+                "post",
                 url,
-                headers=headers,
+                headers,
                 json=data  # Use json parameter instead of data to properly serialize
             )
             '''
@@ -103,17 +316,16 @@ class Base:
             print(f"Request Headers: {response.request.headers}")
             print(f"Request Data: {response.request.body}")
             '''
-        elif data is None:
-            response = requests.request(
-                "POST",
-                url,
-                headers=headers,
-                files=files  # use files for multipart/form-data
-            )
+        elif not files:
+            response = self._send("post", url, headers, data=data, files=files)
         else:
-            response = requests.request("POST", url, headers=headers, data=data, files=files)
+            # stream multipart/form-data from the open files instead of building the body in memory
+            body = MultipartEncoder(fields=data, files=files)
+            headers["Content-Type"] = body.content_type
+            response = self._send("post", url, headers, data=body)
 
         if response.ok:
+            self._invalidate_cache(api_url)
             return response.json()
         else:
             '''
@@ -153,32 +365,41 @@ class Base:
             url = self.__server_url + api_url + "?" + urllib.parse.urlencode(params)
 
         # Get Headers
-        headers = {"Authorization": f"Bearer {self.__access_token}"}
+        headers = {}
         if additional_headers is not None:
             for key, value in additional_headers.items():
                 headers[key] = value
         
         if files is False:
-            response = requests.patch(
+            response = self._send(
+                "patch",
                 url,
-                headers=headers,
+                headers,
                 json=data # json for folder update
             )
         elif files is True:
-            response = requests.patch(
+            response = self._send(
+                "patch",
                 url,
-                headers=headers,
+                headers,
                 data=data, # data for file update
             )
-        else:
-            response = requests.patch(
+        elif not files:
+            response = self._send(
+                "patch",
                 url,
-                headers=headers,
+                headers,
                 data=data, # data for file update
                 files=files
             )
+        else:
+            # stream multipart/form-data from the open files instead of building the body in memory
+            body = MultipartEncoder(fields=data, files=files)
+            headers["Content-Type"] = body.content_type
+            response = self._send("patch", url, headers, data=body)
 
         if response.ok:
+            self._invalidate_cache(api_url)
             return response.json()
         else:
             raise_exception(response)
@@ -208,18 +429,70 @@ class Base:
             url = self.__server_url + api_url + "?" + urllib.parse.urlencode(params)
 
         # Get Headers
-        headers = {"Authorization": f"Bearer {self.__access_token}"}
+        headers = {}
         if additional_headers is not None:
             for key, value in additional_headers.items():
                 headers[key] = value
 
         # DELETE request
-        response = requests.delete(
-            url=url,
-            headers=headers,
-        )
+        response = self._send("delete", url, headers)
 
         if response.ok:
+            self._invalidate_cache(api_url)
             return {"status_code":response.status_code}
         else:
-            raise_exception(response)
\ No newline at end of file
+            raise_exception(response)
+
+    def external_request(self, method, url, **kwargs):
+        """
+        Sends a request to a url outside the Procore API, e.g. the storage urls handed out for uploads and downloads
+
+        Goes through the shared session (pooled and retried) but without the Authorization header, which storage
+        providers reject next to their own signature, and outside the rate limiter, since storage traffic does not
+        count against Procore's quota.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method, e.g. PUT or GET
+        url : str
+            full url as given by Procore
+        **kwargs
+            passed through to the session, e.g. data, headers, stream
+
+        Returns
+        -------
+        response : HTTP response object
+            returned as is - the caller checks the status and closes streamed responses
+        """
+        return self.__session.request(method, url, rate_limited=False, **kwargs)
+
+def _page_info(headers):
+    """
+    Reads the pagination headers from a list response
+
+    Parameters
+    ----------
+    headers : dict-like or None
+        response headers
+
+    Returns
+    -------
+    total : int or None
+        total number of items across all pages - None when not provided
+    per_page : int or None
+        number of items on each page - None when not provided
+    """
+    if headers is None:
+        return None, None
+
+    try:
+        total = int(headers["Total"])
+        per_page = int(headers["Per-Page"])
+    except (KeyError, TypeError, ValueError):
+        return None, None
+
+    if per_page <= 0:
+        return None, None
+
+    return total, per_page
@@ -2,10 +2,46 @@ from .views import BudgetViews
 from .columns import BudgetColumns
 from .rows import BudgetRows
 from .details import BudgetDetails
+from .export import export_budgets
 
 class Budgets:
-    def __init__(self, access_token, server_url):
-        self.views = BudgetViews(access_token, server_url)
-        self.columns = BudgetColumns(access_token, server_url)
-        self.rows = BudgetRows(access_token, server_url)
-        self.details = BudgetDetails(access_token, server_url)
\ No newline at end of file
+    def __init__(self, access_token, server_url, session=None):
+        self.views = BudgetViews(access_token, server_url, session=session)
+        self.columns = BudgetColumns(access_token, server_url, session=session)
+        self.rows = BudgetRows(access_token, server_url, session=session)
+        self.details = BudgetDetails(access_token, server_url, session=session)
+
+    def export(self, company_id, project_ids, root, max_workers=4, batch_size=10000, file_format="parquet"):
+        """
+        Exports the Budget Detail Report of every budget view in the given projects to a Parquet/Arrow dataset
+        partitioned by company/project/view, with typed columns from the budget view (requires pyarrow)
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_ids : iterable of int or dict
+            projects to export - ids or project response bodies
+        root : str
+            dataset directory
+        max_workers : int, default 4
+            number of projects fetched at once - bounds memory too
+        batch_size : int, default 10000
+            rows per record batch / Parquet row group
+        file_format : str, default "parquet"
+            "parquet" or "arrow"
+
+        Returns
+        -------
+        report : list of dict
+            project_id, budget_view_id, rows, and path per exported view; project_id and error per failed project
+        """
+        return export_budgets(
+            self,
+            company_id=company_id,
+            project_ids=project_ids,
+            root=root,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            file_format=file_format
+        )
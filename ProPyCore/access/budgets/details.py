@@ -1,11 +1,14 @@
     
 from ..base import Base
 from ...exceptions import NotFoundItemError
+from .columns import BudgetColumns
+from .table import BudgetTable
 
 class BudgetDetails(Base):
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest/v1.0/budget_views"
+        self.columns = BudgetColumns(access_token, server_url, session=session)
 
     def get(self, company_id, project_id, budget_view_id):
         """
@@ -37,4 +40,31 @@ class BudgetDetails(Base):
             params=params
         )
 
-        return details
\ No newline at end of file
+        return details
+
+    def get_table(self, company_id, project_id, budget_view_id, details=None):
+        """
+        Gets the Budget Detail Report as a column-oriented table for vectorised totals and group-bys (requires numpy)
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        budget_view_id : int
+            unique identifier for the budget view
+        details : list of dict, default None
+            rows already pulled with get() - None pulls them
+
+        Returns
+        -------
+        table : BudgetTable
+            one float64 array per budget view column and one label array per other field (cost_code, ...),
+            e.g. table.group_sum("cost_code").to_rows()
+        """
+        columns = self.columns.get(company_id=company_id, project_id=project_id, budget_view_id=budget_view_id)
+        if details is None:
+            details = self.get(company_id=company_id, project_id=project_id, budget_view_id=budget_view_id)
+
+        return BudgetTable.from_rows(details, column_names=[column["name"] for column in columns])
@@ -0,0 +1,174 @@
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError: # optional dependency - only needed for budget exports
+    pa = None
+
+from ...exceptions import ProcoreException
+from .table import _to_float
+
+def budget_schema(columns, rows):
+    """
+    Arrow schema for one budget view: float64 for every budget view column, string for every other field
+
+    Parameters
+    ----------
+    columns : list of dict
+        column definitions from BudgetColumns.get()
+    rows : list of dict
+        rows from BudgetDetails.get()
+
+    Returns
+    -------
+    schema : pyarrow.Schema
+        budget view columns first, in view order, then the other fields in the order they appear
+    """
+    amounts = [column["name"] for column in columns]
+    labels = []
+    for row in rows:
+        for key in row:
+            if key not in labels and key not in amounts:
+                labels.append(key)
+
+    return pa.schema([pa.field(name, pa.float64()) for name in amounts] + [pa.field(name, pa.string()) for name in labels])
+
+def _label(value):
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+
+    return str(value)
+
+def _amount(value):
+    amount = _to_float(value)
+    return float("nan") if amount is None else amount
+
+def record_batches(schema, rows, batch_size=10000):
+    """
+    Converts rows to typed record batches, batch_size rows at a time
+
+    Yields
+    ------
+    batch : pyarrow.RecordBatch
+    """
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        arrays = []
+        for field in schema:
+            if pa.types.is_floating(field.type):
+                arrays.append(pa.array([_amount(row.get(field.name)) for row in chunk], type=field.type))
+            else:
+                arrays.append(pa.array([_label(row.get(field.name)) for row in chunk], type=field.type))
+
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def write_view(path, schema, rows, batch_size=10000, file_format="parquet"):
+    """
+    Writes one budget view to a file, one row group per batch, and moves it into place once complete
+
+    Returns
+    -------
+    <n_rows> : int
+        rows written
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.tmp"
+
+    if file_format == "parquet":
+        writer = pq.ParquetWriter(temp, schema)
+    else:
+        writer = pa.ipc.new_file(temp, schema)
+
+    try:
+        for batch in record_batches(schema, rows, batch_size=batch_size):
+            writer.write_batch(batch)
+    finally:
+        writer.close()
+
+    os.replace(temp, path)
+    return len(rows)
+
+def export_budgets(budgets, company_id, project_ids, root, max_workers=4, batch_size=10000, file_format="parquet"):
+    """
+    Exports the Budget Detail Report of every budget view in every project to a partitioned dataset
+
+    Files land in <root>/company_id=<id>/project_id=<id>/budget_view_id=<id>/part-0.<parquet|arrow>, which
+    pyarrow.dataset (and pandas, Spark, DuckDB, ...) read back with hive partitioning. Projects are fetched on a
+    bounded thread pool and each one's details are written and released before the next is picked up, so at most
+    max_workers projects are held in memory no matter how many are exported.
+
+    Parameters
+    ----------
+    budgets : Budgets
+        budgets accessor to pull through, e.g. procore.budgets
+    company_id : int
+        unique identifier for the company
+    project_ids : iterable of int or dict
+        projects to export - ids or project response bodies, e.g. procore.projects.iter_projects(company_id)
+    root : str
+        dataset directory
+    max_workers : int, default 4
+        number of projects fetched at once
+    batch_size : int, default 10000
+        rows per record batch / Parquet row group
+    file_format : str, default "parquet"
+        "parquet" or "arrow" (Arrow IPC file)
+
+    Returns
+    -------
+    report : list of dict
+        one per project and budget view with project_id, budget_view_id, rows, and path,
+        or project_id and error when the project could not be exported
+    """
+    if pa is None:
+        raise ImportError("Budget exports require pyarrow: pip install ProPyCore[export]")
+    if file_format not in ("parquet", "arrow"):
+        raise ValueError(f"Unsupported file_format '{file_format}' - choose from parquet or arrow")
+
+    def export_project(project_id):
+        results = []
+        for view in budgets.views.iter_views(company_id=company_id, project_id=project_id):
+            columns = budgets.columns.get(company_id=company_id, project_id=project_id, budget_view_id=view["id"])
+            rows = budgets.details.get(company_id=company_id, project_id=project_id, budget_view_id=view["id"]) or []
+
+            path = os.path.join(
+                root,
+                f"company_id={company_id}",
+                f"project_id={project_id}",
+                f"budget_view_id={view['id']}",
+                f"part-0.{file_format}"
+            )
+            n_rows = write_view(path, budget_schema(columns, rows), rows, batch_size=batch_size, file_format=file_format)
+            results.append({"project_id": project_id, "budget_view_id": view["id"], "rows": n_rows, "path": path})
+
+        return results
+
+    report = []
+    projects = iter(project_ids)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        while True:
+            # keep the pool busy without queueing every project up front
+            for project in projects:
+                project_id = project["id"] if isinstance(project, dict) else project
+                pending[executor.submit(export_project, project_id)] = project_id
+                if len(pending) >= max_workers:
+                    break
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                project_id = pending.pop(future)
+                try:
+                    report += future.result()
+                except (ProcoreException, OSError) as e:
+                    report.append({"project_id": project_id, "error": e})
+
+    return report
@@ -2,8 +2,8 @@ from ..base import Base
 from ...exceptions import NotFoundItemError
 
 class BudgetRows(Base):
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest/v1.0/budget_views"
 
     def get(self, company_id, project_id, budget_view_id):
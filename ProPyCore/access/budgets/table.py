@@ -0,0 +1,210 @@
+try:
+    import numpy as np
+except ImportError: # optional dependency - only needed for columnar budget tables
+    np = None
+
+def _to_float(value):
+    """
+    Reads a budget amount - numbers, numeric strings like "1,250.00", and blanks (NaN)
+    """
+    if value is None or value == "":
+        return float("nan")
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    try:
+        return float(str(value).replace(",", "").replace("$", ""))
+    except ValueError:
+        return None
+
+def _to_array(values):
+    """
+    Converts amounts to a float64 array - None when a value is not numeric
+    """
+    try:
+        # numbers, plain numeric strings, and None (NaN) convert in one pass
+        return np.array([float("nan") if value == "" else value for value in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        amounts = [_to_float(value) for value in values]
+        return None if None in amounts else np.array(amounts, dtype=np.float64)
+
+def _factorize(keys):
+    """
+    Numbers the distinct keys in sorted order
+
+    Returns
+    -------
+    groups : numpy.ndarray
+        distinct keys as text, sorted - None becomes ""
+    inverse : numpy.ndarray
+        group number of each key
+    """
+    # None and mixed types do not sort - group on the text instead
+    numbers = {}
+    codes = np.fromiter(
+        (numbers.setdefault("" if key is None else str(key), len(numbers)) for key in keys),
+        dtype=np.intp,
+        count=len(keys)
+    )
+    names = np.array(list(numbers), dtype=object)
+    order = np.argsort(names.astype(str), kind="stable")
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+
+    return names[order], rank[codes]
+
+class BudgetTable:
+    """
+    Column-oriented budget detail report: one float64 NumPy array per amount column and one object array per label
+    (cost_code, category, ...), so totals and group-bys run vectorised instead of looping over row dicts.
+    """
+
+    def __init__(self, columns, labels) -> None:
+        """
+        Parameters
+        ----------
+        columns : dict
+            amount column name to float64 array - missing amounts are NaN
+        labels : dict
+            label name to object array, all the same length as the columns
+        """
+        if np is None:
+            raise ImportError("Budget tables require numpy: pip install ProPyCore[tables]")
+
+        self.columns = dict(columns)
+        self.labels = dict(labels)
+
+        self._groups = {} # label name -> (sorted keys, group number per row), reused across group-bys
+
+    @classmethod
+    def from_rows(cls, rows, column_names=None):
+        """
+        Builds a table from budget detail rows
+
+        Parameters
+        ----------
+        rows : list of dict
+            rows from BudgetDetails.get()
+        column_names : list of str, default None
+            amount columns, e.g. the names from BudgetColumns.get() - a column whose values are not numeric
+            becomes a label; None treats every numeric field as an amount
+
+        Returns
+        -------
+        table : BudgetTable
+        """
+        if np is None:
+            raise ImportError("Budget tables require numpy: pip install ProPyCore[tables]")
+
+        keys = {} # field names in first-seen order
+        for row in rows:
+            keys.update(dict.fromkeys(row))
+        wanted = set(column_names) if column_names is not None else None
+
+        columns = {}
+        labels = {}
+        for key in keys:
+            values = [row.get(key) for row in rows]
+            if any(isinstance(value, (dict, list)) for value in values):
+                continue
+
+            amounts = None
+            if wanted is not None and key in wanted:
+                amounts = _to_array(values)
+            elif wanted is None and key != "id" and all(
+                value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values
+            ):
+                amounts = _to_array(values)
+
+            if amounts is not None:
+                columns[key] = amounts
+            else:
+                labels[key] = np.array(values, dtype=object)
+
+        return cls(columns, labels)
+
+    def __len__(self):
+        for array in list(self.columns.values()) + list(self.labels.values()):
+            return len(array)
+
+        return 0
+
+    def column(self, name):
+        """
+        Returns
+        -------
+        <values> : numpy.ndarray
+            float64 amounts of the column
+        """
+        return self.columns[name]
+
+    def label(self, name):
+        """
+        Returns
+        -------
+        <values> : numpy.ndarray
+            object array of the label
+        """
+        return self.labels[name]
+
+    def total(self, columns=None):
+        """
+        Sums amount columns, skipping missing amounts
+
+        Parameters
+        ----------
+        columns : list of str, default None
+            columns to sum - None sums all of them
+
+        Returns
+        -------
+        totals : dict
+            column name to total
+        """
+        return {name: float(np.nansum(self.columns[name])) for name in (columns or self.columns)}
+
+    def group_sum(self, by, columns=None):
+        """
+        Sums amount columns per group, skipping missing amounts
+
+        Parameters
+        ----------
+        by : str or array-like
+            label name, e.g. "cost_code", or one key per row, e.g. divisions derived from the cost codes
+        columns : list of str, default None
+            columns to sum - None sums all of them
+
+        Returns
+        -------
+        table : BudgetTable
+            one row per group, sorted by key, with the key as a label named after by ("group" for arrays)
+        """
+        if isinstance(by, str):
+            name = by
+            if by not in self._groups:
+                self._groups[by] = _factorize(self.labels[by])
+            groups, inverse = self._groups[by]
+        else:
+            name = "group"
+            groups, inverse = _factorize(by)
+
+        if len(inverse) != len(self):
+            raise ValueError(f"Got {len(inverse)} group keys for {len(self)} rows")
+
+        sums = {}
+        for column in (columns or self.columns):
+            values = self.columns[column]
+            sums[column] = np.bincount(inverse, weights=np.where(np.isnan(values), 0.0, values), minlength=len(groups))
+
+        return BudgetTable(sums, {name: groups})
+
+    def to_rows(self):
+        """
+        Returns
+        -------
+        rows : list of dict
+            the table back as row dicts, labels first
+        """
+        names = list(self.labels) + list(self.columns)
+        arrays = [self.labels[name] for name in self.labels] + [self.columns[name].tolist() for name in self.columns]
+        return [dict(zip(names, values)) for values in zip(*arrays)]
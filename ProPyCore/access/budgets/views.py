@@ -2,10 +2,42 @@ from ..base import Base
 from ...exceptions import NotFoundItemError
 
 class BudgetViews(Base):
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest/v1.0/budget_views"
 
+    def iter_views(self, company_id, project_id, per_page=100):
+        """
+        Yields the budget views one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of views to request per page
+
+        Yields
+        ------
+        view : dict
+            budget view and its meta data
+        """
+        params = {
+            "project_id": project_id
+        }
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+        for views in self.iter_pages(
+            api_url=f"{self.endpoint}",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from views
+
     def get(self, company_id, project_id, page=1, per_page=100):
         """
         Lists the budget views: https://developers.procore.com/reference/rest/v1/budget-views?version=1.0#list-budget-views
@@ -43,7 +75,7 @@ class BudgetViews(Base):
 
     def find(self, company_id, project_id, identifier):
         """
-        Finds specified budget view by looping through the results from get_views()
+        Finds specified budget view, requesting pages only until it is found
 
         Parameters
         ----------
@@ -67,7 +99,11 @@ class BudgetViews(Base):
             key = "id"
         else:
             key = "name"
-        for view in self.get(company_id=company_id, project_id=project_id):
-            if view[key] == identifier:
-                return view
-        raise NotFoundItemError(f"Could not find view {identifier}")
+        view = self.find_first(
+            self.iter_views(company_id=company_id, project_id=project_id),
+            key=key,
+            identifier=identifier
+        )
+        if view is None:
+            raise NotFoundItemError(f"Could not find view {identifier}")
+        return view
@@ -5,8 +5,8 @@ class ChangeEvent(Base):
     """
     Access and working with change events in a given project
     """
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest/v1.0"
 
     def get_statuses(self, company_id, project_id):
@@ -37,7 +37,45 @@ class ChangeEvent(Base):
             params=params
         )
 
-    def get(self, company_id, project_id, page=1, per_page=100):
+    def iter_events(self, company_id, project_id, per_page=100, filters=None):
+        """
+        Yields the available change events one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of change events to request per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
+
+        Yields
+        ------
+        event : dict
+            change event data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+        params = {
+            "project_id": project_id
+        }
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
+
+        for event_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/change_events",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from event_selection
+
+    def get(self, company_id, project_id, page=1, per_page=100, filters=None):
         """
         Gets all the available change events
 
@@ -51,40 +89,15 @@ class ChangeEvent(Base):
             page number
         per_page : int, default 100
             number of companies to include
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
 
         Returns
         -------
         change_events : dict
             available change events data
         """
-        headers = {
-            "Procore-Company-Id": f"{company_id}"
-        }
-        n_events = 1
-        page = 1
-        events = []
-        while n_events > 0:
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "project_id": project_id
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            event_selection = self.get_request(
-                api_url=f"{self.endpoint}/change_events",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_events = len(event_selection)
-            events += event_selection
-            page += 1 
-
-        return events
+        return list(self.iter_events(company_id=company_id, project_id=project_id, per_page=per_page, filters=filters))
 
     def show(self, company_id, project_id, event_id):
         """
@@ -6,8 +6,8 @@ class Companies(Base):
     Access and working with Companies with App access
     """
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/companies"
 
@@ -6,14 +6,14 @@ class CostCodes(Base):
     Access and working with cost codes from
     """
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/cost_codes"
 
-    def get(self, company_id, project_id, per_page=100):
+    def iter_codes(self, company_id, project_id, per_page=100):
         """
-        Gets a list of all the cost codes from a certain project
+        Yields the cost codes from a certain project one at a time, requesting them a page at a time
 
         Parameters
         ----------
@@ -22,39 +22,48 @@ class CostCodes(Base):
         project_id : int
             unique identifier for the project
         per_page : int, default 100
-            number of companies to include
+            number of cost codes to request per page
 
-        Returns
-        -------
-        codes : list of dict
-            list where each value is a dict with the codes's id and data
+        Yields
+        ------
+        code : dict
+            cost code data
         """
         additional_headers = {
             "company_id": f"{company_id}"
         }
 
-        codes = []
-        n_codes = 1
-        page = 1
-        while n_codes > 0:
-            params = {
-                "project_id": project_id,
-                "page": page,
-                "per_page": per_page
-            }
-            
-            codes_per_page = self.get_request(
-                additional_headers=additional_headers,
-                api_url=self.endpoint,
-                params=params
-            )
-            n_codes = len(codes_per_page)
+        params = {
+            "project_id": project_id
+        }
 
-            codes += codes_per_page
+        for codes_per_page in self.iter_pages(
+            api_url=self.endpoint,
+            additional_headers=additional_headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from codes_per_page
+
+    def get(self, company_id, project_id, per_page=100):
+        """
+        Gets a list of all the cost codes from a certain project
 
-            page += 1
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of companies to include
 
-        return codes
+        Returns
+        -------
+        codes : list of dict
+            list where each value is a dict with the codes's id and data
+        """
+        return list(self.iter_codes(company_id=company_id, project_id=project_id, per_page=per_page))
 
     def show(self, company_id, project_id, cost_code_id):
         """
@@ -113,20 +122,27 @@ class CostCodes(Base):
             cost code data
         """
         if isinstance(identifier, int):
-            key = "id"
-        else:
-            key = "name"
-
-        for cost_code in self.get(company_id=company_id, project_id=project_id):
-            if cost_code[key] == identifier:
-                cost_code_info = self.show(
-                    company_id=company_id,
-                    project_id=project_id,
-                    cost_code_id=cost_code["id"]
-                )
-                return cost_code_info
-
-        raise NotFoundItemError(f"Could not find Cost Code {identifier}")
+            # the id is all show needs, so skip the listing - show raises NotFoundItemError itself
+            return self.show(
+                company_id=company_id,
+                project_id=project_id,
+                cost_code_id=identifier
+            )
+
+        cost_code = self.find_first(
+            self.iter_codes(company_id=company_id, project_id=project_id),
+            key="name",
+            identifier=identifier
+        )
+        if cost_code is None:
+            raise NotFoundItemError(f"Could not find Cost Code {identifier}")
+
+        cost_code_info = self.show(
+            company_id=company_id,
+            project_id=project_id,
+            cost_code_id=cost_code["id"]
+        )
+        return cost_code_info
 
     def create(self, company_id, project_id, name, code, position=1):
         """
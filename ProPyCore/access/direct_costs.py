@@ -1,19 +1,51 @@
 import json
 import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 
 from .base import Base
-from ..exceptions import NotFoundItemError, raise_exception
+from ..exceptions import NotFoundItemError, NotFoundClientError, ProcoreException, raise_exception
 
 class DirectCosts(Base):
     """
     Access and working with Direct Costs with App access
     """
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.1/projects"
 
+    def iter_direct_costs(self, company_id, project_id, per_page=100):
+        """
+        Yields the available Direct Costs one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of direct costs to request per page
+
+        Yields
+        ------
+        direct_cost : dict
+            direct cost data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        for direct_costs in self.iter_pages(
+            api_url=f"{self.endpoint}/{project_id}/direct_costs",
+            additional_headers=headers,
+            per_page=per_page
+        ):
+            yield from direct_costs
+
     def get(self, company_id, project_id, page=1, per_page=100):
         """
         Gets all the available Direct Costs
@@ -100,31 +132,38 @@ class DirectCosts(Base):
             Direct Cost data
         """
         if isinstance(identifier, int):
-            key = "id"
-        else:
-            key = "invoice_number"
-
-        for direct_cost in self.get(company_id=company_id, project_id=project_id):
+            # the id is all show needs, so skip the listing
             try:
-                dc_identifier = direct_cost[key]
-            except KeyError:
-                # raise_exception(f"Direct Cost does not have {key} parameter")
-                continue
-            
-            if dc_identifier == identifier:
-                direct_cost_info = self.show(
+                return self.show(
                     company_id=company_id,
                     project_id=project_id,
-                    direct_cost_id=direct_cost["id"]
+                    direct_cost_id=identifier
                 )
-                return direct_cost_info
+            except NotFoundClientError:
+                raise NotFoundItemError(f"Could not find Direct Cost {identifier}")
+
+        # direct costs without an invoice number are skipped
+        direct_cost = self.find_first(
+            self.iter_direct_costs(company_id=company_id, project_id=project_id),
+            key="invoice_number",
+            identifier=identifier
+        )
+        if direct_cost is None:
+            raise NotFoundItemError(f"Could not find Direct Cost {identifier}")
 
-        raise NotFoundItemError(f"Could not find Direct Cost {identifier}")
+        direct_cost_info = self.show(
+            company_id=company_id,
+            project_id=project_id,
+            direct_cost_id=direct_cost["id"]
+        )
+        return direct_cost_info
     
     def create(self, company_id, project_id, direct_cost_data, line_items, attachments=[]):
         """
         Creates a new Direct Cost item in the specified Project.
 
+        The header and line items go in one JSON request; attachments, if any, follow in one streamed upload.
+
         Parameters
         ----------
         company_id : int
@@ -142,51 +181,43 @@ class DirectCosts(Base):
         -------
         response : dict
             response from the API containing the created Direct Cost item
+
+        Raises
+        ------
+        ProcoreException or OSError
+            when the attachments could not be uploaded - the Direct Cost was still created and its response is
+            the error's direct_cost attribute
         """
         headers = {
             "Procore-Company-Id": f"{company_id}",
             "Accept": "application/json",
         }
 
-        # Prepare direct cost payload without line items as form data
         payload = {
-            f'direct_cost[{key}]': str(value)
-            for key, value in direct_cost_data.items()
+            "direct_cost": dict(direct_cost_data, line_items=line_items) if line_items else dict(direct_cost_data)
         }
 
-        # Prepare attachments as form data
-        files = []
-        for attachment in attachments:
-            mime_type, _ = mimetypes.guess_type(attachment)
-            if mime_type is None:
-                mime_type = 'application/octet-stream'
-            files.append(('attachments[]', (attachment, open(attachment, 'rb'), mime_type)))
-
-        # Make the request
         response = self.post_request(
             api_url=f"{self.endpoint}/{project_id}/direct_costs",
             additional_headers=headers,
-            data=payload,
-            files=files
+            data=payload
         )
 
-        # Close the file objects
-        for file_tuple in files:
-            file_tuple[1][1].close()
-
-        # Handle line items sequentially by patching because we can't use form data
-        if len(line_items) > 0:
-            direct_cost_id = response.get('id')
-
-            if direct_cost_id:
-                # Use the update method to add line items to the previously created Direct Cost item
-                self.update(company_id, project_id, direct_cost_id, line_items=line_items)
+        if attachments:
+            try:
+                response = self.add_attachment(company_id, project_id, response["id"], attachments)
+            except (ProcoreException, OSError) as e:
+                # the direct cost exists - let the caller find it instead of creating it again
+                e.direct_cost = response
+                raise
 
         return response
     
     def update(self, company_id, project_id, direct_cost_id, direct_cost_data={}, line_items=[], attachments=[]):
         """
-        Creates a new Direct Cost item in the specified Project.
+        Updates a Direct Cost item in the specified Project.
+
+        Changed fields and line items go in one JSON request; attachments, if any, follow in one streamed upload.
 
         Parameters
         ----------
@@ -197,7 +228,7 @@ class DirectCosts(Base):
         direct_cost_id : int
             unique identifier for the direct cost
         direct_cost_data : dict, default {}
-            the data for the new Direct Cost item
+            the fields to change
         line_items : list, default []
             the list of line items associated with the direct cost
         attachments : list, default []
@@ -206,59 +237,37 @@ class DirectCosts(Base):
         Returns
         -------
         response : dict
-            response from the API containing the created Direct Cost item
+            response from the API containing the updated Direct Cost item - the current item when there is
+            nothing to change
         """
         headers = {
             "Procore-Company-Id": f"{company_id}",
             "Accept": "application/json",
         }
 
-        # Prepare payload
-        if direct_cost_data:
+        response = None
+        if not (direct_cost_data or line_items or attachments):
+            # nothing to change
+            return self.show(company_id, project_id, direct_cost_id)
+
+        if direct_cost_data or line_items:
             payload = {
-                f'direct_cost[{key}]': str(value)
-                for key, value in direct_cost_data.items()
+                "direct_cost": dict(direct_cost_data, line_items=line_items) if line_items else dict(direct_cost_data)
             }
-        else:
-            payload = {}
-
-        # Prepare attachments
-        files = []
-        for attachment in attachments:
-            mime_type, _ = mimetypes.guess_type(attachment)
-            if mime_type is None:
-                mime_type = 'application/octet-stream'
-            files.append(('attachments[]', (attachment, open(attachment, 'rb'), mime_type)))
-
-        # Make the request
-        response = self.patch_request(
-            api_url=f"{self.endpoint}/{project_id}/direct_costs/{direct_cost_id}",
-            additional_headers=headers,
-            data=payload,
-            files=files
-        )
+            response = self.patch_request(
+                api_url=f"{self.endpoint}/{project_id}/direct_costs/{direct_cost_id}",
+                additional_headers=headers,
+                data=payload,
+            )
 
-        # Close the file objects
-        for file_tuple in files:
-            file_tuple[1][1].close()
-
-        # Handle line items separately to avoid form data
-        payload = {
-            'direct_cost': {
-                'line_items': line_items
-            }
-        }
-        _ = self.patch_request(
-            api_url=f"{self.endpoint}/{project_id}/direct_costs/{direct_cost_id}",
-            additional_headers=headers,
-            data=payload,
-        )
+        if attachments:
+            response = self.add_attachment(company_id, project_id, direct_cost_id, attachments)
 
         return response
     
     def add_attachment(self, company_id, project_id, direct_cost_id, attachments):
         """
-        Creates a new Direct Cost item in the specified Project.
+        Adds attachments to a Direct Cost item, streaming all of them in one request.
 
         Parameters
         ----------
@@ -268,37 +277,99 @@ class DirectCosts(Base):
             unique identifier for the project
         direct_cost_id : int
             unique identifier for the direct cost
-        attachments : list, default []
+        attachments : list
             list of attachment file paths
 
         Returns
         -------
         response : dict
-            response from the API containing the created Direct Cost item
+            response from the API containing the updated Direct Cost item
         """
         headers = {
             "Procore-Company-Id": f"{company_id}",
             "Accept": "application/json",
         }
 
-        # Prepare attachments
-        files = []
-        for attachment in attachments:
-            mime_type, _ = mimetypes.guess_type(attachment)
-            if mime_type is None:
-                mime_type = 'application/octet-stream'
-            files.append(('attachments[]', (attachment, open(attachment, 'rb'), mime_type)))
+        # opened only for the upload and closed even if it fails
+        with ExitStack() as stack:
+            files = []
+            for attachment in attachments:
+                mime_type, _ = mimetypes.guess_type(attachment)
+                if mime_type is None:
+                    mime_type = 'application/octet-stream'
+                handle = stack.enter_context(open(attachment, 'rb'))
+                files.append(('attachments[]', (os.path.basename(attachment), handle, mime_type)))
+
+            response = self.patch_request(
+                api_url=f"{self.endpoint}/{project_id}/direct_costs/{direct_cost_id}",
+                additional_headers=headers,
+                data={},
+                files=files
+            )
 
-        # Make the request
-        response = self.patch_request(
-            api_url=f"{self.endpoint}/{project_id}/direct_costs/{direct_cost_id}",
-            additional_headers=headers,
-            data={},
-            files=files
-        )
+        return response
+
+    def create_many(self, company_id, project_id, direct_costs, max_workers=4):
+        """
+        Creates many Direct Cost items, e.g. a batch invoice import
+
+        Every item is checked before anything is sent (line items must be a list and attachments must exist);
+        the valid ones are then created on a bounded thread pool under the session's rate limit, each with
+        one JSON request plus one streamed upload when it has attachments.
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        direct_costs : list of dict
+            items with direct_cost_data (dict), and optionally line_items (list) and attachments (list of file paths)
+        max_workers : int, default 4
+            number of Direct Costs created at once
+
+        Returns
+        -------
+        report : list of dict
+            one per item, in order, with index, ok (boolean), partial (boolean), direct_cost (response or None),
+            and error (message or None) - partial items were created but their attachments failed, so a rerun
+            should add the attachments to direct_cost["id"] instead of creating them again
+        """
+        report = [
+            {"index": index, "ok": False, "partial": False, "direct_cost": None, "error": None}
+            for index in range(len(direct_costs))
+        ]
+
+        valid = []
+        for index, item in enumerate(direct_costs):
+            missing = [attachment for attachment in item.get("attachments", []) if not os.path.isfile(attachment)]
+            if not isinstance(item.get("direct_cost_data"), dict):
+                report[index]["error"] = "Item must have a 'direct_cost_data' dict."
+            elif not isinstance(item.get("line_items", []), list):
+                report[index]["error"] = "'line_items' must be a list."
+            elif missing:
+                report[index]["error"] = f"Attachment not found: {', '.join(missing)}"
+            else:
+                valid.append(index)
+
+        def create(index):
+            item = direct_costs[index]
+            try:
+                report[index]["direct_cost"] = self.create(
+                    company_id,
+                    project_id,
+                    item["direct_cost_data"],
+                    item.get("line_items", []),
+                    attachments=item.get("attachments", [])
+                )
+                report[index]["ok"] = True
+            except (ProcoreException, OSError) as e:
+                report[index]["error"] = str(e)
+                created = getattr(e, "direct_cost", None)
+                if created is not None:
+                    report[index].update(partial=True, direct_cost=created)
 
-        # Close the file objects
-        for file_tuple in files:
-            file_tuple[1][1].close()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(create, valid))
 
-        return response
\ No newline at end of file
+        return report
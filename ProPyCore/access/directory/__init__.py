@@ -5,9 +5,9 @@ from .roles import Roles
 from .people import People
 
 class Directory:
-    def __init__(self, access_token, server_url):
-        self.trades = Trades(access_token, server_url)
-        self.users = Users(access_token, server_url)
-        self.vendors = Vendors(access_token, server_url)
-        self.roles = Roles(access_token, server_url)
-        self.people = People(access_token, server_url)
\ No newline at end of file
+    def __init__(self, access_token, server_url, session=None):
+        self.trades = Trades(access_token, server_url, session=session)
+        self.users = Users(access_token, server_url, session=session)
+        self.vendors = Vendors(access_token, server_url, session=session)
+        self.roles = Roles(access_token, server_url, session=session)
+        self.people = People(access_token, server_url, session=session)
\ No newline at end of file
@@ -4,8 +4,8 @@ from ...exceptions import NotFoundItemError
 class People(Base):
     """Access user information on a Company and Project Level"""
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
     def get_url(self, company_id, project_id=None):
         """
@@ -29,6 +29,52 @@ class People(Base):
         else:
             return f"/rest/v1.0/projects/{project_id}/people"
 
+    def iter_people(self, company_id, project_id=None, per_page=1000, filters=None):
+        """
+        Yields the people from the company or project level one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int, default None
+            unique identifier for the project
+            None specifies company-level
+        per_page : int, default 1000
+            number of people to request per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"search": value} is sent as filters[search]=value
+
+        Yields
+        ------
+        person : dict
+            person's information
+        """
+        params = {
+            "company_id": company_id # this parameter is only used in Company Vendors, but including it for other requests does not seem to create any issues
+        }
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        url = self.get_url(
+            company_id=company_id,
+            project_id=project_id
+        )
+
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
+
+        for people_per_page in self.iter_pages(
+            api_url=url,
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from people_per_page
+
     def get(self, company_id, project_id=None, per_page=1000):
         """
         Gets a list of all people from the company or project level
@@ -48,36 +94,7 @@ class People(Base):
         people : list of dict
             list where each value is a dict with a person's information
         """
-        people = []
-        n_people = 1
-        page = 1
-        while n_people > 0:
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "company_id": company_id # this parameter is only used in Company Vendors, but including it for other requests does not seem to create any issues
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            url = self.get_url(
-                company_id=company_id,
-                project_id=project_id
-            )
-
-            people_per_page = self.get_request(
-                api_url=url,
-                additional_headers=headers,
-                params=params
-            )
-            n_people = len(people_per_page)
-
-            people += people_per_page
-            page += 1
-
-        return people
+        return list(self.iter_people(company_id=company_id, project_id=project_id, per_page=per_page))
     
     def find(self, company_id, person_id, project_id=None,):
         """
@@ -101,18 +118,23 @@ class People(Base):
             person-specific dictionary
         """
         if isinstance(person_id, int):
-            key = "id"
+            person = self.find_first(
+                self.iter_people(company_id=company_id, project_id=project_id),
+                key="id",
+                identifier=person_id
+            )
         elif isinstance(person_id, str) and "@" in person_id:
-            key = "contact"
-            subkey = "email"
+            # narrow the listing with the server-side search, then confirm the exact email
+            person = self.find_first(
+                self.iter_people(company_id=company_id, project_id=project_id, filters={"search": person_id}),
+                key=lambda person: (person.get("contact") or {}).get("email"),
+                identifier=person_id,
+                fallback=lambda: self.iter_people(company_id=company_id, project_id=project_id)
+            )
         else:
             raise TypeError(f"Invalid person_id type or format: {person_id}. Must be an integer ID or email string.")
 
-        for person in self.get(company_id=company_id, project_id=project_id):
-            if key == "contact":
-                if person.get(key, {}).get(subkey) == person_id:
-                    return person
-            elif person[key] == person_id:
-                return person
+        if person is None:
+            raise NotFoundItemError(f"Could not find Person {person_id}")
 
-        raise NotFoundItemError(f"Could not find Person {person_id}")
+        return person
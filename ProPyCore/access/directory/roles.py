@@ -4,8 +4,8 @@ from ...exceptions import NotFoundItemError
 class Roles(Base):
     """Access role information on a Company and Project Level"""
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0"
 
@@ -35,6 +35,40 @@ class Roles(Base):
 
         return roles
     
+    def iter_roles(self, company_id, project_id, per_page=100):
+        """
+        Yields the roles on a project one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of roles to request per page
+
+        Yields
+        ------
+        role : dict
+            role data
+        """
+        params = {
+            "project_id": project_id
+        }
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        for roles_per_page in self.iter_pages(
+            api_url=f"{self.endpoint}/project_roles",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from roles_per_page
+
     def get(self, company_id, project_id, page=1, per_page=100):
         """
         Gets all the available roles on a project
@@ -55,31 +89,7 @@ class Roles(Base):
         roles : dict
             available roles data
         """
-        roles = []
-        n_roles = 1
-        page = 1
-        while n_roles > 0:
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "project_id": project_id
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            roles_per_page = self.get_request(
-                api_url=f"{self.endpoint}/project_roles",
-                additional_headers=headers,
-                params=params
-            )
-            n_roles = len(roles_per_page)
-
-            roles += roles_per_page
-            page += 1
-
-        return roles
+        return list(self.iter_roles(company_id=company_id, project_id=project_id, per_page=per_page))
     
     def find(self, company_id, project_id, user_id):
         """
@@ -104,8 +114,12 @@ class Roles(Base):
         else:
             key = "name"
 
-        for person in self.get(company_id=company_id, project_id=project_id):
-            if person[key] == user_id:
-                return person
+        person = self.find_first(
+            self.iter_roles(company_id=company_id, project_id=project_id),
+            key=key,
+            identifier=user_id
+        )
+        if person is None:
+            raise NotFoundItemError(f"Could not find {user_id}")
 
-        raise NotFoundItemError(f"Could not find {user_id}")
\ No newline at end of file
+        return person
\ No newline at end of file
@@ -4,11 +4,43 @@ from ...exceptions import NotFoundItemError
 class Trades(Base):
     """Access vendor information on a Company and Project Level"""
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/companies"
 
+    def iter_trades(self, company_id, per_page=1000):
+        """
+        Yields the trades at the company level one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        per_page : int, default 1000
+            number of trades to request per page
+
+        Yields
+        ------
+        trade : dict
+            trade data
+        """
+        params = {
+            "company_id": company_id
+        }
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        for trades_per_page in self.iter_pages(
+            api_url=f"{self.endpoint}/{company_id}/trades",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from trades_per_page
+
     def get(self, company_id, per_page=1000):
         """
         Gets a list of all the trades the company level
@@ -25,32 +57,7 @@ class Trades(Base):
         users : list of dict
             list where each value is a dict with a user's information
         """
-        trades = []
-        n_trades = 1
-        page = 1
-        while n_trades > 0:
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "company_id": company_id
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            url = f"{self.endpoint}/{company_id}/trades"
-            trades_per_page = self.get_request(
-                api_url=url,
-                additional_headers=headers,
-                params=params
-            )
-            n_trades = len(trades_per_page)
-
-            trades += trades_per_page
-            page += 1
-
-        return trades
+        return list(self.iter_trades(company_id=company_id, per_page=per_page))
 
     def find(self, company_id, user_id):
         """
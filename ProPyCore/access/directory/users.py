@@ -4,8 +4,8 @@ from ...exceptions import NotFoundItemError
 class Users(Base):
     """Access user information on a Company and Project Level"""
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
     def get_url(self, company_id, project_id=None):
         """
@@ -29,6 +29,52 @@ class Users(Base):
         else:
             return f"/rest/v1.0/projects/{project_id}/users"
 
+    def iter_users(self, company_id, project_id=None, per_page=1000, filters=None):
+        """
+        Yields the users from the company or project level one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int, default None
+            unique identifier for the project
+            None specifies company-level
+        per_page : int, default 1000
+            number of users to request per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"search": value} is sent as filters[search]=value
+
+        Yields
+        ------
+        user : dict
+            user's information
+        """
+        params = {
+            "company_id": company_id # this parameter is only used in Company Vendors, but including it for other requests does not seem to create any issues
+        }
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        url = self.get_url(
+            company_id=company_id,
+            project_id=project_id
+        )
+
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
+
+        for users_per_page in self.iter_pages(
+            api_url=url,
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from users_per_page
+
     def get(self, company_id, project_id=None, per_page=1000):
         """
         Gets a list of all the users from the company or project level
@@ -48,36 +94,7 @@ class Users(Base):
         users : list of dict
             list where each value is a dict with a user's information
         """
-        users = []
-        n_users = 1
-        page = 1
-        while n_users > 0:
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "company_id": company_id # this parameter is only used in Company Vendors, but including it for other requests does not seem to create any issues
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            url = self.get_url(
-                company_id=company_id,
-                project_id=project_id
-            )
-
-            users_per_page = self.get_request(
-                api_url=url,
-                additional_headers=headers,
-                params=params
-            )
-            n_users = len(users_per_page)
-
-            users += users_per_page
-            page += 1
-
-        return users
+        return list(self.iter_users(company_id=company_id, project_id=project_id, per_page=per_page))
 
     def show(self, company_id, project_id, user_id):
         """
@@ -141,11 +158,19 @@ class Users(Base):
         else:
             key = "name"
 
-        for user in self.get(company_id=company_id, project_id=project_id):
-            if user[key] == user_id:
-                return user
+        if key == "id":
+            users = self.iter_users(company_id=company_id, project_id=project_id)
+            fallback = None
+        else:
+            # narrow the listing with the server-side search, then confirm the exact match
+            users = self.iter_users(company_id=company_id, project_id=project_id, filters={"search": user_id})
+            fallback = lambda: self.iter_users(company_id=company_id, project_id=project_id)
+
+        user = self.find_first(users, key=key, identifier=user_id, fallback=fallback)
+        if user is None:
+            raise NotFoundItemError(f"Could not find User {user_id}")
 
-        raise NotFoundItemError(f"Could not find User {user_id}")
+        return user
 
     def add(self, company_id, project_id, user_id, permission_template_id=None):
         """
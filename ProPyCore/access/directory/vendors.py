@@ -4,8 +4,8 @@ from ...exceptions import NotFoundItemError
 class Vendors(Base):
     """Access vendor information on a Company and Project Level"""
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
     def get_url(self, project_id=None):
         """
@@ -27,6 +27,45 @@ class Vendors(Base):
         else:
             return f"/rest/v1.1/projects/{project_id}/vendors"
 
+    def iter_vendors(self, company_id, project_id=None, per_page=10000):
+        """
+        Yields the vendors from the company or project level one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int, default None
+            unique identifier for the project
+            None specifies company-level
+        per_page : int, default 10000
+            number of vendors to request per page
+
+        Yields
+        ------
+        vendor : dict
+            vendor's information
+        """
+        params = {
+            "company_id": company_id # this parameter is only used in Company Vendors, but including it for other requests does not seem to create any issues
+        }
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        url = self.get_url(
+            project_id=project_id
+        )
+
+        for vendors_per_page in self.iter_pages(
+            api_url=url,
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from vendors_per_page
+
     def get(self, company_id, project_id=None, per_page=10000):
         """
         Gets a list of all vendors from a certain company
@@ -46,35 +85,7 @@ class Vendors(Base):
         vendors : list of dict
             list where each value is a dict with a vendors's information
         """
-        vendors = []
-        n_vendors = 1
-        page = 1
-        while n_vendors > 0:
-            params = {
-                "page": page,
-                "per_page": per_page,
-                "company_id": company_id # this parameter is only used in Company Vendors, but including it for other requests does not seem to create any issues
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            url = self.get_url(
-                project_id=project_id
-            )
-
-            vendors_per_page = self.get_request(
-                api_url=url,
-                additional_headers=headers,
-                params=params
-            )
-            n_vendors = len(vendors_per_page)
-
-            vendors += vendors_per_page
-            page += 1
-
-        return vendors
+        return list(self.iter_vendors(company_id=company_id, project_id=project_id, per_page=per_page))
 
     def find(self, company_id, user_id, project_id=None,):
         """
@@ -2,6 +2,6 @@ from .files import Files
 from .folders import Folders
 
 class Documents:
-    def __init__(self, access_token, server_url):
-        self.files = Files(access_token, server_url)
-        self.folders = Folders(access_token, server_url)
\ No newline at end of file
+    def __init__(self, access_token, server_url, session=None):
+        self.files = Files(access_token, server_url, session=session)
+        self.folders = Folders(access_token, server_url, session=session)
\ No newline at end of file
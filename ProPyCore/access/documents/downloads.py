@@ -0,0 +1,116 @@
+import hashlib
+import os
+import time
+
+from ...exceptions import IntegrityError, raise_exception
+
+# bytes written to disk at a time
+CHUNK_SIZE = 1024 * 1024
+
+def file_source(doc):
+    """
+    Finds where to download the current version of a file from
+
+    Parameters
+    ----------
+    doc : dict
+        file response body from show()
+
+    Returns
+    -------
+    url : str or None
+        download url of the latest version
+    size : int or None
+        expected size in bytes, None when the response does not say
+    """
+    versions = doc.get("file_versions") or []
+    version = max(versions, key=lambda v: v.get("created_at") or "") if versions else {}
+    prostore_file = version.get("prostore_file") or {}
+
+    url = version.get("url") or prostore_file.get("url") or doc.get("url")
+    size = version.get("size") or prostore_file.get("size") or doc.get("size")
+
+    return url, int(size) if size is not None else None
+
+def sha256_of(path, chunk_size=CHUNK_SIZE):
+    """
+    Hex sha256 of a local file, read a chunk at a time
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+def download_file(endpoint, url, path, size=None, sha256=None, chunk_size=CHUNK_SIZE, force=False):
+    """
+    Streams a url to disk, resuming a partial download with a Range request
+
+    Data goes to <path>.part first and is moved into place only once the size (and sha256, if given) match,
+    so an interrupted run never leaves a truncated file at path.
+
+    Parameters
+    ----------
+    endpoint : Base
+        endpoint to send the request through
+    url : str
+        download url
+    path : str
+        local destination - parent directories are created
+    size : int, default None
+        expected size in bytes - a local file of this size (and sha256) is not downloaded again
+    sha256 : str, default None
+        expected hex sha256
+    chunk_size : int, default CHUNK_SIZE
+        bytes held in memory at a time
+    force : boolean, default False
+        True - always download from scratch, e.g. when the remote file is known to have changed; a matching
+        local file is not skipped and a partial download is not resumed
+
+    Returns
+    -------
+    result : dict
+        path, bytes (downloaded in this call), skipped, resumed, and seconds
+    """
+    start = time.perf_counter()
+    result = {"path": path, "bytes": 0, "skipped": False, "resumed": False}
+
+    if not force and size is not None and os.path.isfile(path) and os.path.getsize(path) == size:
+        if sha256 is None or sha256_of(path) == sha256:
+            result.update(skipped=True, seconds=time.perf_counter() - start)
+            return result
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    partial = f"{path}.part"
+    offset = os.path.getsize(partial) if os.path.isfile(partial) and not force else 0
+    if size is not None and offset > size:
+        offset = 0
+
+    headers = {"Range": f"bytes={offset}-"} if offset > 0 else {}
+    response = endpoint.external_request("GET", url, headers=headers, stream=True)
+    try:
+        if response.status_code == 416 and offset > 0:
+            pass # nothing left past the offset - the partial file is complete
+        elif not response.ok:
+            raise_exception(response)
+        else:
+            if response.status_code != 206:
+                offset = 0 # Range ignored - start over
+
+            result["resumed"] = offset > 0
+            with open(partial, "ab" if offset > 0 else "wb") as handle:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    handle.write(chunk)
+                    result["bytes"] += len(chunk)
+    finally:
+        response.close()
+
+    actual = os.path.getsize(partial)
+    if (size is not None and actual != size) or (sha256 is not None and sha256_of(partial) != sha256):
+        os.remove(partial)
+        raise IntegrityError(f"Downloaded {path} does not match the expected size or sha256 ({actual} of {size} bytes)")
+
+    os.replace(partial, path)
+    result["seconds"] = time.perf_counter() - start
+    return result
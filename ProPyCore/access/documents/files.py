@@ -1,7 +1,13 @@
 from ..base import Base
 from ...exceptions import NotFoundItemError, ProcoreException, WrongParamsError
+from .downloads import CHUNK_SIZE, download_file, file_source
+from .search import SearchIndex
+from .tree import PathIndex, iter_listing, shared_path_indexes
+from .uploads import DEFAULT_PART_SIZE, upload_segmented
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from warnings import warn
-from fuzzywuzzy import fuzz
+import os
+import time
 
 
 class Files(Base):
@@ -9,9 +15,11 @@ class Files(Base):
     Access to and working with Procore files.
     """
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest/v1.0/files"
+        self._path_indexes = shared_path_indexes(session)  # project_id -> PathIndex, shared with Folders
+        self._search_indexes = {}  # (project_id, folder_id) -> SearchIndex
 
     def create(self, company_id, project_id, filepath, folder_id=None, description=None):
         """
@@ -35,6 +43,11 @@ class Files(Base):
         -------
         doc_info : dict
             Request body.
+
+        Notes
+        -----
+        The file is streamed from disk rather than read into memory. For large files, upload() sends it
+        in segments that can be resumed.
         """
         params = {"project_id": project_id}
 
@@ -51,18 +64,92 @@ class Files(Base):
         if folder_id is not None:
             data["file[parent_id]"] = int(folder_id)
 
-        file = [("file[data]", open(filepath, "rb"))]
+        # streamed from disk, closed once the request is done
+        with open(filepath, "rb") as handle:
+            file = [("file[data]", handle)]
+
+            try:
+                doc_info = self.post_request(
+                    api_url=self.endpoint,
+                    additional_headers=headers,
+                    params=params,
+                    data=data,
+                    files=file,
+                )
+            except ProcoreException as e:
+                print(e)
 
-        try:
-            doc_info = self.post_request(
-                api_url=self.endpoint,
-                additional_headers=headers,
-                params=params,
-                data=data,
-                files=file,
-            )
-        except ProcoreException as e:
-            print(e)
+        if project_id in self._path_indexes and "id" in doc_info:
+            self._path_indexes[project_id].update([dict(doc_info, document_type="file")])
+
+        return doc_info
+
+    def upload(self, company_id, project_id, filepath, folder_id=None, description=None, part_size=DEFAULT_PART_SIZE, max_workers=4, state_path=None):
+        """
+        Creates a file from a large upload, sending it in segments through Procore's /uploads flow.
+
+        Segments are uploaded in parallel straight to storage. If state_path is given, progress is recorded
+        there and calling upload() again with the same file and state_path resumes the unfinished segments.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        filepath : str
+            Path to the file to upload.
+        folder_id : int or str, default None
+            The ID of the parent folder to place this file.
+            If not included, the file will be placed at the root.
+        description : str, default None
+            Optional description to include on the file.
+        part_size : int, default 8 MB
+            Bytes per segment; at most max_workers segments are held in memory.
+        max_workers : int, default 4
+            Number of segments uploaded at once.
+        state_path : str, default None
+            JSON file to record progress in for resuming.
+
+        Returns
+        -------
+        doc_info : dict
+            Request body.
+        """
+        upload_uuid = upload_segmented(
+            self,
+            company_id=company_id,
+            project_id=project_id,
+            filepath=filepath,
+            part_size=part_size,
+            max_workers=max_workers,
+            state_path=state_path,
+        )
+
+        params = {"project_id": project_id}
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}",
+        }
+
+        data = {
+            "name": os.path.basename(filepath),
+            "upload_uuid": upload_uuid,
+        }
+        if description is not None:
+            data["description"] = description
+        if folder_id is not None:
+            data["parent_id"] = int(folder_id)
+
+        doc_info = self.post_request(
+            api_url=self.endpoint,
+            additional_headers=headers,
+            params=params,
+            data={"file": data},
+        )
+
+        if project_id in self._path_indexes and "id" in doc_info:
+            self._path_indexes[project_id].update([dict(doc_info, document_type="file")])
 
         return doc_info
 
@@ -104,15 +191,16 @@ class Files(Base):
                 data[key] = val
 
         if filepath is not None:
-            file = [("file[data]", open(filepath, "rb"))]
-
-            doc_info = self.patch_request(
-                api_url=f"{self.endpoint}/{doc_id}",
-                additional_headers=headers,
-                params=params,
-                data=data,
-                files=file,
-            )
+            with open(filepath, "rb") as handle:
+                file = [("file[data]", handle)]
+
+                doc_info = self.patch_request(
+                    api_url=f"{self.endpoint}/{doc_id}",
+                    additional_headers=headers,
+                    params=params,
+                    data=data,
+                    files=file,
+                )
         else:
             doc_info = self.patch_request(
                 api_url=f"{self.endpoint}/{doc_id}",
@@ -122,6 +210,10 @@ class Files(Base):
                 files=True,
             )
 
+        # renames and moves change the path
+        if project_id in self._path_indexes and "id" in doc_info:
+            self._path_indexes[project_id].update([dict(doc_info, document_type="file")])
+
         return doc_info
 
     def find(self, company_id, project_id, identifier, folder_id=None):
@@ -193,6 +285,97 @@ class Files(Base):
 
         return doc_info
 
+    def download(self, company_id, project_id, doc_id, path, sha256=None, chunk_size=CHUNK_SIZE, force=False):
+        """
+        Downloads the current version of a file, streaming it to disk.
+
+        A partial download left by an earlier attempt is resumed with a Range request, and a local file that
+        already has the expected size (and sha256, if given) is skipped.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        doc_id : int
+            Unique identifier for the file.
+        path : str
+            Local destination; parent directories are created.
+        sha256 : str, default None
+            Expected hex sha256, checked before skipping and after downloading.
+        chunk_size : int, default 1 MB
+            Bytes held in memory at a time.
+        force : boolean, default False
+            True downloads from scratch even when the local file looks current, e.g. after a remote edit that kept the size.
+
+        Returns
+        -------
+        result : dict
+            doc_id, path, bytes downloaded, skipped, resumed, and seconds.
+        """
+        doc_info = self.show(company_id=company_id, project_id=project_id, doc_id=doc_id)
+
+        url, size = file_source(doc_info)
+        if url is None:
+            raise NotFoundItemError(f"File {doc_id} has no downloadable version")
+
+        result = download_file(self, url, path, size=size, sha256=sha256, chunk_size=chunk_size, force=force)
+        result["doc_id"] = doc_id
+
+        return result
+
+    def download_many(self, company_id, project_id, downloads, max_workers=4, chunk_size=CHUNK_SIZE):
+        """
+        Downloads many files at once on a bounded thread pool, e.g. to mirror a project overnight.
+
+        A failed file does not stop the others; its result carries the exception under "error" and a rerun
+        resumes it.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        downloads : dict
+            File ID to local path, or to a (path, sha256) tuple.
+        max_workers : int, default 4
+            Number of files downloaded at once.
+        chunk_size : int, default 1 MB
+            Bytes held in memory at a time per file.
+
+        Returns
+        -------
+        summary : dict
+            files (list of download() results), bytes, seconds, throughput (bytes per second),
+            skipped, and failed.
+        """
+        start = time.perf_counter()
+
+        def fetch(doc_id, target):
+            path, sha256 = target if isinstance(target, tuple) else (target, None)
+            try:
+                return self.download(company_id, project_id, doc_id, path, sha256=sha256, chunk_size=chunk_size)
+            except (ProcoreException, OSError) as e:
+                return {"doc_id": doc_id, "path": path, "bytes": 0, "skipped": False, "resumed": False, "error": e}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, doc_id, target) for doc_id, target in downloads.items()]
+            results = [future.result() for future in as_completed(futures)]
+
+        seconds = time.perf_counter() - start
+        n_bytes = sum(result["bytes"] for result in results)
+
+        return {
+            "files": results,
+            "bytes": n_bytes,
+            "seconds": seconds,
+            "throughput": n_bytes / seconds if seconds > 0 else 0.0,
+            "skipped": sum(result["skipped"] for result in results),
+            "failed": sum("error" in result for result in results),
+        }
+
     def remove(self, company_id, project_id, doc_id):
         """
         Deletes the given document.
@@ -223,8 +406,61 @@ class Files(Base):
             params=params,
         )
 
+        if project_id in self._path_indexes:
+            self._path_indexes[project_id].remove(doc_id)
+
         return doc_info
 
+    def iter_docs(self, company_id, project_id, folder_id=None, view="normal", file_types=None):
+        """
+        Yields the documents in a project one at a time, requesting them a page at a time.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        folder_id : int, default None
+            ID of parent folder.
+        view : str, default "normal"
+            View to use for the request: "normal" or "extended"
+        file_types : list of str, default None
+            List of file type extensions to filter by.
+
+        Yields
+        ------
+        doc : dict
+            Document response body.
+        """
+        doc_type = self.endpoint.split("/")[-1][:-1]
+
+        params = {
+            "view": view,
+            "sort": "name",
+            "filters[document_type]": doc_type,
+            "filters[is_in_recycle_bin]": False,
+            "filters[private]": False,
+        }
+        if folder_id is not None:
+            params["filters[folder_id]"] = folder_id
+        if file_types is not None:
+            params["filters[file_type]"] = file_types
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}",
+        }
+
+        for doc_info in self.iter_pages(
+            api_url=f"/rest/v1.0/projects/{project_id}/documents",
+            additional_headers=headers,
+            params=params,
+            per_page=10000,
+        ):
+            for doc in doc_info:
+                if doc["is_deleted"] is False:
+                    yield doc
+
     def get(self, company_id, project_id, folder_id=None, view="normal", file_types=None):
         """
         Gets all documents in a project.
@@ -249,41 +485,13 @@ class Files(Base):
         """
         doc_type = self.endpoint.split("/")[-1][:-1]
 
-        n_docs = 1
-        page = 1
-        docs = []
-        while n_docs > 0:
-            params = {
-                "view": view,
-                "sort": "name",
-                "page": page,
-                "per_page": 10000,
-                "filters[document_type]": doc_type,
-                "filters[is_in_recycle_bin]": False,
-                "filters[private]": False,
-            }
-            if folder_id is not None:
-                params["filters[folder_id]"] = folder_id
-            if file_types is not None:
-                params["filters[file_type]"] = file_types
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}",
-            }
-
-            doc_info = self.get_request(
-                api_url=f"/rest/v1.0/projects/{project_id}/documents",
-                additional_headers=headers,
-                params=params,
-            )
-
-            n_docs = len(doc_info)
-
-            for doc in doc_info:
-                if doc["is_deleted"] is False:
-                    docs.append(doc)
-
-            page += 1
+        docs = list(self.iter_docs(
+            company_id=company_id,
+            project_id=project_id,
+            folder_id=folder_id,
+            view=view,
+            file_types=file_types,
+        ))
 
         if len(docs) > 0:
             return docs
@@ -325,23 +533,100 @@ class Files(Base):
 
         doc_type = self.endpoint.split("/")[-1][:-1]
 
-        score = 0
-        n_perfect = 0
-        result = {}
-        for doc in docs:
-            if not doc["is_deleted"] and not doc["is_recycle_bin"] and doc["document_type"] == doc_type:
-                temp_score = fuzz.partial_ratio(value, doc["name"])
-                if temp_score == 100:
-                    n_perfect += 1
-                if temp_score >= score:
-                    score = temp_score
-                    result = doc
-
-        if n_perfect > 1:
-            warn("Multiple 100% matches - try refining your search criteria for better results")
+        index = SearchIndex(
+            doc for doc in docs
+            if not doc["is_deleted"] and not doc["is_recycle_bin"] and doc["document_type"] == doc_type
+        )
+        matches = index.search(value, limit=None)
 
-        if score == 0:
+        if len(matches) == 0:
             raise NotFoundItemError(f"Could not find document {value}")
-        else:
-            result["search_criteria"] = {"value": value, "match": score}
-            return result
\ No newline at end of file
+
+        score = matches[0][1]
+        top = [doc for doc, doc_score in matches if doc_score == score]
+        result = top[-1]
+
+        if score == 100 and len(top) > 1:
+            warn("Multiple 100% matches - try refining your search criteria for better results")
+
+        result["search_criteria"] = {"value": value, "match": round(score)}
+        return result
+
+    def path_index(self, company_id, project_id, refresh=False):
+        """
+        Gets the path index of a project, building it from the documents listing on first use.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        refresh : boolean, default False
+            True - rebuild the index from a fresh listing.
+
+        Returns
+        -------
+        index : PathIndex
+            Full path <-> id lookups for every folder and file in the project.
+        """
+        if refresh or project_id not in self._path_indexes:
+            self._path_indexes[project_id] = PathIndex(iter_listing(self, company_id=company_id, project_id=project_id))
+
+        return self._path_indexes[project_id]
+
+    def find_by_path(self, company_id, project_id, path):
+        """
+        Finds a file from its full path, e.g. "Drawings/Arch/Rev3/A-101.pdf".
+
+        The index is rebuilt once if the path is not in it, in case the file was added elsewhere.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        path : str
+            Folder names and file name separated by "/".
+
+        Returns
+        -------
+        doc_info : dict
+            File listing information.
+        """
+        for refresh in (False, True):
+            doc = self.path_index(company_id, project_id, refresh=refresh).doc_for(path)
+            if doc is not None and doc.get("document_type", "file") == "file":
+                return doc
+
+        raise NotFoundItemError(f"Could not find file {path}")
+
+    def search_index(self, company_id, project_id, folder_id=None, refresh=False):
+        """
+        Gets a reusable fuzzy search index over the files, building it from one listing on first use.
+
+        Parameters
+        ----------
+        company_id : int
+            Unique identifier for the company.
+        project_id : int
+            Unique identifier for the project.
+        folder_id : int, default None
+            Only index files in this folder - None indexes every file in the project.
+        refresh : boolean, default False
+            True - rebuild the index from a fresh listing.
+
+        Returns
+        -------
+        index : SearchIndex
+            Call index.search(value, limit=k) for the top k (file, score) matches.
+        """
+        key = (project_id, folder_id)
+        if refresh or key not in self._search_indexes:
+            self._search_indexes[key] = SearchIndex(
+                doc for doc in self.iter_docs(company_id=company_id, project_id=project_id, folder_id=folder_id)
+                if not doc.get("is_recycle_bin")
+            )
+
+        return self._search_indexes[key]
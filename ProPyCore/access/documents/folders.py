@@ -1,18 +1,22 @@
 from ..base import Base
 from ...exceptions import NotFoundItemError, ProcoreException, WrongParamsError
+from .search import SearchIndex
+from .tree import PathIndex, build_tree, iter_listing, normalize_path, shared_path_indexes
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from warnings import warn
-from fuzzywuzzy import fuzz
 
 class Folders(Base):
     """
     Access to and working with Procore folders
     """
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/folders"
+        self._path_indexes = shared_path_indexes(session) # project_id -> PathIndex, shared with Files
+        self._search_indexes = {} # (project_id, folder_id) -> SearchIndex
 
     def show(self, company_id, project_id, doc_id):
         """
@@ -81,8 +85,55 @@ class Folders(Base):
             params=params
         )
 
+        if project_id in self._path_indexes:
+            self._path_indexes[project_id].remove(doc_id)
+
         return doc_info
 
+    def iter_docs(self, company_id, project_id, folder_id=None):
+        """
+        Yields the documents in a project one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        folder_id : int, default None
+            id of parent folder
+
+        Yields
+        ------
+        doc : dict
+            document response body
+        """
+        # get document type (file or folder) from endpoint
+        doc_type = self.endpoint.split("/")[-1][:-1] # remove last char which is an "s"
+
+        params = {
+            "view": "normal",
+            "sort": "name",
+            "filters[document_type]": doc_type,
+            "filters[is_in_recycle_bin]": False
+        }
+        if folder_id is not None:
+            params["filters[folder_id]"] = folder_id
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        for doc_info in self.iter_pages(
+            api_url=f"/rest/v1.0/projects/{project_id}/documents",
+            additional_headers=headers,
+            params=params,
+            per_page=10000
+        ):
+            for doc in doc_info:
+                if doc["is_deleted"] is False:
+                    yield doc
+
     def get(self, company_id, project_id, folder_id=None):
         """
         Gets all documents in a project
@@ -102,39 +153,7 @@ class Folders(Base):
         # get document type (file or folder) from endpoint
         doc_type = self.endpoint.split("/")[-1][:-1] # remove last char which is an "s"
 
-        n_docs = 1
-        page = 1
-        docs = []
-        while n_docs > 0:
-
-            params = {
-                "view": "normal",
-                "sort": "name",
-                "page": page,
-                "per_page": 10000,
-                "filters[document_type]": doc_type,
-                "filters[is_in_recycle_bin]": False
-            }
-            if folder_id is not None:
-                params["filters[folder_id]"] = folder_id
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            doc_info = self.get_request(
-                api_url=f"/rest/v1.0/projects/{project_id}/documents",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_docs = len(doc_info)
-
-            for doc in doc_info:
-                if doc["is_deleted"] is False:
-                    docs.append(doc)
-
-            page += 1 
+        docs = list(self.iter_docs(company_id=company_id, project_id=project_id, folder_id=folder_id))
 
         if len(docs) > 0:
             return docs
@@ -173,31 +192,28 @@ class Folders(Base):
         # get document type (file or folder) from endpoint
         doc_type = self.endpoint.split("/")[-1][:-1] # remove last char which is an "s"
 
-        # dummy values for finding best match
-        score = 0
-        n_perfect = 0
-        result = {}
-        for doc in docs:
-            # filter for only active documents
-            if not doc["is_deleted"] and not doc["is_recycle_bin"] and doc["document_type"] == doc_type:
-                temp_score = fuzz.partial_ratio(value, doc["name"])
-                if temp_score == 100:
-                    n_perfect += 1
-                # update match values
-                if temp_score >= score:
-                    score = temp_score
-                    result = doc
+        # score only the active documents of this type, best match first
+        index = SearchIndex(
+            doc for doc in docs
+            if not doc["is_deleted"] and not doc["is_recycle_bin"] and doc["document_type"] == doc_type
+        )
+        matches = index.search(value, limit=None)
+
+        # raise an error if the document can't be found
+        if len(matches) == 0:
+            raise NotFoundItemError(f"Could not find document {value}")
+
+        # for documents with the same score, the last one found wins
+        score = matches[0][1]
+        top = [doc for doc, doc_score in matches if doc_score == score]
+        result = top[-1]
 
         # warn if multiple documents provided perfect match
-        if n_perfect > 1:
+        if score == 100 and len(top) > 1:
             warn("Multiple 100% matches - try refining your search critera for better results")
 
-        # raise an error if the document can't be found
-        if score == 0:
-            raise NotFoundItemError(f"Could not find document {value}")
-        else:
-            result["search_criteria"] = {"value":value, "match":score}
-            return result
+        result["search_criteria"] = {"value":value, "match":round(score)}
+        return result
 
     def root(self, company_id, project_id):
         """
@@ -285,6 +301,12 @@ class Folders(Base):
             )
         except ProcoreException as e:
             print(e)
+
+        if project_id in self._path_indexes and "id" in doc_info:
+            index = self._path_indexes[project_id]
+            folder = dict(doc_info, document_type="folder")
+            folder.setdefault("parent_id", int(folder_id) if folder_id is not None else index.root_id)
+            index.update([folder])
         
         return doc_info
         
@@ -337,6 +359,9 @@ class Folders(Base):
             data=data
         )
 
+        if project_id in self._path_indexes and "id" in doc_info:
+            self._path_indexes[project_id].update([dict(doc_info, document_type="folder")])
+
         return doc_info
     
     def find(self, company_id, project_id, identifier, folder_id=None):
@@ -374,4 +399,225 @@ class Folders(Base):
                     doc_id=folder["id"]
                 )
 
-        raise NotFoundItemError(f"Could not find document {identifier}")
\ No newline at end of file
+        raise NotFoundItemError(f"Could not find document {identifier}")
+
+    def iter_listing(self, company_id, project_id):
+        """
+        Yields every folder and file in a project from the flat documents listing, one page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+
+        Yields
+        ------
+        doc : dict
+            folder or file response body, with parent_id pointing at the containing folder
+        """
+        return iter_listing(self, company_id=company_id, project_id=project_id)
+
+    def tree(self, company_id, project_id):
+        """
+        Builds the full folder tree from one flat documents listing
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+
+        Returns
+        -------
+        root : dict
+            root node - every node has path, folders (child nodes), and files on top of its response body
+        """
+        return build_tree(self.iter_listing(company_id=company_id, project_id=project_id))
+
+    def walk(self, company_id, project_id, folder_id=None, max_workers=8):
+        """
+        Crawls the folder hierarchy breadth-first, showing up to max_workers folders at once
+
+        Each folder is only visited once, even if it is reachable from more than one parent.
+        Closing the generator early cancels the folders that have not been requested yet.
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        folder_id : int, default None
+            folder to start from - None starts at the root
+        max_workers : int, default 8
+            number of folders requested at once
+
+        Yields
+        ------
+        path : str
+            folder path relative to the starting folder, "" for the starting folder itself
+        folder : dict
+            folder response body, including its subfolders
+        files : list of dict
+            active files in the folder
+        """
+        def fetch(doc_id):
+            if doc_id is None:
+                return self.root(company_id=company_id, project_id=project_id)
+            return self.show(company_id=company_id, project_id=project_id, doc_id=doc_id)
+
+        visited = {folder_id}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        try:
+            pending[executor.submit(fetch, folder_id)] = ""
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    folder = future.result()
+                    visited.add(folder.get("id"))
+
+                    for subfolder in folder.get("folders", []):
+                        if subfolder["id"] in visited or subfolder.get("is_deleted") or subfolder.get("is_recycle_bin"):
+                            continue
+                        visited.add(subfolder["id"])
+                        subpath = f"{path}/{subfolder['name']}" if path else subfolder["name"]
+                        pending[executor.submit(fetch, subfolder["id"])] = subpath
+
+                    files = [
+                        doc for doc in folder.get("files", [])
+                        if not doc.get("is_deleted") and not doc.get("is_recycle_bin")
+                    ]
+                    yield path, folder, files
+        finally:
+            # stopped early - drop the queued folders (shutdown's cancel_futures needs Python 3.9)
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def path_index(self, company_id, project_id, refresh=False):
+        """
+        Gets the path index of a project, building it from the documents listing on first use
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        refresh : boolean, default False
+            True - rebuild the index from a fresh listing
+
+        Returns
+        -------
+        index : PathIndex
+            full path <-> id lookups for every folder and file in the project
+        """
+        if refresh or project_id not in self._path_indexes:
+            self._path_indexes[project_id] = PathIndex(self.iter_listing(company_id=company_id, project_id=project_id))
+
+        return self._path_indexes[project_id]
+
+    def find_by_path(self, company_id, project_id, path):
+        """
+        Finds a folder from its full path, e.g. "Drawings/Arch/Rev3"
+
+        The index is rebuilt once if the path is not in it, in case the folder was added elsewhere.
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        path : str
+            folder names separated by "/"
+
+        Returns
+        -------
+        <folder_info> : dict
+            folder listing information
+        """
+        for refresh in (False, True):
+            doc = self.path_index(company_id, project_id, refresh=refresh).doc_for(path)
+            if doc is not None and doc.get("document_type", "folder") == "folder":
+                return doc
+
+        raise NotFoundItemError(f"Could not find folder {path}")
+
+    def ensure_path(self, company_id, project_id, path):
+        """
+        Makes sure every folder along a path exists, creating the missing ones
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        path : str
+            folder names separated by "/"
+
+        Returns
+        -------
+        <folder_id> : int
+            id of the last folder in the path - None for the root
+        """
+        index = self.path_index(company_id, project_id)
+
+        parent_id = index.root_id
+        current = ""
+        for name in normalize_path(path).split("/"):
+            if name == "":
+                continue
+            current = f"{current}/{name}" if current else name
+
+            folder_id = index.id_for(current)
+            if folder_id is None:
+                folder = self.create(
+                    company_id=company_id,
+                    project_id=project_id,
+                    folder_name=name,
+                    folder_id=parent_id
+                )
+                folder.setdefault("parent_id", parent_id)
+                folder.setdefault("document_type", "folder")
+                index.update([folder])
+                folder_id = folder["id"]
+
+            parent_id = folder_id
+
+        return parent_id
+
+    def search_index(self, company_id, project_id, folder_id=None, refresh=False):
+        """
+        Gets a reusable fuzzy search index over the folders, building it from one listing on first use
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        folder_id : int, default None
+            only index folders in this parent - None indexes every folder in the project
+        refresh : boolean, default False
+            True - rebuild the index from a fresh listing
+
+        Returns
+        -------
+        index : SearchIndex
+            call index.search(value, limit=k) for the top k (folder, score) matches
+        """
+        key = (project_id, folder_id)
+        if refresh or key not in self._search_indexes:
+            self._search_indexes[key] = SearchIndex(
+                doc for doc in self.iter_docs(company_id=company_id, project_id=project_id, folder_id=folder_id)
+                if not doc.get("is_recycle_bin")
+            )
+
+        return self._search_indexes[key]
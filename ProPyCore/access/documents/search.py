@@ -0,0 +1,112 @@
+from collections import Counter, defaultdict
+
+def trigrams(text):
+    """
+    Lower-cased character trigrams of a string, e.g. "A-101" -> {"a-1", "-10", "101"}
+    """
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class SearchIndex:
+    """
+    Reusable fuzzy name search over a set of documents.
+    A trigram index narrows each query to a few candidates, which are then scored with partial_ratio
+    (rapidfuzz when installed, fuzzywuzzy otherwise).
+    """
+
+    def __init__(self, docs, max_candidates=500) -> None:
+        """
+        Parameters
+        ----------
+        docs : iterable of dict
+            documents with a name - order is kept for ties
+        max_candidates : int, default 500
+            documents scored per limited query, taken by the number of trigrams shared with the query - documents
+            tied with the last one kept are scored too, and search(limit=None) scores every document
+        """
+        self.docs = list(docs)
+        self.names = [doc["name"] for doc in self.docs]
+        self.max_candidates = max_candidates
+
+        self._postings = defaultdict(list) # trigram -> positions in docs
+        for position, name in enumerate(self.names):
+            for gram in trigrams(name):
+                self._postings[gram].append(position)
+
+    def candidates(self, query):
+        """
+        Positions of the documents worth scoring for a query
+
+        Parameters
+        ----------
+        query : str
+            search criteria
+
+        Returns
+        -------
+        positions : list of int
+            documents sharing the most trigrams with the query, in listing order - at least max_candidates of
+            them when there are that many, plus every document tied with the last one kept;
+            every document when the query is too short or shares nothing
+        """
+        grams = trigrams(query)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self._postings.get(gram, ()))
+
+        if not counts:
+            return list(range(len(self.docs)))
+
+        ranked = counts.most_common()
+        if len(ranked) > self.max_candidates:
+            # never split a tie - which of them is kept would otherwise change the best match
+            lowest = ranked[self.max_candidates - 1][1]
+            ranked = [item for item in ranked if item[1] >= lowest]
+
+        return sorted(position for position, _ in ranked)
+
+    def search(self, query, limit=10, score_cutoff=1):
+        """
+        Ranks documents by how well their name matches the query
+
+        Parameters
+        ----------
+        query : str
+            search criteria
+        limit : int, default 10
+            number of matches to return - None scores every document and returns every match
+        score_cutoff : int, default 1
+            lowest score (0-100) to include
+
+        Returns
+        -------
+        matches : list of tuple
+            (doc, score) pairs, best first - ties keep the listing order
+        """
+        positions = self.candidates(query) if limit is not None else range(len(self.docs))
+
+        # imported here so `import ProPyCore` stays light
+        try:
+            from rapidfuzz import fuzz, process
+        except ImportError: # optional dependency - falls back to fuzzywuzzy, which is slower
+            process = None
+
+        if process is not None:
+            choices = {position: self.names[position] for position in positions}
+            scored = [
+                (position, score)
+                for _, score, position in process.extract(query, choices, scorer=fuzz.partial_ratio, limit=None, score_cutoff=score_cutoff)
+            ]
+        else:
+            from fuzzywuzzy import fuzz as slow_fuzz
+            scored = [(position, slow_fuzz.partial_ratio(query, self.names[position])) for position in positions]
+            scored = [(position, score) for position, score in scored if score >= score_cutoff]
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            scored = scored[:limit]
+
+        return [(self.docs[position], score) for position, score in scored]
+
+    def __len__(self):
+        return len(self.docs)
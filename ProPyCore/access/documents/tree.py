@@ -0,0 +1,304 @@
+import threading
+import weakref
+
+# session -> {project_id: PathIndex}, so the Files and Folders endpoints of one Procore object share an index
+_shared_indexes = weakref.WeakKeyDictionary()
+_shared_lock = threading.Lock()
+
+def build_tree(docs):
+    """
+    Nests a flat documents listing into a folder tree using parent_id
+
+    Documents whose parent is not in the listing (e.g. top-level documents pointing at the root folder)
+    are attached to the root node.
+
+    Parameters
+    ----------
+    docs : iterable of dict
+        folders and files from the documents listing
+
+    Returns
+    -------
+    root : dict
+        root node - every folder node is a copy of its response body with path, folders, and files added
+    """
+    root = {"id": None, "name": "", "path": "", "folders": [], "files": []}
+
+    folders = {}
+    files = []
+    for doc in docs:
+        if doc.get("document_type") == "folder":
+            folders[doc["id"]] = dict(doc, folders=[], files=[])
+        else:
+            files.append(doc)
+
+    # the root folder can show up in the listing itself - fold it into the root node
+    for folder_id, folder in list(folders.items()):
+        if folder.get("is_root") or (folder.get("parent_id") is None and not folder.get("name")):
+            root["id"] = folder_id
+            del folders[folder_id]
+
+    for folder in folders.values():
+        folders.get(folder.get("parent_id"), root)["folders"].append(folder)
+    for doc in files:
+        folders.get(doc.get("parent_id"), root)["files"].append(doc)
+
+    # paths top-down without recursion so deep trees are fine
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for child in node["folders"]:
+            child["path"] = f"{node['path']}/{child['name']}" if node["path"] else child["name"]
+            stack.append(child)
+
+    return root
+
+def iter_listing(endpoint, company_id, project_id):
+    """
+    Yields every active folder and file in a project from the flat documents listing
+
+    Parameters
+    ----------
+    endpoint : Base
+        Folders or Files endpoint to send the requests through
+    company_id : int
+        unique identifier for the company
+    project_id : int
+        unique identifier for the project
+
+    Yields
+    ------
+    doc : dict
+        folder or file response body, with parent_id pointing at the containing folder
+    """
+    params = {
+        "view": "normal",
+        "filters[is_in_recycle_bin]": False
+    }
+
+    headers = {
+        "Procore-Company-Id": f"{company_id}"
+    }
+
+    for doc_info in endpoint.iter_pages(
+        api_url=f"/rest/v1.0/projects/{project_id}/documents",
+        additional_headers=headers,
+        params=params,
+        per_page=10000
+    ):
+        for doc in doc_info:
+            if not doc.get("is_deleted"):
+                yield doc
+
+def shared_path_indexes(session):
+    """
+    Per-project PathIndex store shared by every documents endpoint on the same session
+
+    Parameters
+    ----------
+    session : ProcoreSession or None
+        session handed to the endpoint - None gets a store of its own
+
+    Returns
+    -------
+    <indexes> : dict
+        project_id -> PathIndex
+    """
+    if session is None:
+        return {}
+
+    with _shared_lock:
+        return _shared_indexes.setdefault(session, {})
+
+def normalize_path(path):
+    """
+    Strips leading/trailing and repeated slashes, e.g. "/Drawings//Arch/" -> "Drawings/Arch"
+    """
+    return "/".join(segment for segment in str(path).split("/") if segment)
+
+class PathIndex:
+    """
+    Two-way map between full document paths and ids for one project.
+    Built once from the documents listing and kept current with update() and remove(), which can be called
+    from several threads at once.
+    """
+
+    def __init__(self, docs=()) -> None:
+        """
+        Parameters
+        ----------
+        docs : iterable of dict, default ()
+            folders and files from the documents listing
+        """
+        self._ids = {} # path -> id
+        self._paths = {} # id -> path
+        self._docs = {} # id -> response body
+        self._children = {} # parent_id -> ids of the documents directly in it
+        self._lock = threading.Lock()
+        self.root_id = None
+
+        self.update(docs)
+
+    def update(self, docs):
+        """
+        Adds or replaces documents - a parent folder can come before or after its children
+
+        Parameters
+        ----------
+        docs : iterable of dict
+            folder or file response bodies with id, name, and parent_id
+        """
+        docs = list(docs)
+        with self._lock:
+            stale = []
+            for doc in docs:
+                if doc.get("document_type") == "folder" and (doc.get("is_root") or (doc.get("parent_id") is None and not doc.get("name"))):
+                    self.root_id = doc["id"]
+                    self._paths[doc["id"]] = ""
+                    continue
+
+                old = self._docs.get(doc["id"])
+                if old is not None:
+                    self._children.get(old.get("parent_id"), set()).discard(doc["id"])
+                self._docs[doc["id"]] = doc
+                self._children.setdefault(doc.get("parent_id"), set()).add(doc["id"])
+
+                # a renamed or moved folder takes everything below it along
+                stale.extend(self._unindex(doc["id"]))
+
+            for doc_id in [doc["id"] for doc in docs] + stale:
+                if doc_id != self.root_id:
+                    self._resolve(doc_id)
+
+    def _descendants(self, doc_id):
+        """
+        Ids of every document below a folder, walked through the children map
+        """
+        found = []
+        stack = list(self._children.get(doc_id, ()))
+        while stack:
+            child_id = stack.pop()
+            found.append(child_id)
+            stack.extend(self._children.get(child_id, ()))
+
+        return found
+
+    def _unindex(self, doc_id):
+        """
+        Drops the cached paths of a document and everything below it, returning the ids that had one
+        """
+        dropped = []
+        for current in [doc_id] + self._descendants(doc_id):
+            path = self._paths.pop(current, None)
+            if path is not None:
+                if self._ids.get(path) == current:
+                    del self._ids[path]
+                dropped.append(current)
+
+        return dropped
+
+    def _resolve(self, doc_id):
+        """
+        Works out the path of a document by walking up its parents, caching every path on the way
+        """
+        chain = []
+        current = doc_id
+        while current in self._docs and current not in self._paths and current not in chain:
+            chain.append(current)
+            current = self._docs[current].get("parent_id")
+
+        prefix = self._paths.get(current, "")
+        for doc_id in reversed(chain):
+            name = self._docs[doc_id]["name"]
+            prefix = f"{prefix}/{name}" if prefix else name
+            self._paths[doc_id] = prefix
+            self._ids[prefix] = doc_id
+
+        return self._paths.get(doc_id)
+
+    def remove(self, doc_id):
+        """
+        Drops a document, and everything below it when it is a folder
+
+        Parameters
+        ----------
+        doc_id : int
+            unique identifier for the folder or file
+        """
+        with self._lock:
+            doc = self._docs.get(doc_id)
+            if doc is None:
+                return
+
+            for current in [doc_id] + self._descendants(doc_id):
+                path = self._paths.pop(current, None)
+                if path is not None and self._ids.get(path) == current:
+                    del self._ids[path]
+                self._docs.pop(current, None)
+                self._children.pop(current, None)
+            self._children.get(doc.get("parent_id"), set()).discard(doc_id)
+
+    def id_for(self, path):
+        """
+        Returns
+        -------
+        <doc_id> : int or None
+            id of the document at the path, None when it is not indexed
+        """
+        path = normalize_path(path)
+        with self._lock:
+            return self.root_id if path == "" else self._ids.get(path)
+
+    def path_for(self, doc_id):
+        """
+        Returns
+        -------
+        <path> : str or None
+            full path of the document, None when it is not indexed
+        """
+        with self._lock:
+            return self._paths.get(doc_id)
+
+    def doc_for(self, path):
+        """
+        Returns
+        -------
+        <doc> : dict or None
+            listing response body of the document at the path, None when it is not indexed
+        """
+        doc_id = self.id_for(path)
+        with self._lock:
+            return self._docs.get(doc_id)
+
+    def items(self, prefix=""):
+        """
+        Yields the indexed documents at or below a folder path
+
+        Parameters
+        ----------
+        prefix : str, default ""
+            folder path to look under - "" yields every document
+
+        Yields
+        ------
+        path : str
+            full path of the document
+        doc : dict
+            listing response body
+        """
+        prefix = normalize_path(prefix)
+        with self._lock:
+            # a snapshot, so updates from other threads do not change it mid-iteration
+            entries = [
+                (path, self._docs[doc_id]) for path, doc_id in self._ids.items()
+                if prefix == "" or path == prefix or path.startswith(prefix + "/")
+            ]
+
+        yield from entries
+
+    def __contains__(self, path):
+        return self.id_for(path) is not None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ids)
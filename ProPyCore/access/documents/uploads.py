@@ -0,0 +1,203 @@
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ...exceptions import raise_exception
+
+# storage providers need every segment but the last to be at least 5 MB
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def plan_segments(filepath, part_size=DEFAULT_PART_SIZE):
+    """
+    Splits a file into segments and hashes each one, reading a chunk at a time
+
+    Parameters
+    ----------
+    filepath : str
+        file to upload
+    part_size : int, default DEFAULT_PART_SIZE
+        bytes per segment - the last one holds the remainder
+
+    Returns
+    -------
+    segments : list of dict
+        size and sha256 of each segment, in order
+    """
+    segments = []
+    with open(filepath, "rb") as handle:
+        while True:
+            digest = hashlib.sha256()
+            size = 0
+            while size < part_size:
+                chunk = handle.read(min(HASH_CHUNK_SIZE, part_size - size))
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+
+            if size == 0 and segments:
+                break
+            segments.append({"size": size, "sha256": digest.hexdigest()})
+            if size < part_size:
+                break
+
+    return segments
+
+class UploadState:
+    """
+    JSON record of a segmented upload in progress, so a failed or interrupted upload can pick up where it stopped.
+    Only valid while the file keeps the same size and modification time.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            location of the JSON file - written after every finished segment and removed once the upload completes
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, filepath, part_size):
+        """
+        Returns
+        -------
+        <state> : dict or None
+            upload uuid, segments, and the etags of the finished ones - None when there is nothing to resume
+        """
+        try:
+            with open(self.path) as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        stat = os.stat(filepath)
+        if (state.get("filepath"), state.get("size"), state.get("mtime_ns"), state.get("part_size")) != (
+            os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns, part_size
+        ):
+            return None
+
+        return state
+
+    def save(self, state):
+        """
+        Writes the state atomically so a crash mid-write leaves the previous version
+        """
+        with self._lock:
+            temp = f"{self.path}.tmp"
+            with open(temp, "w") as handle:
+                json.dump(state, handle)
+            os.replace(temp, self.path)
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def upload_segmented(endpoint, company_id, project_id, filepath, part_size=DEFAULT_PART_SIZE, max_workers=4, state_path=None):
+    """
+    Uploads a file to Procore storage through the segmented /uploads flow
+
+    Creates the upload with the size and sha256 of every segment, PUTs the segments to the urls Procore
+    returns on a bounded thread pool, then completes the upload with their ETags. At most max_workers
+    segments are held in memory at once.
+
+    Parameters
+    ----------
+    endpoint : Base
+        endpoint to send the requests through
+    company_id : int
+        unique identifier for the company
+    project_id : int
+        unique identifier for the project
+    filepath : str
+        file to upload
+    part_size : int, default DEFAULT_PART_SIZE
+        bytes per segment
+    max_workers : int, default 4
+        number of segments uploaded at once
+    state_path : str, default None
+        JSON file to record progress in - an unfinished upload recorded there is resumed, skipping finished segments
+
+    Returns
+    -------
+    upload_uuid : str
+        reference to the stored file, e.g. for file[upload_uuid]
+    """
+    headers = {
+        "Procore-Company-Id": f"{company_id}",
+    }
+    api_url = f"/rest/v1.1/projects/{project_id}/uploads"
+
+    tracker = UploadState(state_path) if state_path is not None else None
+    state = tracker.load(filepath, part_size) if tracker is not None else None
+
+    if state is None:
+        segments = plan_segments(filepath, part_size)
+        filename = os.path.basename(filepath)
+        upload = endpoint.post_request(
+            api_url=api_url,
+            additional_headers=headers,
+            data={
+                "response_filename": filename,
+                "response_content_type": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                "segments": segments,
+            },
+        )
+
+        stat = os.stat(filepath)
+        state = {
+            "filepath": os.path.abspath(filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "part_size": part_size,
+            "uuid": upload["uuid"],
+            "segments": [
+                dict(segment, url=returned["url"], headers=returned.get("headers") or {})
+                for segment, returned in zip(segments, upload["segments"])
+            ],
+            "etags": [None] * len(segments),
+        }
+        if tracker is not None:
+            tracker.save(state)
+
+    def put_segment(index):
+        segment = state["segments"][index]
+        with open(filepath, "rb") as handle:
+            handle.seek(index * part_size)
+            body = handle.read(segment["size"])
+
+        response = endpoint.external_request("PUT", segment["url"], data=body, headers=segment["headers"])
+        if not response.ok:
+            raise_exception(response)
+
+        state["etags"][index] = response.headers.get("ETag")
+        if tracker is not None:
+            tracker.save(state)
+
+    pending = [index for index, etag in enumerate(state["etags"]) if etag is None]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() re-raises the first failed segment; finished ones stay recorded for the next attempt
+        list(executor.map(put_segment, pending))
+
+    endpoint.patch_request(
+        api_url=f"{api_url}/{state['uuid']}",
+        additional_headers=headers,
+        data={
+            "segments": [
+                {"size": segment["size"], "sha256": segment["sha256"], "etag": etag}
+                for segment, etag in zip(state["segments"], state["etags"])
+            ],
+        },
+    )
+
+    if tracker is not None:
+        tracker.remove()
+
+    return state["uuid"]
@@ -5,8 +5,8 @@ class GenericTool(Base):
     """
     Access and working with generic tool endpoints
     """
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/companies"
 
@@ -71,6 +71,42 @@ class GenericTool(Base):
 
         raise NotFoundItemError(f"Could not find tool {identifier}")
     
+    def iter_items(self, company_id, project_id, tool_id):
+        """
+        Yields the available items for a specific tool one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        tool_id : int
+            unique identifier for the generic tool
+
+        Yields
+        ------
+        item : dict
+            tool item data
+        """
+        params = {
+            "view": "extended",
+            "sort": "created_at",
+            "filters[recycle_bin]": False
+        }
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        for item_info in self.iter_pages(
+            api_url=f"/rest/v1.0/projects/{project_id}/generic_tools/{tool_id}/generic_tool_items",
+            additional_headers=headers,
+            params=params,
+            per_page=10000
+        ):
+            yield from item_info
+
     def get_items(self, company_id, project_id, tool_id):
         """
         Gets all the available items for a specific tool
@@ -89,33 +125,7 @@ class GenericTool(Base):
         items : dict
             available tool item data
         """
-        n_items = 1
-        page = 1
-        items = []
-        while n_items > 0:
-            params = {
-                "view": "extended",
-                "sort": "created_at",
-                "page": page,
-                "per_page": 10000,
-                "filters[recycle_bin]": False
-            }
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            item_info = self.get_request(
-                api_url=f"/rest/v1.0/projects/{project_id}/generic_tools/{tool_id}/generic_tool_items",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_items = len(item_info)
-            if n_items > 0:
-                items += item_info
-
-            page += 1 
+        items = list(self.iter_items(company_id=company_id, project_id=project_id, tool_id=tool_id))
 
         if len(items) > 0:
             return items
@@ -186,17 +196,15 @@ class GenericTool(Base):
         else:
             key = "title"
 
-        tool_items = self.get_tool_items(
-            company_id=company_id,
-            project_id=project_id,
-            tool_id=tool_id
+        tool_item = self.find_first(
+            self.iter_items(company_id=company_id, project_id=project_id, tool_id=tool_id),
+            key=key,
+            identifier=identifier
         )
+        if tool_item is None:
+            raise NotFoundItemError(f"Could not find tool item {identifier}")
 
-        for tool_item in tool_items:
-            if tool_item[key] == identifier:
-                return tool_item
-
-        raise NotFoundItemError(f"Could not find tool item {identifier}")
+        return tool_item
     
     def update_item(self, company_id, project_id, tool_id, item_id, data):
         """
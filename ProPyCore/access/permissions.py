@@ -5,8 +5,8 @@ class Permissions(Base):
     """
     Access and working with permissions endpoints
     """
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0"
         
@@ -2,6 +2,6 @@ from .categories import Categories
 from .images import Images
 
 class Photos:
-    def __init__(self, access_token, server_url):
-        self.categories = Categories(access_token, server_url)
-        self.images = Images(access_token, server_url)
\ No newline at end of file
+    def __init__(self, access_token, server_url, session=None):
+        self.categories = Categories(access_token, server_url, session=session)
+        self.images = Images(access_token, server_url, session=session)
\ No newline at end of file
@@ -6,11 +6,41 @@ class Projects(Base):
     Access and working with projects from a given company
     """
 
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.1/projects"
 
+    def iter_projects(self, company_id, status="All", per_page=300):
+        """
+        Yields the projects from a certain company one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        status : str enum, default "All"
+            status of the projects to get must be one of: ["Active", "Inactive", "All"]
+        per_page : int, default 300
+            number of projects to request per page
+
+        Yields
+        ------
+        project : dict
+            project data
+        """
+        params = {
+            "company_id": company_id,
+            "filters[by_status]": status
+        }
+
+        for projects_per_page in self.iter_pages(
+            api_url=self.endpoint,
+            params=params,
+            per_page=per_page
+        ):
+            yield from projects_per_page
+
     def get(self, company_id, status="All",per_page=300):
         """
         Gets a list of all the projects from a certain company
@@ -30,28 +60,7 @@ class Projects(Base):
         projects : list of dict
             list where each value is a dict with the project's id, active status (is_active), and name
         """
-        projects = []
-        n_projects = 1
-        page = 1
-        while n_projects > 0:
-            params = {
-                "company_id": company_id,
-                "page": page,
-                "per_page": per_page,
-                "filters[by_status]": status
-            }
-            
-            projects_per_page = self.get_request(
-                api_url=self.endpoint,
-                params=params
-            )
-            n_projects = len(projects_per_page)
-
-            projects += projects_per_page
-
-            page += 1
-
-        return projects
+        return list(self.iter_projects(company_id=company_id, status=status, per_page=per_page))
 
     def find(self, company_id, identifier):
         """
@@ -1,5 +1,5 @@
 from .punch import Punch
 
 class Quality:
-    def __init__(self, access_token, server_url):
-        self.punch = Punch(access_token, server_url)
\ No newline at end of file
+    def __init__(self, access_token, server_url, session=None):
+        self.punch = Punch(access_token, server_url, session=session)
\ No newline at end of file
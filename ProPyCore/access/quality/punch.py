@@ -2,12 +2,50 @@ from ..base import Base
 from ...exceptions import NotFoundItemError
 
 class Punch(Base):
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.1"
 
-    def get(self, company_id, project_id, page=1, per_page=100):
+    def iter_punch_items(self, company_id, project_id, per_page=100, filters=None):
+        """
+        Yields the available punch items one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of punch items to request per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
+
+        Yields
+        ------
+        punch_item : dict
+            punch item data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+        params = {
+            "project_id": project_id
+        }
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
+
+        for punch_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/punch_items",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from punch_selection
+
+    def get(self, company_id, project_id, page=1, per_page=100, filters=None):
         """
         Gets all the available punch items
 
@@ -21,36 +59,15 @@ class Punch(Base):
             page number
         per_page : int, default 100
             number of punch items to include per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
 
         Returns
         -------
         punch_items : dict
             available punch data
         """
-        headers = {
-            "Procore-Company-Id": f"{company_id}"
-        }
-        n_punch_items = 1
-        page = 1
-        punch_items = []
-        while n_punch_items > 0:
-            params = {
-                "project_id": project_id,
-                "page": page,
-                "per_page": per_page
-            }
-
-            punch_selection = self.get_request(
-                api_url=f"{self.endpoint}/punch_items",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_punch_items = len(punch_selection)
-            punch_items += punch_selection
-            page += 1 
-
-        return punch_items
+        return list(self.iter_punch_items(company_id=company_id, project_id=project_id, per_page=per_page, filters=filters))
 
     def show(self, company_id, project_id, punch_id):
         """
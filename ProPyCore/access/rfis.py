@@ -1,17 +1,54 @@
 from .base import Base
 
-from ..exceptions import NotFoundItemError
+from ..exceptions import NotFoundItemError, NotFoundClientError
 
 class RFI(Base):
     """
     Access and working with RFIs in a given project
     """
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/projects"
 
-    def get(self, company_id, project_id, page=1, per_page=100):
+    def iter_rfis(self, company_id, project_id, per_page=100, filters=None):
+        """
+        Yields the available RFIs one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of rfis to request per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"number": value} is sent as filters[number]=value
+
+        Yields
+        ------
+        rfi : dict
+            rfi data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {}
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
+
+        for rfi_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/{project_id}/rfis",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from rfi_selection
+
+    def get(self, company_id, project_id, page=1, per_page=100, filters=None):
         """
         Gets all the available RFIs
 
@@ -25,35 +62,15 @@ class RFI(Base):
             page number
         per_page : int, default 100
             number of rfis to include per page
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
 
         Returns
         -------
         rfis : dict
             available rfi data
         """
-        headers = {
-            "Procore-Company-Id": f"{company_id}"
-        }
-        n_rfis = 1
-        page = 1
-        rfis = []
-        while n_rfis > 0:
-            params = {
-                "page": page,
-                "per_page": per_page
-            }
-
-            rfi_selection = self.get_request(
-                api_url=f"{self.endpoint}/{project_id}/rfis",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_rfis = len(rfi_selection)
-            rfis += rfi_selection
-            page += 1 
-
-        return rfis
+        return list(self.iter_rfis(company_id=company_id, project_id=project_id, per_page=per_page, filters=filters))
 
     def show(self, company_id, project_id, rfi_id):
         """
@@ -104,17 +121,28 @@ class RFI(Base):
             RFI data
         """
         if isinstance(identifier, int):
-            key = "id"
-        else:
-            key = "number"
-
-        for rfi in self.get(company_id=company_id, project_id=project_id):
-            if rfi[key] == identifier:
-                rfi_info = self.show(
+            # the id is all show needs, so skip the listing
+            try:
+                return self.show(
                     company_id=company_id,
                     project_id=project_id,
-                    rfi_id=rfi["id"]
+                    rfi_id=identifier
                 )
-                return rfi_info
+            except NotFoundClientError:
+                raise NotFoundItemError(f"Could not find RFI {identifier}")
+
+        rfi = self.find_first(
+            self.iter_rfis(company_id=company_id, project_id=project_id, filters={"number": identifier}),
+            key="number",
+            identifier=identifier,
+            fallback=lambda: self.iter_rfis(company_id=company_id, project_id=project_id)
+        )
+        if rfi is None:
+            raise NotFoundItemError(f"Could not find RFI {identifier}")
 
-        raise NotFoundItemError(f"Could not find RFI {identifier}")
+        rfi_info = self.show(
+            company_id=company_id,
+            project_id=project_id,
+            rfi_id=rfi["id"]
+        )
+        return rfi_info
@@ -5,8 +5,8 @@ class Submittal(Base):
     """
     Access and working with submittals in a given project
     """
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest" # Different version numbers for different endpoints so limited to this
 
     def get_statuses(self, company_id, project_id):
@@ -33,7 +33,51 @@ class Submittal(Base):
             additional_headers=headers
         )
 
-    def get(self, company_id, project_id, page=1, per_page=100, status_ids=None):
+    def iter_submittals(self, company_id, project_id, per_page=100, status_ids=None, filters=None):
+        """
+        Yields the available submittals one at a time, requesting them a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        per_page : int, default 100
+            number of submittals to request per page
+        status_ids : list of int or str, default None
+            filter by status ID
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
+
+        Yields
+        ------
+        submittal : dict
+            submittal data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {}
+        if status_ids is not None:
+            if isinstance(status_ids, list):
+                params["filters[status_id]"] = [str(status_id) for status_id in status_ids]
+            else:
+                params["filters[status_id]"] = [str(status_ids)]
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
+
+        for submittal_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/v1.1/projects/{project_id}/submittals",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page
+        ):
+            yield from submittal_selection
+
+    def get(self, company_id, project_id, page=1, per_page=100, status_ids=None, filters=None):
         """
         Gets all the available submittals
 
@@ -49,45 +93,15 @@ class Submittal(Base):
             number of companies to include
         status_ids : list of int or str, default None
             filter by status ID
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
 
         Returns
         -------
         submittals : dict
             available rfi data
         """
-        headers = {
-            "Procore-Company-Id": f"{company_id}"
-        }
-        n_submittals = 1
-        page = 1
-        submittals = []
-        while n_submittals > 0:
-            params = {
-                "page": page,
-                "per_page": per_page
-            }
-
-            if status_ids is not None:
-                if isinstance(status_ids, list):
-                    params["filters[status_id]"] = [str(status_id) for status_id in status_ids]
-                else:
-                    params["filters[status_id]"] = [str(status_ids)]
-
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
-
-            submittal_selection = self.get_request(
-                api_url=f"{self.endpoint}/v1.1/projects/{project_id}/submittals",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_submittals = len(submittal_selection)
-            submittals += submittal_selection
-            page += 1 
-
-        return submittals
+        return list(self.iter_submittals(company_id=company_id, project_id=project_id, per_page=per_page, status_ids=status_ids, filters=filters))
 
     def show(self, company_id, project_id, submittal_id):
         """
@@ -132,18 +146,27 @@ class Submittal(Base):
         submittal_info : dict
             submittal data
         """
-        submittals = self.get(company_id=company_id, project_id=project_id)
         if isinstance(identifier, int):
-            key = "id"
-        else:
-            key = "title"
-
-        for submittal in submittals:
-            if submittal[key] == identifier:
+            # the id is all show needs, so skip the listing
+            try:
                 return self.show(
                     company_id=company_id,
                     project_id=project_id,
-                    submittal_id=submittal["id"]
+                    submittal_id=identifier
                 )
+            except NotFoundClientError:
+                raise NotFoundItemError(f"Could not find Submittal {identifier}")
 
-        raise NotFoundItemError(f"Could not find Submittal {identifier}")
\ No newline at end of file
+        submittal = self.find_first(
+            self.iter_submittals(company_id=company_id, project_id=project_id),
+            key="title",
+            identifier=identifier
+        )
+        if submittal is None:
+            raise NotFoundItemError(f"Could not find Submittal {identifier}")
+
+        return self.show(
+            company_id=company_id,
+            project_id=project_id,
+            submittal_id=submittal["id"]
+        )
\ No newline at end of file
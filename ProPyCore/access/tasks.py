@@ -5,14 +5,14 @@ class Task(Base):
     """
     Access and working with submittals in a given project
     """
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
 
         self.endpoint = "/rest/v1.0/tasks"
 
-    def get(self, company_id, project_id):
+    def iter_tasks(self, company_id, project_id, filters=None):
         """
-        Gets all the available tasks
+        Yields the available tasks one at a time, requesting them a page at a time
 
         Parameters
         ----------
@@ -20,42 +20,52 @@ class Task(Base):
             unique identifier for the company
         project_id : int
             unique identifier for the project
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
 
-        Returns
-        -------
-        tasks : dict
-            available submittal data
+        Yields
+        ------
+        task : dict
+            task data
         """
         headers = {
             "Procore-Company-Id": f"{company_id}"
         }
 
-        n_tasks = 1
-        page = 1
-        tasks = []
-        while n_tasks > 0:
-
-            params = {
-                "project_id": project_id,
-                "page": page,
-                "per_page": 100
-            }
+        params = {
+            "project_id": project_id
+        }
+        if filters is not None:
+            for name, value in filters.items():
+                params[f"filters[{name}]"] = value
 
-            headers = {
-                "Procore-Company-Id": f"{company_id}"
-            }
+        for task_selection in self.iter_pages(
+            api_url=f"{self.endpoint}",
+            additional_headers=headers,
+            params=params,
+            per_page=100
+        ):
+            yield from task_selection
 
-            task_selection = self.get_request(
-                api_url=f"{self.endpoint}",
-                additional_headers=headers,
-                params=params
-            )
+    def get(self, company_id, project_id, filters=None):
+        """
+        Gets all the available tasks
 
-            n_tasks = len(task_selection)
-            tasks += task_selection
-            page += 1 
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        filters : dict, default None
+            server-side filters to apply, e.g. {"updated_at": range} is sent as filters[updated_at]=range
 
-        return tasks
+        Returns
+        -------
+        tasks : dict
+            available submittal data
+        """
+        return list(self.iter_tasks(company_id=company_id, project_id=project_id, filters=filters))
     
     def show(self, company_id, project_id, task_id):
         """
@@ -111,17 +121,27 @@ class Task(Base):
             task data
         """
         if isinstance(identifier, int):
-            key = "id"
-        else:
-            key = "name"
-
-        for task in self.get(company_id=company_id, project_id=project_id):
-            if task[key] == identifier:
-                task_info = self.show(
+            # the id is all show needs, so skip the listing
+            try:
+                return self.show(
                     company_id=company_id,
                     project_id=project_id,
-                    task_id=task["id"]
+                    task_id=identifier
                 )
-                return task_info
+            except NotFoundClientError:
+                raise NotFoundItemError(f"Could not find task {identifier}")
 
-        raise NotFoundItemError(f"Could not find task {identifier}")
\ No newline at end of file
+        task = self.find_first(
+            self.iter_tasks(company_id=company_id, project_id=project_id),
+            key="name",
+            identifier=identifier
+        )
+        if task is None:
+            raise NotFoundItemError(f"Could not find task {identifier}")
+
+        task_info = self.show(
+            company_id=company_id,
+            project_id=project_id,
+            task_id=task["id"]
+        )
+        return task_info
\ No newline at end of file
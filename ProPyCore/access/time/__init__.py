@@ -3,6 +3,6 @@ from .timesheets import Timesheets
 
 class Time:
     
-    def __init__(self, access_token, server_url):
-        self.timecards = Timecards(access_token, server_url)
-        self.timesheets = Timesheets(access_token, server_url)
\ No newline at end of file
+    def __init__(self, access_token, server_url, session=None):
+        self.timecards = Timecards(access_token, server_url, session=session)
+        self.timesheets = Timesheets(access_token, server_url, session=session)
\ No newline at end of file
@@ -0,0 +1,80 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import islice
+
+def date_shards(start_date, end_date, shard_days=7):
+    """
+    Splits an inclusive date range into consecutive inclusive shards
+
+    Parameters
+    ----------
+    start_date : datetime
+        first day of the range
+    end_date : datetime
+        last day of the range
+    shard_days : int, default 7
+        days per shard - 1 for daily shards, 7 for weekly
+
+    Returns
+    -------
+    shards : list of tuple
+        (shard_start, shard_end) pairs in date order
+    """
+    if shard_days < 1:
+        raise ValueError("shard_days must be at least 1")
+
+    shards = []
+    current = start_date
+    while current <= end_date:
+        shard_end = min(current + timedelta(days=shard_days - 1), end_date)
+        shards.append((current, shard_end))
+        current = shard_end + timedelta(days=1)
+
+    return shards
+
+def iter_sharded(fetch, shards, max_workers=4):
+    """
+    Fetches shards concurrently and yields their records in shard order, dropping repeated ids
+
+    At most max_workers shards are in flight - the next one starts as each is taken in order, so results stream
+    without waiting for the whole range and a long range is not queued all at once.
+
+    Parameters
+    ----------
+    fetch : callable
+        takes (shard_start, shard_end) and returns that shard's records
+    shards : list of tuple
+        from date_shards()
+    max_workers : int, default 4
+        number of shards fetched at once
+
+    Yields
+    ------
+    record : dict
+        each record once, by id
+    """
+    seen = set()
+    remaining = iter(shards)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = deque()
+    try:
+        futures.extend(executor.submit(fetch, *shard) for shard in islice(remaining, max_workers))
+        while futures:
+            records = futures.popleft().result()
+            shard = next(remaining, None)
+            if shard is not None:
+                futures.append(executor.submit(fetch, *shard))
+
+            for record in records:
+                key = record.get("id")
+                if key is None:
+                    yield record
+                elif key not in seen:
+                    seen.add(key)
+                    yield record
+    finally:
+        # stopped early - do not download the rest
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -1,14 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from ..base import Base
+from .shards import date_shards, iter_sharded
+from ...exceptions import ProcoreException
 from ..directory.people import People
 from ..cost_codes import CostCodes
 
 class Timecards(Base):
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest" # very basic since timecards can be at project and company levels
-        self.people = People(access_token, server_url)
-        self.cost_codes = CostCodes(access_token, server_url)
+        self.people = People(access_token, server_url, session=session)
+        self.cost_codes = CostCodes(access_token, server_url, session=session)
 
     def get_time_types(self, company_id):
         """
@@ -70,6 +73,48 @@ class Timecards(Base):
             print(f"Error finding time type: {e}")
             return None
     
+    def iter_for_day(self, company_id, project_id, entry_date=None, page=1, per_page=100):
+        """
+        Yields the daily timecard data for a given project one at a time, requesting it a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        entry_date : datetime, default None
+            date to pull timecards
+            None specifies current day
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of timecards to request per page
+
+        Yields
+        ------
+        timecard : dict
+            timecard data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {
+            "project_id": project_id
+        }
+        if entry_date is not None:
+            params["log_date"] = datetime.strftime(entry_date, "%Y-%m-%d")
+
+        for timecard_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/v1.0/projects/{project_id}/timecard_entries",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page,
+            page=page
+        ):
+            yield from timecard_selection
+
     def get_for_day(self, company_id, project_id, entry_date=None, page=1, per_page=100):
         """
         Returns a list of all daily timecard data for a given project
@@ -94,40 +139,76 @@ class Timecards(Base):
         timecards : list of dict
             available timecard data
         """
+        return list(self.iter_for_day(company_id=company_id, project_id=project_id, entry_date=entry_date, page=page, per_page=per_page))
+
+    def iter_for_specified_period(self, company_id, start_date, end_date, page=1, per_page=100, party_id=None, shard_days=7, max_workers=4):
+        """
+        Yields the timecard data for the given date range (inclusive on both ends) one at a time, requesting it a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        start_date : datetime
+            start date of pay period (inclusive)
+        end_date : datetime
+            end date of pay period (inclusive)
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of timecards to request per page
+        party_id : int, default None
+            procore People ID to filter by if included
+        shard_days : int, default 7
+            split the range into shards of this many days and fetch max_workers of them at once
+            None (or a page other than 1) pages through the whole range serially
+        max_workers : int, default 4
+            number of shards fetched at once
+
+        Yields
+        ------
+        timecard : dict
+            timecard data - in shard (date) order, each id once
+        """
+        shards = date_shards(start_date, end_date, shard_days) if shard_days is not None and page == 1 else []
+        if len(shards) > 1:
+            yield from iter_sharded(
+                lambda shard_start, shard_end: list(self.iter_for_specified_period(
+                    company_id=company_id,
+                    start_date=shard_start,
+                    end_date=shard_end,
+                    per_page=per_page,
+                    party_id=party_id,
+                    shard_days=None
+                )),
+                shards,
+                max_workers=max_workers
+            )
+            return
+
         headers = {
             "Procore-Company-Id": f"{company_id}"
         }
 
-        n_timecards = 1
-        timecards = []
-        while n_timecards > 0:
-            if entry_date is None:
-                params = {
-                    "project_id": project_id,
-                    "page": page,
-                    "per_page": per_page
-                }
-            else:
-                params = {
-                    "project_id": project_id,
-                    "page": page,
-                    "per_page": per_page,
-                    "log_date": datetime.strftime(entry_date, "%Y-%m-%d")
-                }
-
-            timecard_selection = self.get_request(
-                api_url=f"{self.endpoint}/v1.0/projects/{project_id}/timecard_entries",
-                additional_headers=headers,
-                params=params
-            )
+        params = {
+            "company_id": company_id,
+            "start_date": datetime.strftime(start_date, "%Y-%m-%d"),
+            "end_date": datetime.strftime(end_date, "%Y-%m-%d")
+        }
 
-            n_timecards = len(timecard_selection)
-            timecards += timecard_selection
-            page += 1 
+        if party_id is not None:
+            params["filters[party_id]"] = party_id
 
-        return timecards
+        for timecard_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timecard_entries",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page,
+            page=page
+        ):
+            yield from timecard_selection
 
-    def get_for_specified_period(self, company_id, start_date, end_date, page=1, per_page=100, party_id=None):
+    def get_for_specified_period(self, company_id, start_date, end_date, page=1, per_page=100, party_id=None, shard_days=7, max_workers=4):
         """
         Return a list of all timecard data for the given date range (inclusive on both ends)
         https://developers.procore.com/reference/rest/timecard-entries?version=latest#list-timecard-entries-company
@@ -146,41 +227,18 @@ class Timecards(Base):
             number of timecards to include per page
         party_id : int, default None
             procore People ID to filter by if included
+        shard_days : int, default 7
+            split the range into shards of this many days and fetch max_workers of them at once
+            None pages through the whole range serially
+        max_workers : int, default 4
+            number of shards fetched at once
 
         Returns
         -------
         timecards : list of dict
-            available timecard data
+            available timecard data, each id once
         """
-        headers = {
-            "Procore-Company-Id": f"{company_id}"
-        }
-
-        n_timecards = 1
-        timecards = []
-        while n_timecards > 0:
-            params = {
-                "company_id": company_id,
-                "page": page,
-                "per_page": per_page,
-                "start_date": datetime.strftime(start_date, "%Y-%m-%d"),
-                "end_date": datetime.strftime(end_date, "%Y-%m-%d")
-            }
-
-            if party_id is not None:
-                params["filters[party_id]"] = party_id
-
-            timecard_selection = self.get_request(
-                api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timecard_entries",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_timecards = len(timecard_selection)
-            timecards += timecard_selection
-            page += 1 
-
-        return timecards
+        return list(self.iter_for_specified_period(company_id=company_id, start_date=start_date, end_date=end_date, page=page, per_page=per_page, party_id=party_id, shard_days=shard_days, max_workers=max_workers))
 
     def create(self, company_id, project_id, data):
         """
@@ -257,19 +315,7 @@ class Timecards(Base):
                 raise ValueError(f"Cost code '{data['cost_code_id']}' not found in project '{project_id}'.")
 
         # Handle 'date' and 'datetime'
-        today = datetime.now()
-        if "date" not in data and "datetime" not in data:
-            # Both empty, default to today
-            data["date"] = today.strftime("%Y-%m-%d")
-            data["datetime"] = today.strftime("%Y-%m-%dT12:00:00Z")
-        elif "date" not in data:
-            # 'date' is empty, use the date from 'datetime'
-            dt = datetime.strptime(data["datetime"], "%Y-%m-%dT%H:%M:%SZ")
-            data["date"] = dt.strftime("%Y-%m-%d")
-        elif "datetime" not in data:
-            # 'datetime' is empty, use the 'date' and default time
-            dt_date = datetime.strptime(data["date"], "%Y-%m-%d")
-            data["datetime"] = dt_date.strftime("%Y-%m-%dT12:00:00Z")
+        _fill_dates(data)
 
         headers = {
             "Procore-Company-Id": f"{company_id}"
@@ -318,4 +364,160 @@ class Timecards(Base):
             api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timecard_entries/{timecard_id}",
             data=update_data,
             additional_headers=headers
-        )
\ No newline at end of file
+        )
+
+    def _lookup_tables(self, company_id, project_id, entries):
+        """
+        Downloads each reference listing the entries need exactly once
+
+        Returns
+        -------
+        tables : dict
+            people (email/name -> id), time_types (name -> id, plus known ids), and cost_codes (name -> id)
+        """
+        tables = {"people": {}, "time_types": {}, "cost_codes": {}}
+
+        if any("party_id" in entry and not isinstance(entry["party_id"], int) for entry in entries):
+            for person in self.people.iter_people(company_id=company_id):
+                email = (person.get("contact") or {}).get("email")
+                if email:
+                    tables["people"][email.lower()] = int(person["id"])
+                if person.get("name"):
+                    tables["people"].setdefault(person["name"].lower(), int(person["id"]))
+
+        if any(not isinstance(entry.get("timecard_time_type_id"), int) for entry in entries):
+            for time_type in self.get_time_types(company_id):
+                tables["time_types"][time_type["name"].lower()] = int(time_type["id"])
+
+        if any(isinstance(entry.get("cost_code_id"), str) for entry in entries):
+            for code in self.cost_codes.iter_codes(company_id=company_id, project_id=project_id):
+                tables["cost_codes"].setdefault(code["name"], int(code["id"]))
+
+        return tables
+
+    def _resolve_entry(self, company_id, project_id, data, tables, line_item_types):
+        """
+        Validates one entry and swaps names for ids from the lookup tables, like create() does per call
+
+        line_item_types caches the first line item type per cost code id, so each cost code is shown at most once
+        """
+        data = dict(data)
+
+        if "hours" not in data:
+            raise ValueError("Input data must have an 'hours' field.")
+        data["hours"] = str(data["hours"])
+
+        if "party_id" not in data:
+            raise ValueError("Input data must have a 'party_id' field.")
+        if not isinstance(data["party_id"], int):
+            person_id = tables["people"].get(str(data["party_id"]).lower())
+            if person_id is None:
+                raise ValueError(f"Person '{data['party_id']}' not found.")
+            data["party_id"] = person_id
+
+        time_type = data.get("timecard_time_type_id", "Salary")
+        if isinstance(time_type, str):
+            if time_type.lower() not in tables["time_types"]:
+                raise ValueError(f"Time type '{time_type}' not found.")
+            data["timecard_time_type_id"] = tables["time_types"][time_type.lower()]
+        elif not isinstance(time_type, int):
+            raise ValueError("'timecard_time_type_id' must be an integer or string.")
+
+        need_line_item = not isinstance(data.get("line_item_type_id"), int)
+        if "cost_code_id" in data:
+            if isinstance(data["cost_code_id"], str):
+                if data["cost_code_id"] not in tables["cost_codes"]:
+                    raise ValueError(f"Cost code '{data['cost_code_id']}' not found in project '{project_id}'.")
+                data["cost_code_id"] = tables["cost_codes"][data["cost_code_id"]]
+
+            if need_line_item:
+                cost_code_id = int(data["cost_code_id"])
+                if cost_code_id not in line_item_types:
+                    cost_code_data = self.cost_codes.show(company_id=company_id, project_id=project_id, cost_code_id=cost_code_id)
+                    types = cost_code_data.get("line_item_types", [])
+                    line_item_types[cost_code_id] = int(types[0]["id"]) if types else None
+                if line_item_types[cost_code_id] is None:
+                    raise ValueError(f"No line item types found for cost code {cost_code_id}")
+                data["line_item_type_id"] = line_item_types[cost_code_id]
+
+        _fill_dates(data)
+        return data
+
+    def create_many(self, company_id, project_id, entries, max_workers=4):
+        """
+        Creates many timecards in a project, e.g. a payroll import
+
+        People, time types, and cost codes are each downloaded once into lookup tables (cost code line item
+        types once per distinct cost code) instead of once per entry. Every entry is validated before anything
+        is sent; the valid ones are then posted on a bounded thread pool under the session's rate limit.
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        entries : list of dict
+            timecard data as accepted by create() - party_id, timecard_time_type_id, and cost_code_id may be names
+        max_workers : int, default 4
+            number of timecards posted at once
+
+        Returns
+        -------
+        report : list of dict
+            one per entry, in order, with row (index in entries), ok (boolean), timecard (response body or None),
+            and error (message or None)
+        """
+        tables = self._lookup_tables(company_id, project_id, entries)
+        line_item_types = {}
+
+        report = []
+        resolved = []
+        for row, entry in enumerate(entries):
+            try:
+                resolved.append((row, self._resolve_entry(company_id, project_id, entry, tables, line_item_types)))
+                report.append({"row": row, "ok": False, "timecard": None, "error": None})
+            except (ValueError, ProcoreException) as e:
+                report.append({"row": row, "ok": False, "timecard": None, "error": str(e)})
+
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        def post(item):
+            row, data = item
+            try:
+                report[row]["timecard"] = self.post_request(
+                    api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timecard_entries",
+                    additional_headers=headers,
+                    data={
+                        "project_id": project_id,
+                        "timecard_entry": data
+                    }
+                )
+                report[row]["ok"] = True
+            except ProcoreException as e:
+                report[row]["error"] = str(e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(post, resolved))
+
+        return report
+
+def _fill_dates(data):
+    """
+    Fills in whichever of date and datetime is missing, defaulting to today at noon
+    """
+    today = datetime.now()
+    if "date" not in data and "datetime" not in data:
+        # Both empty, default to today
+        data["date"] = today.strftime("%Y-%m-%d")
+        data["datetime"] = today.strftime("%Y-%m-%dT12:00:00Z")
+    elif "date" not in data:
+        # 'date' is empty, use the date from 'datetime'
+        dt = datetime.strptime(data["datetime"], "%Y-%m-%dT%H:%M:%SZ")
+        data["date"] = dt.strftime("%Y-%m-%d")
+    elif "datetime" not in data:
+        # 'datetime' is empty, use the 'date' and default time
+        dt_date = datetime.strptime(data["date"], "%Y-%m-%d")
+        data["datetime"] = dt_date.strftime("%Y-%m-%dT12:00:00Z")
@@ -1,11 +1,47 @@
 from datetime import datetime
 from ..base import Base
+from .shards import date_shards, iter_sharded
 
 class Timesheets(Base):
-    def __init__(self, access_token, server_url) -> None:
-        super().__init__(access_token, server_url)
+    def __init__(self, access_token, server_url, session=None) -> None:
+        super().__init__(access_token, server_url, session=session)
         self.endpoint = "/rest" # very basic since timesheets can be at project and company levels
 
+    def iter_for_pay_period(self, company_id, page=1, per_page=100):
+        """
+        Yields the timesheet data for the given pay period one at a time, requesting it a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of timesheets to request per page
+
+        Yields
+        ------
+        timesheet : dict
+            timesheet data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {
+            "company_id": company_id
+        }
+
+        for timesheet_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timesheets",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page,
+            page=page
+        ):
+            yield from timesheet_selection
+
     def get_for_pay_period(self, company_id, page=1, per_page=100):
         """
         Return a list of all timesheet data for the given pay period
@@ -25,32 +61,76 @@ class Timesheets(Base):
         timesheets : list of dict
             available timesheet data
         """
+        return list(self.iter_for_pay_period(company_id=company_id, page=page, per_page=per_page))
+
+    def iter_for_specified_period(self, company_id, start_date, end_date, page=1, per_page=100, party_id=None, shard_days=7, max_workers=4):
+        """
+        Yields the timesheet data for the given date range (inclusive on both ends) one at a time, requesting it a page at a time
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        start_date : datetime
+            start date of pay period (inclusive)
+        end_date : datetime
+            end date of pay period (inclusive)
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of timesheets to request per page
+        party_id : int, default None
+            procore People ID to filter by if included
+        shard_days : int, default 7
+            split the range into shards of this many days and fetch max_workers of them at once
+            None (or a page other than 1) pages through the whole range serially
+        max_workers : int, default 4
+            number of shards fetched at once
+
+        Yields
+        ------
+        timesheet : dict
+            timesheet data - in shard (date) order, each id once
+        """
+        shards = date_shards(start_date, end_date, shard_days) if shard_days is not None and page == 1 else []
+        if len(shards) > 1:
+            yield from iter_sharded(
+                lambda shard_start, shard_end: list(self.iter_for_specified_period(
+                    company_id=company_id,
+                    start_date=shard_start,
+                    end_date=shard_end,
+                    per_page=per_page,
+                    party_id=party_id,
+                    shard_days=None
+                )),
+                shards,
+                max_workers=max_workers
+            )
+            return
+
         headers = {
             "Procore-Company-Id": f"{company_id}"
         }
 
-        n_timesheets = 1
-        timesheets = []
-        while n_timesheets > 0:
-            params = {
-                "company_id": company_id,
-                "page": page,
-                "per_page": per_page
-            }
-
-            timesheet_selection = self.get_request(
-                api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timesheets",
-                additional_headers=headers,
-                params=params
-            )
+        params = {
+            "company_id": company_id,
+            "start_date": datetime.strftime(start_date, "%Y-%m-%d"),
+            "end_date": datetime.strftime(end_date, "%Y-%m-%d")
+        }
 
-            n_timesheets = len(timesheet_selection)
-            timesheets += timesheet_selection
-            page += 1 
+        if party_id is not None:
+            params["filters[party_id]"] = party_id
 
-        return timesheets
+        for timesheet_selection in self.iter_pages(
+            api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timesheets",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page,
+            page=page
+        ):
+            yield from timesheet_selection
 
-    def get_for_specified_period(self, company_id, start_date, end_date, page=1, per_page=100, party_id=None):
+    def get_for_specified_period(self, company_id, start_date, end_date, page=1, per_page=100, party_id=None, shard_days=7, max_workers=4):
         """
         Return a list of all timesheet data for the given date range (inclusive on both ends)
         https://developers.procore.com/reference/rest/timesheets?version=latest#list-timecard-data
@@ -69,38 +149,15 @@ class Timesheets(Base):
             number of timesheets to include per page
         party_id : int, default None
             procore People ID to filter by if included
+        shard_days : int, default 7
+            split the range into shards of this many days and fetch max_workers of them at once
+            None pages through the whole range serially
+        max_workers : int, default 4
+            number of shards fetched at once
 
         Returns
         -------
         timesheets : list of dict
-            available timesheet data
+            available timesheet data, each id once
         """
-        headers = {
-            "Procore-Company-Id": f"{company_id}"
-        }
-
-        n_timesheets = 1
-        timesheets = []
-        while n_timesheets > 0:
-            params = {
-                "company_id": company_id,
-                "page": page,
-                "per_page": per_page,
-                "start_date": datetime.strftime(start_date, "%Y-%m-%d"),
-                "end_date": datetime.strftime(end_date, "%Y-%m-%d")
-            }
-
-            if party_id is not None:
-                params["filters[party_id]"] = party_id
-
-            timesheet_selection = self.get_request(
-                api_url=f"{self.endpoint}/v1.0/companies/{company_id}/timesheets",
-                additional_headers=headers,
-                params=params
-            )
-
-            n_timesheets = len(timesheet_selection)
-            timesheets += timesheet_selection
-            page += 1 
-
-        return timesheets
\ No newline at end of file
+        return list(self.iter_for_specified_period(company_id=company_id, start_date=start_date, end_date=end_date, page=page, per_page=per_page, party_id=party_id, shard_days=shard_days, max_workers=max_workers))
\ No newline at end of file
@@ -0,0 +1,8 @@
+from .base import AsyncBase, create_client
+from .companies import Companies
+from .projects import Projects
+from .rfis import RFI
+from .submittals import Submittal
+from .tasks import Task
+from .change_events import ChangeEvent
+from .procore import AsyncProcore
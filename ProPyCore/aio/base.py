@@ -0,0 +1,271 @@
+try:
+    import httpx
+except ImportError: # optional dependency - only needed for the async client
+    httpx = None
+
+import asyncio
+
+from ..exceptions import raise_exception
+from ..utils.rate_limit import backoff_delay, retry_after
+from ..utils.session import IDEMPOTENT_METHODS, RETRY_ANY_METHOD, RETRY_IDEMPOTENT, rewind_files
+
+def create_client(max_connections=20, max_keepalive_connections=10, timeout=60.0):
+    """
+    Creates the pooled async HTTP client shared by AsyncProcore and its endpoints
+
+    Parameters
+    ----------
+    max_connections : int, default 20
+        maximum number of concurrent connections
+    max_keepalive_connections : int, default 10
+        number of idle connections to keep open
+    timeout : float, default 60.0
+        request timeout in seconds
+
+    Returns
+    -------
+    client : httpx.AsyncClient
+        pooled async client
+    """
+    if httpx is None:
+        raise ImportError("The async client requires httpx: pip install ProPyCore[async]")
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections
+    )
+
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+class AsyncBase:
+    """
+    Async counterpart of Base - same request methods, but as coroutines.
+    429s and gateway errors are retried like ProcoreSession does, waiting on Retry-After without blocking the loop.
+    """
+
+    def __init__(self, access_token, server_url, client=None, max_retries=3, backoff_factor=0.5, backoff_max=60.0) -> None:
+        """
+        Initializes important API access parameters
+
+        Parameters
+        ----------
+        max_retries : int, default 3
+            number of times a rate-limited (429) or unavailable (502/503/504) request is re-sent
+        backoff_factor : float, default 0.5
+            base delay in seconds for the jittered exponential backoff when no Retry-After is given
+        backoff_max : float, default 60.0
+            upper bound on a single backoff delay in seconds
+
+        Creates
+        -------
+        __access_token : str
+            token to access Procore resources
+        __server_url : str
+            base url to send GET/POST requests
+        __client : httpx.AsyncClient
+            pooled client to send requests through - shared when handed over by the AsyncProcore object
+        """
+        self.__access_token = access_token
+        self.__server_url = server_url
+        self.__client = client if client is not None else create_client()
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+
+    def _headers(self, additional_headers=None):
+        headers = {"Authorization": f"Bearer {self.__access_token}"}
+        if additional_headers is not None:
+            for key, value in additional_headers.items():
+                headers[key] = value
+
+        return headers
+
+    async def _send(self, method, api_url, **kwargs):
+        """
+        Sends a request through the shared client, retrying 429s and gateway errors
+        """
+        attempt = 0
+        while True:
+            response = await self.__client.request(method, self.__server_url + api_url, **kwargs)
+
+            retry = response.status_code in RETRY_ANY_METHOD or (response.status_code in RETRY_IDEMPOTENT and method in IDEMPOTENT_METHODS)
+            if attempt >= self.max_retries or not retry:
+                return response
+
+            delay = retry_after(response.headers)
+            if delay is None:
+                delay = backoff_delay(attempt, self.backoff_factor, self.backoff_max)
+
+            await response.aclose()
+            rewind_files(kwargs.get("files"))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_request(self, api_url, additional_headers=None, params=None):
+        """
+        Create a HTTP Get request
+
+        Parameters
+        ----------
+        api_url : str
+            endpoint for the specific API call
+        additional_headers : dict, default None
+            additional headers beyond Authorization
+        params : dict, default None
+            GET parameters to parse
+
+        Returns
+        -------
+        response : dict
+            GET response in json
+        """
+        response = await self._send(
+            "GET",
+            api_url,
+            headers=self._headers(additional_headers),
+            params=params
+        )
+
+        if response.is_success:
+            return response.json()
+        else:
+            raise_exception(response)
+
+    async def paginate(self, api_url, additional_headers=None, params=None, per_page=100, page=1):
+        """
+        Collects every page of a list endpoint until an empty page is returned
+
+        Parameters
+        ----------
+        api_url : str
+            endpoint for the specific API call
+        additional_headers : dict, default None
+            additional headers beyond Authorization
+        params : dict, default None
+            GET parameters to include with every page
+        per_page : int, default 100
+            number of items to request per page
+        page : int, default 1
+            first page to request
+
+        Returns
+        -------
+        items : list of dict
+            items from every page in page order
+        """
+        items = []
+        n_items = 1
+        while n_items > 0:
+            page_params = dict(params or {})
+            page_params["page"] = page
+            page_params["per_page"] = per_page
+
+            selection = await self.get_request(
+                api_url=api_url,
+                additional_headers=additional_headers,
+                params=page_params
+            )
+
+            n_items = len(selection)
+            items += selection
+            page += 1
+
+        return items
+
+    async def post_request(self, api_url, additional_headers=None, params=None, data=None, files=None):
+        """
+        Create a HTTP Post request
+
+        Parameters
+        ----------
+        api_url : str
+            endpoint for the specific API call
+        additional_headers : dict, default None
+            additional headers beyond Authorization
+        data : dict, default None
+            POST data to send
+        files : list of tuple, default None
+            open files to send to Procore
+
+        Returns
+        -------
+        response : dict
+            POST response details in json
+        """
+        headers = self._headers(additional_headers)
+        if files is None:
+            response = await self._send("POST", api_url, headers=headers, params=params, json=data)
+        else:
+            response = await self._send("POST", api_url, headers=headers, params=params, data=data, files=files)
+
+        if response.is_success:
+            return response.json()
+        else:
+            raise_exception(response)
+
+    async def patch_request(self, api_url, additional_headers=None, params=None, data=None, files=False):
+        """
+        Create a HTTP PATCH request
+
+        Parameters
+        ----------
+        api_url : str
+            endpoint for the specific API call
+        additional_headers : dict, default None
+            additional headers beyond Authorization
+        params : dict, default None
+            PATCH parameters to parse
+        data : dict, default None
+            PATCH data to send
+        files : dict or boolean, default False
+            False - send data as json
+            True - send data as form data without a file
+            dict - send data as form data with the given files
+
+        Returns
+        -------
+        response : dict
+            PATCH response details in json
+        """
+        headers = self._headers(additional_headers)
+        if files is False:
+            response = await self._send("PATCH", api_url, headers=headers, params=params, json=data)
+        elif files is True:
+            response = await self._send("PATCH", api_url, headers=headers, params=params, data=data)
+        else:
+            response = await self._send("PATCH", api_url, headers=headers, params=params, data=data, files=files)
+
+        if response.is_success:
+            return response.json()
+        else:
+            raise_exception(response)
+
+    async def delete_request(self, api_url, additional_headers=None, params=None):
+        """
+        Execute a HTTP DELETE request
+
+        Parameters
+        ----------
+        api_url : str
+            endpoint for the specific API call
+        additional_headers : dict, default None
+            additional headers beyond Authorization
+        params : dict, default None
+            DELETE parameters to parse
+
+        Returns
+        -------
+        response : dict
+            DELETE response status code
+        """
+        response = await self._send(
+            "DELETE",
+            api_url,
+            headers=self._headers(additional_headers),
+            params=params
+        )
+
+        if response.is_success:
+            return {"status_code": response.status_code}
+        else:
+            raise_exception(response)
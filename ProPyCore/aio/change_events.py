@@ -0,0 +1,135 @@
+from .base import AsyncBase
+from ..exceptions import NotFoundItemError
+
+class ChangeEvent(AsyncBase):
+    """
+    Async access to change events in a given project
+    """
+    def __init__(self, access_token, server_url, client=None) -> None:
+        super().__init__(access_token, server_url, client=client)
+
+        self.endpoint = "/rest/v1.0"
+
+    async def get_statuses(self, company_id, project_id):
+        """
+        Gets all the available change event statuses
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+
+        Returns
+        -------
+        change_event_statuses : dict
+            available change event statuses
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+        params = {
+            "project_id": project_id
+        }
+
+        return await self.get_request(
+            api_url=f"{self.endpoint}/change_event/statuses",
+            additional_headers=headers,
+            params=params
+        )
+
+    async def get(self, company_id, project_id, page=1, per_page=100):
+        """
+        Gets all the available change events
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of change events to include per page
+
+        Returns
+        -------
+        change_events : list of dict
+            available change events data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+        params = {
+            "project_id": project_id
+        }
+
+        return await self.paginate(
+            api_url=f"{self.endpoint}/change_events",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page,
+            page=page
+        )
+
+    async def show(self, company_id, project_id, event_id):
+        """
+        Shows the Change Event info
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        event_id : int
+            unique identifier for the event
+
+        Returns
+        -------
+        event_info : dict
+            specific event information
+        """
+        headers = {"Procore-Company-Id": f"{company_id}"}
+        params = {"project_id": project_id}
+
+        return await self.get_request(
+            api_url=f"{self.endpoint}/change_events/{event_id}",
+            additional_headers=headers,
+            params=params
+        )
+
+    async def find(self, company_id, project_id, identifier):
+        """
+        Finds specified change event
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        identifier : int or str
+            identifier for Change Event which can be id (int) or title (str)
+
+        Returns
+        -------
+        event_info : dict
+            event data
+        """
+        if isinstance(identifier, int):
+            key = "id"
+        else:
+            key = "title"
+
+        for event in await self.get(company_id=company_id, project_id=project_id):
+            if event[key] == identifier:
+                return await self.show(
+                    company_id=company_id,
+                    project_id=project_id,
+                    event_id=event["id"]
+                )
+
+        raise NotFoundItemError(f"Could not find Change Event {identifier}")
@@ -0,0 +1,62 @@
+from .base import AsyncBase
+from ..exceptions import NotFoundItemError
+
+class Companies(AsyncBase):
+    """
+    Async access to Companies with App access
+    """
+
+    def __init__(self, access_token, server_url, client=None) -> None:
+        super().__init__(access_token, server_url, client=client)
+
+        self.endpoint = "/rest/v1.0/companies"
+
+    async def get(self, page=1, per_page=10000):
+        """
+        Gets all companies where the data connection app is installed
+
+        Parameters
+        ----------
+        per_page : int, default 10000
+            number of companies to include
+
+        Returns
+        -------
+        companies : list of dict
+            list where each value is a dict with the company's id, active status (is_active), and name
+        """
+        params = {
+            "page": page,
+            "per_page": per_page,
+            "include_free_companies": True
+        }
+
+        return await self.get_request(
+            api_url=self.endpoint,
+            params=params
+        )
+
+    async def find(self, identifier):
+        """
+        Finds a company based on the identifier
+
+        Parameters
+        ----------
+        identifier : int or str
+            company id number or name
+
+        Returns
+        -------
+        company : dict
+            company-specific dictionary
+        """
+        if isinstance(identifier, int):
+            key = "id"
+        else:
+            key = "name"
+
+        for company in await self.get():
+            if company[key] == identifier:
+                return company
+
+        raise NotFoundItemError(f"Could not find company {identifier}")
@@ -0,0 +1,138 @@
+import asyncio
+
+from .base import create_client
+from ..exceptions import raise_exception
+from . import companies, projects, rfis, submittals, tasks, change_events
+
+class AsyncProcore:
+    """
+    Async counterpart of Procore - endpoint methods are coroutines that share one pooled client.
+    Use as an async context manager so the access token is fetched and the client is closed:
+
+    async with AsyncProcore(...) as procore:
+        rfis = await procore.gather(*[procore.rfis.get(company_id, project["id"]) for project in projects])
+
+    Unlike Procore, there is no client-side rate limiter and a 401 does not refresh the token: 429s and gateway
+    errors are retried after Retry-After (or a jittered backoff), and runs longer than the token's 2-hour
+    lifetime should call reset_access_token() in between - it rebuilds the endpoints with the new token.
+    """
+
+    def __init__(self, client_id, client_secret, redirect_uri, base_url, oauth_url, max_concurrency=16, max_connections=20, max_keepalive_connections=10, timeout=60.0) -> None:
+        """
+        Initialize the connection - the access token is fetched by reset_access_token() or on entering the context
+
+        Creates
+        -------
+        __client_id : str
+            app's client indentifier
+        __cliend_secret : str
+            app's secret access token
+        __redirect_uri : str
+            should be "" for Client Credentials Grant Type
+        __base_url : str
+            the base url for RESTful
+        __oauth_url : str
+            authorization url to set up access
+        __access_token : str
+            2-hour access token to pull/push data to Procore
+        __client : httpx.AsyncClient
+            connection-pooled client shared by every endpoint
+        max_concurrency : int
+            number of coroutines gather() lets run at once
+        """
+        self.__client_id = client_id
+        self.__client_secret = client_secret
+
+        self.__redirect_uri = redirect_uri
+        self.__base_url = base_url
+        self.__oauth_url = oauth_url
+
+        self.__access_token = None
+
+        self.__client = create_client(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            timeout=timeout
+        )
+
+        self.max_concurrency = max_concurrency
+
+    async def __aenter__(self):
+        await self.reset_access_token()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _init_endpoints(self):
+        self.companies = companies.Companies(access_token=self.__access_token, server_url=self.__base_url, client=self.__client)
+        self.projects = projects.Projects(access_token=self.__access_token, server_url=self.__base_url, client=self.__client)
+        self.rfis = rfis.RFI(access_token=self.__access_token, server_url=self.__base_url, client=self.__client)
+        self.submittals = submittals.Submittal(access_token=self.__access_token, server_url=self.__base_url, client=self.__client)
+        self.tasks = tasks.Task(access_token=self.__access_token, server_url=self.__base_url, client=self.__client)
+        self.change_events = change_events.ChangeEvent(access_token=self.__access_token, server_url=self.__base_url, client=self.__client)
+
+    async def get_access_token(self):
+        """
+        Gets access token using the Client Credentials Grant Type
+
+        Returns
+        -------
+        <access_token> : str
+            2-hour access token
+        """
+        post_data = {
+            "grant_type": "client_credentials",
+            "redirect_uri": self.__redirect_uri
+        }
+        response = await self.__client.post(
+            self.__base_url+"/oauth/token",
+            auth=(self.__client_id, self.__client_secret),
+            data=post_data
+        )
+        if not response.is_success:
+            raise_exception(response)
+
+        response_json = response.json()
+
+        return response_json["access_token"]
+
+    async def reset_access_token(self):
+        """
+        Gets a new access token
+        """
+        self.__access_token = await self.get_access_token()
+        self._init_endpoints()
+
+    async def gather(self, *aws, concurrency=None, return_exceptions=False):
+        """
+        Runs the given coroutines concurrently, at most `concurrency` at a time
+
+        Parameters
+        ----------
+        *aws : coroutine
+            endpoint calls to run, e.g. procore.rfis.get(company_id, project_id)
+        concurrency : int, default None
+            maximum number running at once - None uses max_concurrency
+        return_exceptions : boolean, default False
+            True - return exceptions in place of results
+            False - raise the first exception
+
+        Returns
+        -------
+        results : list
+            results in the same order as the given coroutines
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+
+        async def bounded(aw):
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*[bounded(aw) for aw in aws], return_exceptions=return_exceptions)
+
+    async def close(self):
+        """
+        Closes the pooled connections held by the shared client
+        """
+        await self.__client.aclose()
@@ -0,0 +1,68 @@
+from .base import AsyncBase
+from ..exceptions import NotFoundItemError
+
+class Projects(AsyncBase):
+    """
+    Async access to projects from a given company
+    """
+
+    def __init__(self, access_token, server_url, client=None) -> None:
+        super().__init__(access_token, server_url, client=client)
+
+        self.endpoint = "/rest/v1.1/projects"
+
+    async def get(self, company_id, status="All", per_page=300):
+        """
+        Gets a list of all the projects from a certain company
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        status : str enum, default "All"
+            status of the projects to get must be one of: ["Active", "Inactive", "All"]
+        per_page : int, default 300
+            number of projects to include. Max is 300 per v1.1 API.
+
+        Returns
+        -------
+        projects : list of dict
+            list where each value is a dict with the project's id, active status (is_active), and name
+        """
+        params = {
+            "company_id": company_id,
+            "filters[by_status]": status
+        }
+
+        return await self.paginate(
+            api_url=self.endpoint,
+            params=params,
+            per_page=per_page
+        )
+
+    async def find(self, company_id, identifier):
+        """
+        Finds a project based on the identifier
+
+        Parameters
+        ----------
+        company_id : int
+            company id that the project is under
+        identifier : int or str
+            project id number or project name
+
+        Returns
+        -------
+        project : dict
+            project-specific dictionary
+        """
+        if isinstance(identifier, int):
+            key = "id"
+        else:
+            key = "name"
+
+        for project in await self.get(company_id=company_id):
+            if project[key] == identifier:
+                return project
+
+        raise NotFoundItemError(f"Could not find project {identifier}")
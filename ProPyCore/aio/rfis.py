@@ -0,0 +1,102 @@
+from .base import AsyncBase
+from ..exceptions import NotFoundItemError
+
+class RFI(AsyncBase):
+    """
+    Async access to RFIs in a given project
+    """
+    def __init__(self, access_token, server_url, client=None) -> None:
+        super().__init__(access_token, server_url, client=client)
+
+        self.endpoint = "/rest/v1.0/projects"
+
+    async def get(self, company_id, project_id, page=1, per_page=100):
+        """
+        Gets all the available RFIs
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of rfis to include per page
+
+        Returns
+        -------
+        rfis : list of dict
+            available rfi data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        return await self.paginate(
+            api_url=f"{self.endpoint}/{project_id}/rfis",
+            additional_headers=headers,
+            per_page=per_page,
+            page=page
+        )
+
+    async def show(self, company_id, project_id, rfi_id):
+        """
+        Shows the RFI info
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        rfi_id : int
+            unique identifier for the RFI
+
+        Returns
+        -------
+        rfi_info : dict
+            specific rfi information
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        return await self.get_request(
+            api_url=f"{self.endpoint}/{project_id}/rfis/{rfi_id}",
+            additional_headers=headers,
+        )
+
+    async def find(self, company_id, project_id, identifier):
+        """
+        Finds specified RFI and returns data - wrapper for show method
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        identifier : int or str
+            identifier for RFI which can be id (int) or number (str)
+
+        Returns
+        -------
+        rfi_info : dict
+            RFI data
+        """
+        if isinstance(identifier, int):
+            key = "id"
+        else:
+            key = "number"
+
+        for rfi in await self.get(company_id=company_id, project_id=project_id):
+            if rfi[key] == identifier:
+                return await self.show(
+                    company_id=company_id,
+                    project_id=project_id,
+                    rfi_id=rfi["id"]
+                )
+
+        raise NotFoundItemError(f"Could not find RFI {identifier}")
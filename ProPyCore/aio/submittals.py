@@ -0,0 +1,110 @@
+from .base import AsyncBase
+from ..exceptions import NotFoundItemError
+
+class Submittal(AsyncBase):
+    """
+    Async access to submittals in a given project
+    """
+    def __init__(self, access_token, server_url, client=None) -> None:
+        super().__init__(access_token, server_url, client=client)
+
+        self.endpoint = "/rest" # Different version numbers for different endpoints so limited to this
+
+    async def get(self, company_id, project_id, page=1, per_page=100, status_ids=None):
+        """
+        Gets all the available submittals
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        page : int, default 1
+            first page to request
+        per_page : int, default 100
+            number of submittals to include per page
+        status_ids : list of int or str, default None
+            filter by status ID
+
+        Returns
+        -------
+        submittals : list of dict
+            available submittal data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {}
+        if status_ids is not None:
+            if isinstance(status_ids, list):
+                params["filters[status_id]"] = [str(status_id) for status_id in status_ids]
+            else:
+                params["filters[status_id]"] = [str(status_ids)]
+
+        return await self.paginate(
+            api_url=f"{self.endpoint}/v1.1/projects/{project_id}/submittals",
+            additional_headers=headers,
+            params=params,
+            per_page=per_page,
+            page=page
+        )
+
+    async def show(self, company_id, project_id, submittal_id):
+        """
+        Shows the Submittal info
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        submittal_id : int
+            unique identifier for the submittal
+
+        Returns
+        -------
+        submittal_info : dict
+            specific submittal information
+        """
+        headers = {"Procore-Company-Id": f"{company_id}"}
+
+        return await self.get_request(
+            api_url=f"{self.endpoint}/v1.1/projects/{project_id}/submittals/{submittal_id}",
+            additional_headers=headers,
+        )
+
+    async def find(self, company_id, project_id, identifier):
+        """
+        Finds specified submittal
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        identifier : int or str
+            identifier for Submittal which can be id (int) or title (str)
+
+        Returns
+        -------
+        submittal_info : dict
+            submittal data
+        """
+        if isinstance(identifier, int):
+            key = "id"
+        else:
+            key = "title"
+
+        for submittal in await self.get(company_id=company_id, project_id=project_id):
+            if submittal[key] == identifier:
+                return await self.show(
+                    company_id=company_id,
+                    project_id=project_id,
+                    submittal_id=submittal["id"]
+                )
+
+        raise NotFoundItemError(f"Could not find Submittal {identifier}")
@@ -0,0 +1,107 @@
+from .base import AsyncBase
+from ..exceptions import NotFoundItemError
+
+class Task(AsyncBase):
+    """
+    Async access to tasks in a given project
+    """
+    def __init__(self, access_token, server_url, client=None) -> None:
+        super().__init__(access_token, server_url, client=client)
+
+        self.endpoint = "/rest/v1.0/tasks"
+
+    async def get(self, company_id, project_id):
+        """
+        Gets all the available tasks
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+
+        Returns
+        -------
+        tasks : list of dict
+            available task data
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {
+            "project_id": project_id
+        }
+
+        return await self.paginate(
+            api_url=self.endpoint,
+            additional_headers=headers,
+            params=params,
+            per_page=100
+        )
+
+    async def show(self, company_id, project_id, task_id):
+        """
+        Shows the task info
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        task_id : int
+            unique identifier for the task
+
+        Returns
+        -------
+        task_info : dict
+            specific task information
+        """
+        headers = {
+            "Procore-Company-Id": f"{company_id}"
+        }
+
+        params = {
+            "project_id": project_id,
+        }
+
+        return await self.get_request(
+            api_url=f"{self.endpoint}/{task_id}",
+            additional_headers=headers,
+            params=params
+        )
+
+    async def find(self, company_id, project_id, identifier):
+        """
+        Finds specified tasks and returns data
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        identifier : int or str
+            identifier for task which can be id (int) or name (str)
+
+        Returns
+        -------
+        task_info : dict
+            task data
+        """
+        if isinstance(identifier, int):
+            key = "id"
+        else:
+            key = "name"
+
+        for task in await self.get(company_id=company_id, project_id=project_id):
+            if task[key] == identifier:
+                return await self.show(
+                    company_id=company_id,
+                    project_id=project_id,
+                    task_id=task["id"]
+                )
+
+        raise NotFoundItemError(f"Could not find task {identifier}")
@@ -58,6 +58,18 @@ class UnprocessableContentError(ProcoreException):
     """Non-unique field, 422 error."""
     pass
 
+class RateLimitError(ProcoreException):
+    """Too many requests for the current rate limit window, 429 error."""
+    pass
+
+class ServiceUnavailableError(ProcoreException):
+    """Procore is temporarily unavailable, 503 error."""
+    pass
+
+class IntegrityError(ProcoreException):
+    """Downloaded file does not match the expected size or checksum."""
+    pass
+
 def raise_exception(response):
     """
     Raises an exception based on the provided status code
@@ -79,8 +91,14 @@ def raise_exception(response):
     elif response.status_code == 422:
         raise UnprocessableContentError('422: A field that needs a unique value already exists', response.text)
 
+    elif response.status_code == 429:
+        raise RateLimitError('429: Rate limit exceeded - retry after {0} seconds'.format(response.headers.get("Retry-After", "?")), response.text)
+
     elif response.status_code == 500:
         raise InternalServerError('500: Internal server error', response.text)
 
+    elif response.status_code == 503:
+        raise ServiceUnavailableError('503: Service unavailable', response.text)
+
     else:
         raise ProcoreException('Error: {0}'.format(response.status_code), response.text)
\ No newline at end of file
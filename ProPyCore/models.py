@@ -0,0 +1,248 @@
+import json
+
+# declared field that is not in the payload - read as None and left out of to_dict()
+_MISSING = object()
+
+# built once - json.dumps() with separators builds a new encoder on every call
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+def _encode(value):
+    """
+    Compact JSON bytes of a nested object or list
+    """
+    return _ENCODER.encode(value).encode("utf-8")
+
+def _decode(value):
+    return json.loads(value) if type(value) is bytes else value
+
+class Record:
+    """
+    Compact, typed stand-in for an API response dict.
+
+    Subclasses declare the fields they care about in __slots__. Scalars are kept as-is, while nested objects,
+    lists, and every undeclared field are kept as compact JSON bytes and decoded only when read, so a large
+    listing takes a fraction of the memory of the dicts it came from and still converts back to the same dict.
+    A record built with from_json() does not decode anything until it is first read.
+    """
+    __slots__ = ("_rest",) # JSON bytes of the undeclared fields - the whole payload until a from_json() record is read
+
+    FIELDS = ()
+    _members = {} # field name -> slot descriptor
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        members = dict(cls._members)
+        for field in cls.__dict__.get("__slots__", ()):
+            members[field] = cls.__dict__[field]
+            # reads and writes go through a property that loads and decodes around the slot
+            setattr(cls, field, property(Record._getter(field), Record._setter(field)))
+
+        cls._members = members
+        cls.FIELDS = tuple(members)
+
+    @staticmethod
+    def _getter(field):
+        def get(self):
+            value = self._value(field)
+            return None if value is _MISSING else _decode(value)
+
+        return get
+
+    @staticmethod
+    def _setter(field):
+        def set(self, value):
+            self._load()
+            self._members[field].__set__(self, _encode(value) if isinstance(value, (dict, list)) else value)
+
+        return set
+
+    def __init__(self, **fields):
+        """
+        Parameters
+        ----------
+        **fields
+            field values, e.g. Rfi(id=1, subject="Door hardware") - fields a model does not declare are kept too
+        """
+        self._fill(fields)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Builds a record from a response dict
+
+        Parameters
+        ----------
+        data : dict
+            one record from an endpoint, e.g. an item of procore.rfis.get()
+
+        Returns
+        -------
+        record : Record
+        """
+        record = cls.__new__(cls)
+        record._fill(data)
+        return record
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds records from a listing
+
+        Parameters
+        ----------
+        rows : iterable of dict
+            e.g. procore.rfis.iter_rfis(company_id, project_id) - consumed one row at a time, so the dicts
+            of a streamed listing never pile up
+
+        Returns
+        -------
+        records : list of Record
+        """
+        return [cls.from_dict(row) for row in rows]
+
+    @classmethod
+    def from_json(cls, raw):
+        """
+        Builds a record from the JSON text of one object without decoding it
+
+        Parameters
+        ----------
+        raw : bytes or str
+            JSON object, e.g. a stored response body
+
+        Returns
+        -------
+        record : Record
+        """
+        record = cls.__new__(cls)
+        record._rest = raw.encode("utf-8") if isinstance(raw, str) else bytes(raw)
+        return record
+
+    def _fill(self, data):
+        for field, member in self._members.items():
+            value = data.get(field, _MISSING)
+            member.__set__(self, _encode(value) if isinstance(value, (dict, list)) else value)
+
+        rest = {key: value for key, value in data.items() if key not in self._members}
+        self._rest = _encode(rest) if rest else None
+
+    def _load(self):
+        """
+        Splits a from_json() payload into its fields the first time the record is read
+        """
+        if not self.FIELDS:
+            return
+        try:
+            self._members[self.FIELDS[0]].__get__(self)
+        except AttributeError:
+            self._fill(json.loads(self._rest))
+
+    def _value(self, field):
+        self._load()
+        return self._members[field].__get__(self)
+
+    def get(self, key, default=None):
+        """
+        Reads any field of the payload, declared or not
+
+        Parameters
+        ----------
+        key : str
+            field name
+        default : object, default None
+            returned when the payload does not have the field
+
+        Returns
+        -------
+        <value> : object
+            decoded value
+        """
+        if key in self._members:
+            value = self._value(key)
+            return default if value is _MISSING else _decode(value)
+
+        self._load()
+        return json.loads(self._rest).get(key, default) if self._rest else default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def to_dict(self):
+        """
+        Converts the record back to its response dict
+
+        Returns
+        -------
+        data : dict
+            declared fields first, then the rest of the payload
+        """
+        data = {}
+        for field in self.FIELDS:
+            value = self._value(field)
+            if value is not _MISSING:
+                data[field] = _decode(value)
+
+        if self._rest:
+            data.update(json.loads(self._rest))
+
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        shown = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS[:3])
+        return f"{type(self).__name__}({shown})"
+
+    def __reduce__(self):
+        return (type(self).from_dict, (self.to_dict(),))
+
+class Project(Record):
+    """
+    Project from projects.get()
+    """
+    __slots__ = ("id", "name", "display_name", "project_number", "active", "company", "created_at", "updated_at")
+
+class Person(Record):
+    """
+    Person from directory.people.get()
+    """
+    __slots__ = ("id", "name", "first_name", "last_name", "is_employee", "employee_id", "user_id", "contact", "origin_id", "updated_at")
+
+class Rfi(Record):
+    """
+    RFI from rfis.get()
+    """
+    __slots__ = ("id", "number", "subject", "status", "due_date", "assignees", "rfi_manager", "created_at", "updated_at")
+
+class Submittal(Record):
+    """
+    Submittal from submittals.get()
+    """
+    __slots__ = ("id", "number", "revision", "title", "status", "due_date", "specification_section", "created_at", "updated_at")
+
+class Task(Record):
+    """
+    Task from tasks.get()
+    """
+    __slots__ = ("id", "number", "title", "status", "due_date", "assignees", "created_at", "updated_at")
+
+class Document(Record):
+    """
+    File or folder from the documents listing
+    """
+    __slots__ = ("id", "name", "parent_id", "name_with_path", "document_type", "is_deleted", "is_recycle_bin", "size", "updated_at")
+
+class TimecardEntry(Record):
+    """
+    Timecard entry from time.timecards.get_for_specified_period()
+    """
+    __slots__ = ("id", "date", "hours", "time_in", "time_out", "billable", "description", "party", "timecard_time_type", "cost_code", "updated_at")
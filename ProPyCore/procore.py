@@ -1,14 +1,53 @@
-from .exceptions import *
-from .access import companies, generic_tools, projects, documents, rfis, directory, submittals, tasks, budgets, direct_costs, cost_codes, time, quality, photos, permissions, change_events
+import importlib
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
 
+from .exceptions import *
+
+from .utils.session import ProcoreSession
+from .utils.rate_limit import RateLimiter
+from .utils.credentials import AccessToken
+from .utils.cache import ResponseCache, ConditionalCache
+
 class Procore:
     """
     Main class which creates a connection with the Procore APIs using OAuth2 (Client Credentials Grant Type).
     This grant type allows access to Procore data without having to login as a specific user. 
+    Endpoints are built on first access and the access token is fetched on the first request.
     """
 
-    def __init__(self, client_id, client_secret, redirect_uri, base_url, oauth_url) -> None:
+    # endpoint attribute -> (module in ProPyCore.access, class)
+    _endpoints = {
+        # General
+        "companies": ("companies", "Companies"),
+        "projects": ("projects", "Projects"),
+        "permissions": ("permissions", "Permissions"),
+        # Documents
+        "folders": ("documents", "Folders"),
+        "files": ("documents", "Files"),
+        "photos": ("photos", "Photos"),
+        # Tools
+        "rfis": ("rfis", "RFI"),
+        "submittals": ("submittals", "Submittal"),
+        "tasks": ("tasks", "Task"),
+        "tools": ("generic_tools", "GenericTool"),
+        "change_events": ("change_events", "ChangeEvent"),
+        # People
+        "directory": ("directory", "Directory"),
+        # Financials
+        "budgets": ("budgets", "Budgets"),
+        "direct_costs": ("direct_costs", "DirectCosts"),
+        "cost_codes": ("cost_codes", "CostCodes"),
+        # Time
+        "time": ("time", "Time"),
+        # Quality
+        "quality": ("quality", "Quality"),
+    }
+
+    def __init__(self, client_id, client_secret, redirect_uri, base_url, oauth_url, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, rate_limit=None, burst=10, max_retries=3, refresh_margin=300, cache=None, conditional_cache=None) -> None:
         """
         Initialize the connection
 
@@ -24,8 +63,20 @@ class Procore:
             the base url for RESTful
         __oauth_url : str
             authorization url to set up access
-        __access_token : str
-            2-hour access token to pull/push data to Procore
+        __access_token : AccessToken
+            2-hour access token to pull/push data to Procore - shared by every endpoint and refreshed
+            refresh_margin seconds before it expires
+        __session : ProcoreSession
+            connection-pooled session shared by every endpoint - see ProcoreSession for the pool parameters
+        rate_limiter : RateLimiter
+            token bucket shared by every endpoint - refills at rate_limit requests per second (None to only
+            follow Procore's X-Rate-Limit-* headers) with up to burst requests back-to-back
+        cache : ResponseCache or str, default None
+            opt-in persistent cache for reference data (companies, projects, cost codes, trades, ...)
+            a str is used as the path of a ResponseCache with the default TTLs
+        conditional_cache : ConditionalCache
+            ETag/Last-Modified revalidation store shared by every endpoint, None when disabled -
+            pass True for a default ConditionalCache; its hits/misses/revalidations show the bandwidth saved
         """
         self.__client_id = client_id
         self.__client_secret = client_secret
@@ -34,70 +85,262 @@ class Procore:
         self.__base_url = base_url
         self.__oauth_url = oauth_url
 
-        self.__access_token = None
+        self.__access_token = AccessToken(self._fetch_token, refresh_margin=refresh_margin)
 
-        # get access token; resets from nothing
-        self.reset_access_token()
+        self.rate_limiter = RateLimiter(rate=rate_limit, burst=burst)
+        self.conditional_cache = ConditionalCache() if conditional_cache is True else conditional_cache
+        self.__session = ProcoreSession(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            rate_limiter=self.rate_limiter,
+            max_retries=max_retries,
+            cache=ResponseCache(cache) if isinstance(cache, str) else cache,
+            conditional_cache=self.conditional_cache
+        )
 
-        # create instances of procore endpoints
-        self._init_endpoints()
+        self.__endpoint_lock = threading.Lock()
 
-    def _init_endpoints(self):
-        # General
-        self.companies = companies.Companies(access_token=self.__access_token, server_url=self.__base_url)
-        self.projects = projects.Projects(access_token=self.__access_token, server_url=self.__base_url)
-        self.permissions = permissions.Permissions(access_token=self.__access_token, server_url=self.__base_url)
-        # Documents
-        self.folders = documents.Folders(access_token=self.__access_token, server_url=self.__base_url)
-        self.files = documents.Files(access_token=self.__access_token, server_url=self.__base_url)
-        self.photos = photos.Photos(access_token=self.__access_token, server_url=self.__base_url)
-        # Tools
-        self.rfis = rfis.RFI(access_token=self.__access_token, server_url=self.__base_url)
-        self.submittals = submittals.Submittal(access_token=self.__access_token, server_url=self.__base_url)
-        self.tasks = tasks.Task(access_token=self.__access_token, server_url=self.__base_url)
-        self.tools = generic_tools.GenericTool(access_token=self.__access_token, server_url=self.__base_url)
-        self.change_events = change_events.ChangeEvent(access_token=self.__access_token, server_url=self.__base_url)
-        # People
-        self.directory = directory.Directory(access_token=self.__access_token, server_url=self.__base_url)
-        # Financials
-        self.budgets = budgets.Budgets(access_token=self.__access_token, server_url=self.__base_url)
-        self.direct_costs = direct_costs.DirectCosts(access_token=self.__access_token, server_url=self.__base_url)
-        self.cost_codes = cost_codes.CostCodes(access_token=self.__access_token, server_url=self.__base_url)
-        # Time
-        self.time = time.Time(access_token=self.__access_token, server_url=self.__base_url)
-        # Quality
-        self.quality = quality.Quality(access_token=self.__access_token, server_url=self.__base_url)
+        # rebuilds this client in worker processes - see run_companies()
+        self.__settings = {
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "redirect_uri": redirect_uri,
+            "base_url": base_url,
+            "oauth_url": oauth_url,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "rate_limit": rate_limit,
+            "burst": burst,
+            "max_retries": max_retries,
+            "refresh_margin": refresh_margin,
+            "cache": cache,
+            "conditional_cache": conditional_cache is not None and conditional_cache is not False,
+        }
+        self.__scopes = {}
 
-    def get_access_token(self):
+    def __getattr__(self, name):
         """
-        Gets access token from authorization code previously obtained from the get_auth_code call.
-        
-        Parameters
-        ----------
-        code : str
-            temporary authorization code
+        Builds an endpoint the first time it is accessed and keeps it as a regular attribute
+        """
+        if name not in Procore._endpoints:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        with self.__endpoint_lock:
+            if name not in self.__dict__:
+                module_name, class_name = Procore._endpoints[name]
+                module = importlib.import_module(f".access.{module_name}", __package__)
+                endpoint = getattr(module, class_name)(access_token=self.__access_token, server_url=self.__base_url, session=self.__session)
+                setattr(self, name, endpoint)
+
+        return self.__dict__[name]
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(Procore._endpoints))
+
+    def _fetch_token(self):
+        """
+        Requests a token using the Client Credentials Grant Type
 
         Returns
         -------
-        <access_token> : str
-            2-hour access token
+        <response> : dict
+            token response with access_token and expires_in
         """
         client_auth = requests.auth.HTTPBasicAuth(self.__client_id, self.__client_secret)
         post_data = {
             "grant_type": "client_credentials",
             "redirect_uri": self.__redirect_uri
         }
-        response = requests.post(self.__base_url+"/oauth/token", auth=client_auth, data=post_data)
-        response_json = response.json()
+        response = self.__session.post(self.__base_url+"/oauth/token", auth=client_auth, data=post_data)
+        if not response.ok:
+            raise_exception(response)
+
+        return response.json()
+
+    def get_access_token(self):
+        """
+        Gets the current access token, refreshing it if it is about to expire
 
-        return response_json["access_token"]
+        Returns
+        -------
+        <access_token> : str
+            2-hour access token
+        """
+        return self.__access_token.value
 
     def reset_access_token(self):
         """
-        Gets a new access token
+        Gets a new access token - endpoints pick it up on their next request
         """
-        self.__access_token = self.get_access_token()
-        self._init_endpoints()
+        self.__access_token.refresh()
+
+    def fan_out(self, method, items, concurrency=16, key="project_id", timeout=None, fatal=(UnauthorizedClientError, InvalidTokenError, ExpiredTokenError), **kwargs):
+        """
+        Runs an endpoint method once per project (or company) on a bounded thread pool and streams the results
+        as they complete
+
+        Every call goes through this object's session, so they share its connection pool, access token, and
+        rate limiter - raise pool_maxsize to concurrency to keep a connection per worker.
+
+        Parameters
+        ----------
+        method : callable
+            endpoint method, e.g. procore.rfis.get
+        items : iterable of int, dict, or tuple
+            project ids, project response bodies (e.g. from procore.projects.iter_projects()), or
+            (company_id, project_id) pairs - with key="company_id", company ids or company response bodies
+        concurrency : int, default 16
+            maximum number of calls running at once
+        key : str, default "project_id"
+            keyword the item's id is passed to method as
+        timeout : float, default None
+            seconds each call may run before a TimeoutError is yielded for it - a running call cannot be
+            interrupted, so its thread finishes in the background and its result is dropped
+        fatal : tuple of Exception, default (UnauthorizedClientError, InvalidTokenError, ExpiredTokenError)
+            errors that stop the whole run - calls not yet started are cancelled and the error is raised,
+            as are errors other than ProcoreException and OSError
+        **kwargs
+            passed to every call, e.g. company_id=123 or filters={...}
+
+        Yields
+        ------
+        <item_id> : int
+            id of the project (or company)
+        <result> : object or Exception
+            what method returned, or the ProcoreException/OSError it raised
+        """
+        started = {} # submission number -> monotonic time the call started
+
+        def call(number, item):
+            started[number] = time.monotonic()
+            arguments = dict(kwargs)
+            if isinstance(item, tuple):
+                arguments["company_id"], item_id = item
+            elif isinstance(item, dict):
+                item_id = item["id"]
+                if key == "project_id" and "company_id" not in arguments and isinstance(item.get("company"), dict):
+                    arguments["company_id"] = item["company"]["id"]
+            else:
+                item_id = item
+            arguments[key] = item_id
+
+            return method(**arguments)
+
+        def item_id_of(item):
+            if isinstance(item, tuple):
+                return item[1]
+            return item["id"] if isinstance(item, dict) else item
+
+        def deadline_of(number):
+            return started[number] + timeout if timeout is not None and number in started else None
+
+        items = enumerate(items)
+        pending = {} # future -> (item id, submission number)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            while True:
+                # keep the pool busy without queueing every item up front
+                for number, item in items:
+                    pending[executor.submit(call, number, item)] = (item_id_of(item), number)
+                    if len(pending) >= concurrency:
+                        break
+
+                if not pending:
+                    break
+
+                wait_for = None
+                if timeout is not None:
+                    # calls still queued behind a timed-out one have not started - check back on them
+                    deadlines = [deadline_of(number) for _, number in pending.values() if number in started]
+                    wait_for = max(0, min(deadlines) - time.monotonic()) if deadlines else timeout
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    item_id, _ = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except fatal:
+                        raise
+                    except (ProcoreException, OSError) as e:
+                        result = e
+                    yield item_id, result
+
+                now = time.monotonic()
+                for future, (item_id, number) in list(pending.items()):
+                    deadline = deadline_of(number)
+                    if deadline is not None and now >= deadline and not future.done():
+                        del pending[future]
+                        future.cancel()
+                        yield item_id, TimeoutError(f"{getattr(method, '__qualname__', method)} for {key}={item_id} took longer than {timeout} seconds")
+        finally:
+            # stopped early, failed, or timed out - do not start anything else or wait on abandoned calls
+            for future in pending:
+                future.cancel() # shutdown's cancel_futures needs Python 3.9
+            executor.shutdown(wait=False)
+
+    def for_company(self, company_id):
+        """
+        Gets a view of this client scoped to one company
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+
+        Returns
+        -------
+        <scope> : CompanyScope
+            endpoints with company_id filled in, e.g. scope.rfis.get(project_id=456), and cached reference
+            data, e.g. scope.reference("vendors") - the same scope is returned for the same company
+        """
+        from .scope import CompanyScope
+
+        with self.__endpoint_lock:
+            if company_id not in self.__scopes:
+                self.__scopes[company_id] = CompanyScope(self, company_id)
+
+        return self.__scopes[company_id]
+
+    def run_companies(self, pipeline, company_ids, processes=4):
+        """
+        Runs a per-company pipeline in parallel worker processes, each with its own copy of this client and an
+        equal share of its rate limit - see scope.run_companies()
+
+        Parameters
+        ----------
+        pipeline : callable
+            module-level function taking a CompanyScope
+        company_ids : iterable of int or dict
+            companies to process, e.g. procore.companies.get()
+        processes : int, default 4
+            number of worker processes
+
+        Yields
+        ------
+        <company_id> : int
+            unique identifier for the company
+        <result> : object or Exception
+            what pipeline returned, or the ProcoreException/OSError it raised
+        """
+        from .scope import run_companies
+
+        yield from run_companies(pipeline, company_ids, self.__settings, processes=processes)
+
+    def close(self):
+        """
+        Closes the pooled connections held by the shared session
+        """
+        self.__session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def print_attributes(self):
         """
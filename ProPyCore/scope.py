@@ -0,0 +1,191 @@
+import functools
+import inspect
+import multiprocessing
+import threading
+
+from .exceptions import ProcoreException
+
+# reference data name -> (endpoint path on Procore, method) - all take only company_id
+REFERENCE_DATA = {
+    "projects": ("projects", "get"),
+    "people": ("directory.people", "get"),
+    "users": ("directory.users", "get"),
+    "vendors": ("directory.vendors", "get"),
+    "trades": ("directory.trades", "get"),
+    "roles": ("directory.roles", "list_all"),
+    "time_types": ("time.timecards", "get_time_types"),
+    "permission_templates": ("permissions", "get_company_templates"),
+    "regions": ("companies", "list_regions"),
+    "project_types": ("companies", "list_project_types"),
+    "project_stages": ("companies", "list_project_stages"),
+}
+
+def _bind(method, company_id):
+    """
+    Wraps an endpoint method so company_id is always passed - the remaining arguments keep their order
+    """
+    try:
+        parameters = inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return method
+    if "company_id" not in parameters:
+        return method
+
+    names = [
+        name for name, parameter in parameters.items()
+        if name != "company_id" and parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    ]
+
+    @functools.wraps(method)
+    def bound(*args, **kwargs):
+        if len(args) > len(names):
+            raise TypeError(f"{method.__qualname__}() takes {len(names)} positional arguments besides company_id but {len(args)} were given")
+
+        return method(company_id=company_id, **dict(zip(names, args)), **kwargs)
+
+    return bound
+
+class _CompanyEndpoint:
+    """
+    An endpoint (or group of endpoints, e.g. directory) with company_id filled in on every method
+    """
+
+    def __init__(self, endpoint, company_id) -> None:
+        self._endpoint = endpoint
+        self._company_id = company_id
+
+    def __getattr__(self, name):
+        value = getattr(self._endpoint, name)
+        if inspect.ismethod(value):
+            return _bind(value, self._company_id)
+        if type(value).__module__.startswith("ProPyCore.access"):
+            # sub-endpoints like directory.people or budgets.views
+            return _CompanyEndpoint(value, self._company_id)
+
+        return value
+
+    def __dir__(self):
+        return dir(self._endpoint)
+
+class CompanyScope:
+    """
+    One company's view of a Procore object: every endpoint method gets the company's Procore-Company-Id
+    without passing company_id, and company-level reference data (projects, people, vendors, time types, ...)
+    is fetched once and reused.
+
+    Endpoints, the session, and the rate limiter are the Procore object's own, so any number of scopes can
+    be used side by side, e.g. from Procore.fan_out().
+    """
+
+    def __init__(self, procore, company_id) -> None:
+        """
+        Parameters
+        ----------
+        procore : Procore
+            client to send requests through
+        company_id : int
+            unique identifier for the company
+
+        Creates
+        -------
+        _reference : dict
+            reference data name to response, filled by reference()
+        """
+        self.procore = procore
+        self.company_id = company_id
+
+        self._reference = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return _CompanyEndpoint(getattr(self.procore, name), self.company_id)
+
+    def reference(self, name, refresh=False):
+        """
+        Gets company-level reference data, fetching it only the first time
+
+        Parameters
+        ----------
+        name : str
+            one of REFERENCE_DATA, e.g. "vendors" or "time_types"
+        refresh : boolean, default False
+            True to fetch it again
+
+        Returns
+        -------
+        <response> : list or dict
+            the endpoint's response for this company
+        """
+        if name not in REFERENCE_DATA:
+            raise ValueError(f"Unknown reference data '{name}' - choose from {', '.join(REFERENCE_DATA)}")
+
+        with self._lock:
+            if refresh or name not in self._reference:
+                path, method_name = REFERENCE_DATA[name]
+                endpoint = functools.reduce(getattr, path.split("."), self.procore)
+                self._reference[name] = getattr(endpoint, method_name)(company_id=self.company_id)
+
+            return self._reference[name]
+
+    def clear_reference(self):
+        """
+        Drops the cached reference data so it is fetched again on next use
+        """
+        with self._lock:
+            self._reference.clear()
+
+# set in each worker process by _init_worker
+_worker_procore = None
+
+def _init_worker(settings):
+    global _worker_procore
+    from .procore import Procore
+
+    _worker_procore = Procore(**settings)
+
+def _run_company(task):
+    pipeline, company_id = task
+    try:
+        return company_id, pipeline(_worker_procore.for_company(company_id))
+    except (ProcoreException, OSError) as e:
+        return company_id, e
+
+def run_companies(pipeline, company_ids, settings, processes=4):
+    """
+    Runs a per-company pipeline in parallel worker processes
+
+    Every worker builds one Procore from settings and takes one company at a time, so each company is
+    processed by a single process and the companies are spread evenly. The client-side rate limit and burst are
+    split equally between the workers; every worker also follows Procore's X-Rate-Limit-* headers, which count
+    the app's requests across all of them.
+
+    Parameters
+    ----------
+    pipeline : callable
+        module-level function (it is pickled) taking a CompanyScope and returning a picklable result
+    company_ids : iterable of int or dict
+        companies to process - ids or company response bodies, e.g. procore.companies.get()
+    settings : dict
+        Procore keyword arguments (client_id, client_secret, redirect_uri, base_url, oauth_url, rate_limit, ...)
+    processes : int, default 4
+        number of worker processes
+
+    Yields
+    ------
+    <company_id> : int
+        unique identifier for the company
+    <result> : object or Exception
+        what pipeline returned, or the ProcoreException/OSError it raised
+    """
+    settings = dict(settings)
+    if settings.get("rate_limit") is not None:
+        settings["rate_limit"] = settings["rate_limit"] / processes
+    settings["burst"] = max(1, settings.get("burst", 10) // processes)
+
+    tasks = ((pipeline, company["id"] if isinstance(company, dict) else company) for company in company_ids)
+    pool = multiprocessing.Pool(processes=processes, initializer=_init_worker, initargs=(settings,))
+    try:
+        yield from pool.imap_unordered(_run_company, tasks, chunksize=1)
+    finally:
+        pool.terminate()
+        pool.join()
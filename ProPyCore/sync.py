@@ -0,0 +1,493 @@
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+
+# tool name -> how to reach its get() from a Procore object
+TOOLS = {
+    "rfis": lambda procore: procore.rfis.get,
+    "submittals": lambda procore: procore.submittals.get,
+    "tasks": lambda procore: procore.tasks.get,
+    "punch_items": lambda procore: procore.quality.punch.get,
+    "change_events": lambda procore: procore.change_events.get,
+}
+
+def _parse_timestamp(value):
+    """
+    Parses an ISO 8601 timestamp from Procore into an aware datetime
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+def _format_timestamp(value):
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def _is_deleted(record):
+    return bool(record.get("deleted_at") or record.get("is_deleted"))
+
+class SyncState:
+    """
+    SQLite store of high-water marks and known record ids per (company, project, tool).
+    Several processes can share one state file.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            location of the SQLite file - created if missing
+        """
+        self.path = path
+
+        self._local = threading.local()
+        self._connect() # create the schema up front
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS marks ("
+            "company_id TEXT, project_id TEXT, tool TEXT, updated_at TEXT, "
+            "PRIMARY KEY (company_id, project_id, tool))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "company_id TEXT, project_id TEXT, tool TEXT, record_id TEXT, "
+            "PRIMARY KEY (company_id, project_id, tool, record_id))"
+        )
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get_mark(self, company_id, project_id, tool):
+        """
+        Returns
+        -------
+        <updated_at> : str or None
+            latest updated_at synced so far, None before the first sync
+        """
+        row = self._connect().execute(
+            "SELECT updated_at FROM marks WHERE company_id = ? AND project_id = ? AND tool = ?",
+            (str(company_id), str(project_id), tool)
+        ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def get_ids(self, company_id, project_id, tool):
+        """
+        Returns
+        -------
+        <record_ids> : set of str
+            ids of the records synced so far
+        """
+        rows = self._connect().execute(
+            "SELECT record_id FROM records WHERE company_id = ? AND project_id = ? AND tool = ?",
+            (str(company_id), str(project_id), tool)
+        ).fetchall()
+
+        return {row[0] for row in rows}
+
+    def save(self, company_id, project_id, tool, updated_at, upserted_ids, deleted_ids):
+        """
+        Records a finished sync in one transaction
+        """
+        scope = (str(company_id), str(project_id), tool)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if updated_at is not None:
+                conn.execute("INSERT OR REPLACE INTO marks VALUES (?, ?, ?, ?)", scope + (updated_at,))
+            conn.executemany("INSERT OR IGNORE INTO records VALUES (?, ?, ?, ?)", [scope + (str(i),) for i in upserted_ids])
+            conn.executemany(
+                "DELETE FROM records WHERE company_id = ? AND project_id = ? AND tool = ? AND record_id = ?",
+                [scope + (str(i),) for i in deleted_ids]
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def reset(self, company_id, project_id, tool):
+        """
+        Forgets a scope so the next sync pulls everything again
+        """
+        scope = (str(company_id), str(project_id), tool)
+        conn = self._connect()
+        conn.execute("DELETE FROM marks WHERE company_id = ? AND project_id = ? AND tool = ?", scope)
+        conn.execute("DELETE FROM records WHERE company_id = ? AND project_id = ? AND tool = ?", scope)
+
+class IncrementalSync:
+    """
+    Pulls only the project tool records changed since the last sync, using filters[updated_at].
+    Supported tools are the keys of TOOLS: rfis, submittals, tasks, punch_items, and change_events.
+    """
+
+    def __init__(self, procore, state) -> None:
+        """
+        Parameters
+        ----------
+        procore : Procore
+            connection to pull through
+        state : SyncState or str
+            state store, or the path of one
+        """
+        self.procore = procore
+        self.state = SyncState(state) if isinstance(state, str) else state
+
+    def sync(self, company_id, project_id, tool, reconcile=False, commit=True):
+        """
+        Gets the records of a project tool that changed since the stored high-water mark
+
+        The first sync of a scope pulls everything. Records that come back with deleted_at/is_deleted
+        are reported as deletions; records removed outright only show up when reconcile is True.
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        tool : str
+            one of rfis, submittals, tasks, punch_items, or change_events
+        reconcile : boolean, default False
+            True - also list every record id and report the known ids that are gone (costs a full pull)
+        commit : boolean, default True
+            False - leave the state untouched so the changes can be committed once they are loaded
+
+        Returns
+        -------
+        changes : dict
+            company_id, project_id, tool, upserts (list of dict), deletions (list of id),
+            since (previous mark or None), and until (new mark or None)
+        """
+        if tool not in TOOLS:
+            raise ValueError(f"Unsupported tool '{tool}' - choose from {', '.join(TOOLS)}")
+
+        get = TOOLS[tool](self.procore)
+        since = self.state.get_mark(company_id, project_id, tool)
+
+        if since is None or reconcile:
+            records = get(company_id=company_id, project_id=project_id)
+        else:
+            # a day of headroom so server clocks ahead of ours do not drop records
+            until = _format_timestamp(datetime.now(timezone.utc) + timedelta(days=1))
+            records = get(company_id=company_id, project_id=project_id, filters={"updated_at": f"{since}...{until}"})
+
+        upserts = []
+        deletions = []
+        latest = _parse_timestamp(since) if since is not None else None
+        for record in records:
+            if _is_deleted(record):
+                deletions.append(record["id"])
+            else:
+                upserts.append(record)
+
+            if record.get("updated_at"):
+                updated_at = _parse_timestamp(record["updated_at"])
+                if latest is None or updated_at > latest:
+                    latest = updated_at
+
+        if reconcile:
+            known = self.state.get_ids(company_id, project_id, tool)
+            # soft-deleted records are already in deletions - count them as seen so they are not added twice
+            seen = {str(record["id"]) for record in upserts} | {str(record_id) for record_id in deletions}
+            deletions += [int(record_id) if record_id.isdigit() else record_id for record_id in known if record_id not in seen]
+
+            if since is not None:
+                # full listing - only pass on what is new or changed since the mark
+                mark = _parse_timestamp(since)
+                upserts = [
+                    record for record in upserts
+                    if str(record["id"]) not in known or not record.get("updated_at") or _parse_timestamp(record["updated_at"]) >= mark
+                ]
+
+        changes = {
+            "company_id": company_id,
+            "project_id": project_id,
+            "tool": tool,
+            "upserts": upserts,
+            "deletions": deletions,
+            "since": since,
+            "until": _format_timestamp(latest) if latest is not None else None,
+        }
+
+        if commit:
+            self.commit(changes)
+
+        return changes
+
+    def commit(self, changes):
+        """
+        Advances the high-water mark and the known ids for changes returned by sync(commit=False)
+
+        Parameters
+        ----------
+        changes : dict
+            result of sync()
+        """
+        self.state.save(
+            changes["company_id"],
+            changes["project_id"],
+            changes["tool"],
+            changes["until"],
+            [record["id"] for record in changes["upserts"]],
+            changes["deletions"],
+        )
+
+# kept inside the local root, so it travels with the mirrored share
+MANIFEST_NAME = ".procore_manifest.json"
+
+def _sha256_of(path):
+    from .access.documents.downloads import sha256_of
+    return sha256_of(path)
+
+class DirectorySync:
+    """
+    Two-way sync between a local directory and a folder in a project's Documents tool.
+    A JSON manifest records the size, mtime, and sha256 of every synced file along with the remote id and updated_at,
+    so a repeat sync only hashes files whose size or mtime moved and only transfers what changed on either side.
+    """
+
+    def __init__(self, procore, local_root, manifest_path=None) -> None:
+        """
+        Parameters
+        ----------
+        procore : Procore
+            connection to sync through
+        local_root : str
+            local directory to mirror
+        manifest_path : str, default None
+            location of the manifest - None keeps it in local_root as MANIFEST_NAME
+        """
+        self.procore = procore
+        self.local_root = os.path.abspath(local_root)
+        self.manifest_path = manifest_path if manifest_path is not None else os.path.join(self.local_root, MANIFEST_NAME)
+
+        self._lock = threading.Lock()
+
+    def _load_manifest(self, project_id, remote_root):
+        try:
+            with open(self.manifest_path) as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+        # a manifest for another project or folder says nothing about this one
+        if (manifest.get("project_id"), manifest.get("remote_root")) != (str(project_id), remote_root):
+            return {}
+
+        return manifest.get("files", {})
+
+    def _save_manifest(self, project_id, remote_root, files):
+        temp = f"{self.manifest_path}.tmp"
+        with open(temp, "w") as handle:
+            json.dump({"project_id": str(project_id), "remote_root": remote_root, "files": files}, handle, indent=1, sort_keys=True)
+        os.replace(temp, self.manifest_path)
+
+    def _scan(self, known):
+        """
+        Lists local files by relative path, hashing only those whose size or mtime differs from the manifest
+        """
+        local = {}
+        for directory, folders, filenames in os.walk(self.local_root):
+            folders[:] = sorted(folder for folder in folders if not folder.startswith("."))
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if filename.startswith(".") or filename.endswith(".part") or path == self.manifest_path:
+                    continue
+
+                relative = os.path.relpath(path, self.local_root).replace(os.sep, "/")
+                stat = os.stat(path)
+                entry = known.get(relative, {})
+                if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                    sha256 = entry["sha256"]
+                else:
+                    sha256 = _sha256_of(path)
+
+                local[relative] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+
+        return local
+
+    def plan(self, company_id, project_id, remote_root="", direction="both"):
+        """
+        Works out what a sync would do without transferring anything
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        remote_root : str, default ""
+            Documents folder path mirrored by local_root - "" is the project root
+        direction : str, default "both"
+            "push" uploads local changes, "pull" downloads remote changes, "both" does both
+
+        Returns
+        -------
+        plan : dict
+            create, update, download (lists of relative paths), conflicts, unchanged, and
+            local/remote/known lookups used by sync()
+        """
+        if direction not in ("push", "pull", "both"):
+            raise ValueError(f"Unsupported direction '{direction}' - choose from push, pull, or both")
+
+        remote_root = "/".join(segment for segment in remote_root.split("/") if segment)
+        known = self._load_manifest(project_id, remote_root)
+        local = self._scan(known)
+
+        index = self.procore.folders.path_index(company_id, project_id, refresh=True)
+        remote = {}
+        for path, doc in index.items(remote_root):
+            if doc.get("document_type") == "file" and path != remote_root:
+                relative = path[len(remote_root) + 1:] if remote_root else path
+                remote[relative] = doc
+
+        push = direction in ("push", "both")
+        pull = direction in ("pull", "both")
+        plan = {"create": [], "update": [], "download": [], "conflicts": [], "unchanged": [], "local": local, "remote": remote, "known": known}
+
+        for relative in sorted(set(local) | set(remote)):
+            entry = known.get(relative)
+            doc = remote.get(relative)
+            in_local = relative in local
+
+            local_changed = in_local and (entry is None or entry.get("sha256") != local[relative]["sha256"])
+            remote_changed = doc is not None and (
+                entry is None or entry.get("doc_id") != doc["id"] or entry.get("updated_at") != doc.get("updated_at")
+            )
+
+            if in_local and doc is None:
+                # deleted remotely after an earlier sync is left alone rather than uploaded again
+                if entry is None or local_changed:
+                    if push:
+                        plan["create"].append(relative)
+                else:
+                    plan["unchanged"].append(relative)
+            elif doc is not None and not in_local:
+                if entry is None and pull:
+                    plan["download"].append(relative)
+                elif entry is not None and remote_changed and pull:
+                    plan["download"].append(relative)
+                else:
+                    plan["unchanged"].append(relative)
+            elif entry is None:
+                # on both sides but never synced - trust matching sizes, otherwise the local copy wins
+                if doc.get("size") is not None and int(doc["size"]) == local[relative]["size"]:
+                    plan["unchanged"].append(relative)
+                elif push:
+                    plan["update"].append(relative)
+                elif pull:
+                    plan["download"].append(relative)
+            elif local_changed and remote_changed:
+                plan["conflicts"].append(relative)
+            elif local_changed and push:
+                plan["update"].append(relative)
+            elif remote_changed and pull:
+                plan["download"].append(relative)
+            else:
+                plan["unchanged"].append(relative)
+
+        return plan
+
+    def sync(self, company_id, project_id, remote_root="", direction="both", max_workers=4, upload_threshold=100 * 1024 * 1024):
+        """
+        Uploads new and changed local files and downloads new and changed remote ones
+
+        Missing remote folders are created parents first before any upload starts; uploads and downloads then run
+        on a bounded thread pool. Files changed on both sides since the last sync are reported as conflicts and left
+        alone, as are deletions on either side. The manifest is saved even when some transfers fail, so a rerun only
+        retries those.
+
+        Parameters
+        ----------
+        company_id : int
+            unique identifier for the company
+        project_id : int
+            unique identifier for the project
+        remote_root : str, default ""
+            Documents folder path mirrored by local_root - "" is the project root
+        direction : str, default "both"
+            "push" uploads local changes, "pull" downloads remote changes, "both" does both
+        max_workers : int, default 4
+            number of files transferred at once
+        upload_threshold : int, default 100 MB
+            files at least this large go through the segmented upload flow
+
+        Returns
+        -------
+        report : dict
+            created, updated, downloaded, conflicts, unchanged (lists of relative paths), folders_created (int),
+            and errors (relative path to exception)
+        """
+        plan = self.plan(company_id, project_id, remote_root=remote_root, direction=direction)
+        remote_root = "/".join(segment for segment in remote_root.split("/") if segment)
+        local, remote, known = plan["local"], plan["remote"], dict(plan["known"])
+        files, folders = self.procore.files, self.procore.folders
+
+        report = {"created": [], "updated": [], "downloaded": [], "conflicts": plan["conflicts"], "unchanged": plan["unchanged"], "folders_created": 0, "errors": {}}
+
+        for relative in plan["unchanged"]:
+            if relative in local and relative in remote:
+                known[relative] = dict(local[relative], doc_id=remote[relative]["id"], updated_at=remote[relative].get("updated_at"))
+
+        # parents before children, so every folder is created once
+        index = folders.path_index(company_id, project_id)
+        n_folders = len(index)
+        parents = {}
+        for relative in sorted({relative.rpartition("/")[0] for relative in plan["create"]}, key=lambda path: path.count("/")):
+            remote_path = "/".join(segment for segment in (remote_root, relative) if segment)
+            parents[relative] = folders.ensure_path(company_id, project_id, remote_path)
+        report["folders_created"] = len(index) - n_folders
+
+        def push(relative, kind):
+            path = os.path.join(self.local_root, *relative.split("/"))
+            if kind == "update":
+                doc_info = files.update(company_id, project_id, remote[relative]["id"], filepath=path)
+            elif local[relative]["size"] >= upload_threshold:
+                doc_info = files.upload(company_id, project_id, path, folder_id=parents[relative.rpartition("/")[0]])
+            else:
+                doc_info = files.create(company_id, project_id, path, folder_id=parents[relative.rpartition("/")[0]])
+
+            return dict(local[relative], doc_id=doc_info.get("id", remote.get(relative, {}).get("id")), updated_at=doc_info.get("updated_at"))
+
+        def pull(relative):
+            doc = remote[relative]
+            path = os.path.join(self.local_root, *relative.split("/"))
+            # the plan only downloads remote changes - an edit can keep the size, so never skip on it
+            files.download(company_id, project_id, doc["id"], path, force=True)
+            stat = os.stat(path)
+            return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": _sha256_of(path), "doc_id": doc["id"], "updated_at": doc.get("updated_at")}
+
+        jobs = [(relative, "created", lambda r=relative: push(r, "create")) for relative in plan["create"]]
+        jobs += [(relative, "updated", lambda r=relative: push(r, "update")) for relative in plan["update"]]
+        jobs += [(relative, "downloaded", lambda r=relative: pull(r)) for relative in plan["download"]]
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(job): (relative, outcome) for relative, outcome, job in jobs}
+                for future in as_completed(futures):
+                    relative, outcome = futures[future]
+                    try:
+                        entry = future.result()
+                    except Exception as e: # one bad file should not sink the rest of the mirror
+                        report["errors"][relative] = e
+                        continue
+
+                    with self._lock:
+                        known[relative] = entry
+                        report[outcome].append(relative)
+        finally:
+            # forget files that are gone on both sides
+            known = {relative: entry for relative, entry in known.items() if relative in local or relative in remote or relative in report["downloaded"]}
+            self._save_manifest(project_id, remote_root, known)
+
+        return report
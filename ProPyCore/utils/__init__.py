@@ -1 +1,3 @@
-from .logger import *
\ No newline at end of file
+from .logger import *
+from .session import *
+from .rate_limit import *
\ No newline at end of file
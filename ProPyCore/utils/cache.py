@@ -0,0 +1,343 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+
+# api path pattern -> seconds to keep the response; reference data that rarely changes
+DEFAULT_TTLS = {
+    "/rest/v1.0/companies": 24 * 3600,
+    "/rest/v1.0/companies/*/projects": 3600,
+    "/rest/v1.1/projects": 3600,
+    "/rest/v1.0/companies/*/project_regions": 24 * 3600,
+    "/rest/v1.0/companies/*/project_types": 24 * 3600,
+    "/rest/v1.0/companies/*/project_stages": 24 * 3600,
+    "/rest/v1.0/companies/*/timecard_time_types": 24 * 3600,
+    "/rest/v1.0/cost_codes": 3600,
+    "/rest/v1.0/cost_codes/*": 3600,
+    "/rest/v1.0/companies/*/trades": 24 * 3600,
+    "/rest/v1.0/companies/*/permission_templates*": 24 * 3600,
+    "/rest/v1.0/projects/*/permission_templates": 24 * 3600,
+    "/rest/v1.0/budget_views/*/budget_detail_columns": 24 * 3600,
+}
+
+# response headers kept with the body - pagination reads Total/Per-Page
+STORED_HEADERS = ("Total", "Per-Page")
+
+class ResponseCache:
+    """
+    Persistent GET response cache stored in SQLite.
+    Only api paths with a TTL are cached, keyed by url (with params) and Procore-Company-Id.
+    Several processes can share one cache file.
+    """
+
+    def __init__(self, path, ttls=None, default_ttl=None, max_entries=10000) -> None:
+        """
+        Parameters
+        ----------
+        path : str
+            location of the SQLite file - created if missing
+        ttls : dict, default None
+            api path pattern (fnmatch-style, e.g. "/rest/v1.0/companies/*/trades") to seconds
+            None uses DEFAULT_TTLS; patterns are tried in order
+        default_ttl : int, default None
+            seconds to keep responses from paths that match no pattern - None skips them
+        max_entries : int, default 10000
+            least recently used responses beyond this are evicted
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+        self._local = threading.local()
+        self._connect() # create the schema up front
+
+    def __reduce__(self):
+        # the connections stay behind - another process opens its own to the same file
+        return (ResponseCache, (self.path, self.ttls, self.default_ttl, self.max_entries))
+
+    def _connect(self):
+        """
+        One connection per thread and process - sqlite3 connections cannot be shared across either
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, path TEXT, company_id TEXT, body TEXT, headers TEXT, "
+            "expires_at REAL, accessed_at REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def _key(url, company_id):
+        return f"{company_id or ''}|{url}"
+
+    def ttl_for(self, api_path):
+        """
+        Finds how long responses from an api path are kept
+
+        Parameters
+        ----------
+        api_path : str
+            api path without server or params, e.g. /rest/v1.0/companies/8/trades
+
+        Returns
+        -------
+        ttl : int or None
+            seconds to keep the response, None when the path is not cached
+        """
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(api_path, pattern):
+                return ttl
+
+        return self.default_ttl
+
+    def get(self, url, company_id=None):
+        """
+        Looks up a live response
+
+        Parameters
+        ----------
+        url : str
+            full request url including params
+        company_id : int or str, default None
+            Procore-Company-Id the request was sent with
+
+        Returns
+        -------
+        <response> : tuple of (str, dict) or None
+            body text and stored headers, None on a miss or an expired entry
+        """
+        conn = self._connect()
+        key = self._key(url, company_id)
+        row = conn.execute("SELECT body, headers, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        if row[2] <= now:
+            conn.execute("DELETE FROM responses WHERE key = ? AND expires_at <= ?", (key, now))
+            return None
+
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return row[0], json.loads(row[1])
+
+    def set(self, url, api_path, company_id, body, headers, ttl):
+        """
+        Stores a response and evicts the least recently used ones beyond max_entries
+
+        Parameters
+        ----------
+        url : str
+            full request url including params
+        api_path : str
+            api path without server or params - used by invalidate()
+        company_id : int or str
+            Procore-Company-Id the request was sent with
+        body : str
+            response text
+        headers : dict-like
+            response headers - only STORED_HEADERS are kept
+        ttl : int
+            seconds to keep the response
+        """
+        now = time.time()
+        kept = {name: headers[name] for name in STORED_HEADERS if name in headers}
+
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, path, company_id, body, headers, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self._key(url, company_id), api_path, str(company_id or ""), body, json.dumps(kept), now + ttl, now)
+        )
+        conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def invalidate(self, pattern="*", company_id=None):
+        """
+        Drops cached responses
+
+        Parameters
+        ----------
+        pattern : str, default "*"
+            api path glob, e.g. "/rest/v1.0/cost_codes*" - "*" drops everything
+        company_id : int or str, default None
+            only drop responses for this company
+
+        Returns
+        -------
+        <n_removed> : int
+            number of responses dropped
+        """
+        conn = self._connect()
+        if company_id is None:
+            cursor = conn.execute("DELETE FROM responses WHERE path GLOB ?", (pattern,))
+        else:
+            cursor = conn.execute("DELETE FROM responses WHERE path GLOB ? AND company_id = ?", (pattern, str(company_id)))
+
+        return cursor.rowcount
+
+    def clear(self):
+        """
+        Drops every cached response
+        """
+        self.invalidate()
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        """
+        Closes this thread's connection
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+class ConditionalCache:
+    """
+    In-memory store of ETag/Last-Modified validators and the bodies they belong to.
+    Base.get_request sends If-None-Match/If-Modified-Since and serves 304 responses from here.
+    """
+
+    def __init__(self, max_entries=1000) -> None:
+        """
+        Parameters
+        ----------
+        max_entries : int, default 1000
+            least recently used responses beyond this are evicted
+
+        Creates
+        -------
+        hits : int
+            304 responses served from the stored body
+        misses : int
+            full responses downloaded for a url that was sent with validators or has none stored
+        revalidations : int
+            conditional requests sent
+        bytes_saved : int
+            body bytes not downloaded thanks to 304 responses
+        """
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validators(self, url, company_id=None):
+        """
+        Gets the conditional headers to send for a url
+
+        Parameters
+        ----------
+        url : str
+            full request url including params
+        company_id : int or str, default None
+            Procore-Company-Id the request is sent with
+
+        Returns
+        -------
+        headers : dict
+            If-None-Match and/or If-Modified-Since - empty when nothing is stored
+        """
+        with self._lock:
+            entry = self._entries.get(ResponseCache._key(url, company_id))
+            if entry is None:
+                return {}
+
+            self.revalidations += 1
+            headers = {}
+            if entry["etag"] is not None:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"] is not None:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+            return headers
+
+    def not_modified(self, url, company_id=None):
+        """
+        Records a 304 and returns the stored response
+
+        Returns
+        -------
+        <response> : tuple of (str, dict) or None
+            body text and stored headers, None if the entry was evicted in the meantime
+        """
+        key = ResponseCache._key(url, company_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += len(entry["body"])
+            return entry["body"], entry["headers"]
+
+    def store(self, url, company_id, body, headers):
+        """
+        Records a full response and keeps it when it carries an ETag or Last-Modified validator
+        """
+        key = ResponseCache._key(url, company_id)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if etag is None and last_modified is None:
+                self._entries.pop(key, None)
+                return
+
+            self._entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+                "headers": {name: headers[name] for name in STORED_HEADERS if name in headers},
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """
+        Returns
+        -------
+        <stats> : dict
+            hits, misses, revalidations, bytes_saved, and the number of stored entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._entries),
+            }
+
+    def clear(self):
+        """
+        Drops every stored response - the counters are kept
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,86 @@
+import threading
+import time
+
+class AccessToken:
+    """
+    Access token shared by the Procore object and all of its endpoints.
+    Endpoints read the value on every request, so a refresh reaches everyone without rebuilding them.
+    """
+
+    def __init__(self, fetch, refresh_margin=300) -> None:
+        """
+        Parameters
+        ----------
+        fetch : callable
+            returns the OAuth token response as a dict with access_token and (optionally) expires_in
+        refresh_margin : int, default 300
+            seconds before expiry to proactively refresh the token - capped at half the token's lifetime
+        """
+        self.refresh_margin = refresh_margin
+
+        self._fetch = fetch
+        self._value = None
+        self._expires_at = None # monotonic time, None when the token does not say
+        self._refresh_at = None # monotonic time to refresh at, None when the token does not say
+        self._lock = threading.Lock()
+
+    def _expiring(self):
+        if self._value is None:
+            return True
+
+        return self._refresh_at is not None and time.monotonic() >= self._refresh_at
+
+    @property
+    def value(self):
+        """
+        Current token - fetched on first use and refreshed shortly before it expires
+
+        Returns
+        -------
+        <access_token> : str
+            bearer token
+        """
+        if self._expiring():
+            with self._lock:
+                # another thread may have refreshed while we waited on the lock
+                if self._expiring():
+                    self._refresh()
+
+        return self._value
+
+    def refresh(self, stale=None):
+        """
+        Fetches a new token - only one thread fetches at a time
+
+        Parameters
+        ----------
+        stale : str, default None
+            token that was rejected; the fetch is skipped when another thread already replaced it
+
+        Returns
+        -------
+        <access_token> : str
+            bearer token
+        """
+        with self._lock:
+            if stale is None or self._value == stale:
+                self._refresh()
+
+            return self._value
+
+    def _refresh(self):
+        response = self._fetch()
+        self._value = response["access_token"]
+
+        expires_in = response.get("expires_in")
+        if expires_in is None:
+            self._expires_at = self._refresh_at = None
+        else:
+            now = time.monotonic()
+            self._expires_at = now + float(expires_in)
+            # a token shorter-lived than the margin would otherwise be refetched on every read
+            self._refresh_at = self._expires_at - min(self.refresh_margin, float(expires_in) / 2)
+
+    def __repr__(self):
+        # never expose or fetch the token when printed
+        return f"AccessToken(fetched={self._value is not None})"
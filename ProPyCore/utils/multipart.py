@@ -0,0 +1,148 @@
+import io
+import mimetypes
+import os
+import uuid
+
+# bytes read from a file handle at a time while streaming
+CHUNK_SIZE = 64 * 1024
+
+class MultipartEncoder(io.RawIOBase):
+    """
+    Streaming multipart/form-data body.
+    Form fields are encoded up front, file contents are read from their handles as the body is sent,
+    so memory stays at one chunk no matter how large the files are. Pass it as data= with content_type
+    as the Content-Type header; the length is known, so requests sends a Content-Length.
+    """
+
+    def __init__(self, fields=None, files=None, boundary=None) -> None:
+        """
+        Parameters
+        ----------
+        fields : dict, default None
+            form field name to value - list values repeat the field
+        files : list of tuple or dict, default None
+            same shapes requests accepts: (name, handle) or (name, (filename, handle[, content_type]))
+        boundary : str, default None
+            multipart boundary - random when not given
+
+        Creates
+        -------
+        content_type : str
+            Content-Type header value including the boundary
+        """
+        super().__init__()
+
+        self.boundary = boundary if boundary is not None else uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        self._parts = [] # bytes or (handle, start offset, length)
+        for name, values in (fields or {}).items():
+            for value in values if isinstance(values, (list, tuple)) else [values]:
+                self._parts.append(
+                    self._header(name) + b"\r\n" + str(value).encode("utf-8") + b"\r\n"
+                )
+
+        for name, value in (files.items() if isinstance(files, dict) else files or []):
+            filename, handle, content_type = self._unpack(value)
+            if content_type is None:
+                content_type = mimetypes.guess_type(filename or "")[0] or "application/octet-stream"
+            self._parts.append(self._header(name, filename) + f"Content-Type: {content_type}\r\n\r\n".encode("utf-8"))
+            start = handle.tell()
+            self._parts.append((handle, start, _remaining(handle, start)))
+            self._parts.append(b"\r\n")
+
+        self._parts.append(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+        self.len = sum(len(part) if isinstance(part, bytes) else part[2] for part in self._parts)
+        self._position = 0
+        self._part = 0
+        self._offset = 0 # within the current part
+
+    def _header(self, name, filename=None):
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+
+        return f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n".encode("utf-8")
+
+    @staticmethod
+    def _unpack(value):
+        if isinstance(value, tuple):
+            filename, handle = value[0], value[1]
+            content_type = value[2] if len(value) > 2 else None
+        else:
+            handle, content_type = value, None
+            filename = os.path.basename(getattr(handle, "name", "") or "") or None
+
+        if isinstance(handle, (bytes, str)):
+            handle = io.BytesIO(handle.encode("utf-8") if isinstance(handle, str) else handle)
+
+        return filename, handle, content_type
+
+    def __len__(self):
+        return self.len
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """
+        Only rewinding to the start is supported - enough to re-send the body on a retry
+        """
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartEncoder can only seek back to the start")
+
+        self._position = 0
+        self._part = 0
+        self._offset = 0
+        return 0
+
+    def readinto(self, buffer):
+        size = len(buffer)
+        written = 0
+        while written < size and self._part < len(self._parts):
+            part = self._parts[self._part]
+            if isinstance(part, bytes):
+                chunk = part[self._offset:self._offset + size - written]
+                length = len(part)
+            else:
+                handle, start, length = part
+                if self._offset == 0:
+                    handle.seek(start)
+                chunk = handle.read(min(size - written, length - self._offset, CHUNK_SIZE))
+                if not chunk and self._offset < length:
+                    raise IOError(f"{getattr(handle, 'name', 'file')} shrank while it was being uploaded")
+
+            buffer[written:written + len(chunk)] = chunk
+            written += len(chunk)
+            self._offset += len(chunk)
+            if self._offset >= length:
+                self._part += 1
+                self._offset = 0
+
+        self._position += written
+        return written
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+def _remaining(handle, start):
+    """
+    Bytes left in a handle from start, without reading it
+    """
+    try:
+        return os.fstat(handle.fileno()).st_size - start
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        end = handle.seek(0, io.SEEK_END)
+        handle.seek(start)
+        return end - start
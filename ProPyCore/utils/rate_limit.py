@@ -0,0 +1,153 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+__all__ = ["RateLimiter"]
+
+class RateLimiter:
+    """
+    Token bucket shared by every endpoint of one Procore object.
+    Paces requests to a client-side rate and pauses everyone once Procore reports the quota is spent.
+    """
+
+    def __init__(self, rate=None, burst=10) -> None:
+        """
+        Parameters
+        ----------
+        rate : float, default None
+            requests per second to refill the bucket with
+            None only follows the X-Rate-Limit-* headers sent back by Procore
+        burst : int, default 10
+            number of requests that can be sent back-to-back
+        """
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._remaining = None # requests left in the server window
+        self._reset_at = None # monotonic time the server window resets
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if self.rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _wait_time(self, now):
+        if self._reset_at is not None and now >= self._reset_at:
+            # server window rolled over - wait for the next response to tell us the new quota
+            self._remaining = None
+            self._reset_at = None
+
+        if self._remaining is not None and self._remaining <= 0:
+            return self._reset_at - now
+
+        if self.rate is not None and self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+
+        return 0
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now)
+                if wait <= 0:
+                    if self.rate is not None:
+                        self._tokens -= 1
+                    if self._remaining is not None:
+                        self._remaining -= 1
+                    return
+
+            time.sleep(wait)
+
+    def update(self, headers):
+        """
+        Syncs the limiter with the X-Rate-Limit-Remaining and X-Rate-Limit-Reset response headers
+
+        Parameters
+        ----------
+        headers : dict-like
+            response headers
+        """
+        try:
+            remaining = int(headers["X-Rate-Limit-Remaining"])
+            reset = float(headers["X-Rate-Limit-Reset"]) # epoch seconds
+        except (KeyError, TypeError, ValueError):
+            return
+
+        reset_at = time.monotonic() + max(0.0, reset - time.time())
+        with self._lock:
+            if self._reset_at is not None and abs(reset_at - self._reset_at) < 1 and self._remaining is not None:
+                # same window - responses can arrive out of order so keep the lower count
+                self._remaining = min(self._remaining, remaining)
+            else:
+                self._remaining = remaining
+            self._reset_at = reset_at
+
+    def pause(self, seconds):
+        """
+        Holds back every request for the given number of seconds, e.g. after a 429
+
+        Parameters
+        ----------
+        seconds : float
+            how long to pause
+        """
+        with self._lock:
+            self._remaining = 0
+            self._reset_at = max(self._reset_at or 0, time.monotonic() + seconds)
+
+def retry_after(headers):
+    """
+    Reads the Retry-After header
+
+    Parameters
+    ----------
+    headers : dict-like
+        response headers
+
+    Returns
+    -------
+    seconds : float or None
+        seconds to wait, None when the header is missing or unreadable
+    """
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt, backoff_factor=0.5, backoff_max=60.0):
+    """
+    Exponential backoff with full jitter
+
+    Parameters
+    ----------
+    attempt : int
+        number of retries already made, starting at 0
+    backoff_factor : float, default 0.5
+        base delay in seconds
+    backoff_max : float, default 60.0
+        upper bound on the delay in seconds
+
+    Returns
+    -------
+    seconds : float
+        random delay between 0 and min(backoff_max, backoff_factor * 2**attempt)
+    """
+    return random.uniform(0, min(backoff_max, backoff_factor * (2 ** attempt)))
@@ -0,0 +1,138 @@
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import backoff_delay, retry_after
+
+__all__ = ["ProcoreSession"]
+
+# statuses worth retrying - 429 is never processed so any method can be re-sent,
+# gateway errors only for methods that are safe to repeat
+RETRY_ANY_METHOD = (429,)
+RETRY_IDEMPOTENT = (502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+class ProcoreSession(requests.Session):
+    """
+    Connection-pooled HTTP session shared by the Procore object and all of its endpoints
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, rate_limiter=None, max_retries=3, backoff_factor=0.5, backoff_max=60.0, cache=None, conditional_cache=None) -> None:
+        """
+        Mounts a pooled adapter for http and https requests
+
+        Parameters
+        ----------
+        pool_connections : int, default 10
+            number of per-host connection pools to keep around
+        pool_maxsize : int, default 10
+            maximum number of connections to keep open to a single host
+        pool_block : boolean, default False
+            True - wait for a free connection once pool_maxsize is reached (hard per-host limit)
+            False - open a throwaway connection beyond pool_maxsize
+        keep_alive : boolean, default True
+            whether to reuse connections between requests
+        rate_limiter : RateLimiter, default None
+            limiter every request waits on - shared when handed over by the Procore object
+        max_retries : int, default 3
+            number of times a rate-limited (429) or unavailable (502/503/504) request is re-sent
+        backoff_factor : float, default 0.5
+            base delay in seconds for the jittered exponential backoff when no Retry-After is given
+        backoff_max : float, default 60.0
+            upper bound on a single backoff delay in seconds
+        cache : ResponseCache, default None
+            persistent cache that Base.get_request serves reference data from - None disables caching
+        conditional_cache : ConditionalCache, default None
+            ETag/Last-Modified store that Base.get_request revalidates against - None sends plain GETs
+        """
+        super().__init__()
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.cache = cache
+        self.conditional_cache = conditional_cache
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+
+    def request(self, method, url, *args, rate_limited=True, **kwargs):
+        """
+        Sends the request through the rate limiter and retries 429s and gateway errors
+
+        Waits for the Retry-After header when Procore sends one, otherwise backs off exponentially
+        with full jitter. The last response is returned as is once retries run out so the caller
+        can raise the matching exception. rate_limited=False skips the rate limiter, e.g. for storage
+        urls that do not count against Procore's quota.
+        """
+        limiter = self.rate_limiter if rate_limited else None
+
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+
+            response = super().request(method, url, *args, **kwargs)
+
+            if limiter is not None:
+                limiter.update(response.headers)
+
+            if attempt >= self.max_retries or not self._should_retry(method, response.status_code):
+                return response
+
+            delay = retry_after(response.headers)
+            if delay is None:
+                delay = backoff_delay(attempt, self.backoff_factor, self.backoff_max)
+            elif limiter is not None and response.status_code == 429:
+                # hold back the other threads too, not just this one
+                self.rate_limiter.pause(delay)
+
+            response.close()
+            rewind_files(kwargs.get("files"))
+            rewind_body(kwargs.get("data"))
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _should_retry(method, status_code):
+        if status_code in RETRY_ANY_METHOD:
+            return True
+
+        return status_code in RETRY_IDEMPOTENT and method.upper() in IDEMPOTENT_METHODS
+
+def rewind_files(files):
+    """
+    Seeks open file handles back to the start so a retried upload sends the whole file again
+    """
+    if not files:
+        return
+
+    values = files.values() if isinstance(files, dict) else [value for _, value in files]
+    for value in values:
+        handle = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+        if hasattr(handle, "seek"):
+            try:
+                handle.seek(0)
+            except (OSError, ValueError):
+                pass
+
+def rewind_body(data):
+    """
+    Seeks a streamed request body (e.g. a MultipartEncoder) back to the start so a retry sends all of it
+    """
+    if hasattr(data, "seek") and hasattr(data, "read"):
+        data.seek(0)
@@ -0,0 +1,80 @@
+"""
+Compares summing budget detail amounts by cost code and by division with a loop over row dicts against
+building a BudgetTable and running its vectorised group_sum(), on synthetic rows shaped like the budget_details
+response. The table build is counted because every get_table() call pays for it.
+
+Usage
+-----
+python benchmarks/budget_table.py --projects 200 --rows 500
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from ProPyCore.access.budgets.table import BudgetTable
+
+COLUMNS = ["Original Budget Amount", "Approved COs", "Revised Budget", "Direct Costs", "Committed Costs", "Projected Costs"]
+
+def make_rows(n_rows, rng):
+    rows = []
+    for i in range(n_rows):
+        division = rng.randint(1, 16)
+        row = {"id": i, "cost_code": f"{division:02d}-{rng.randint(100, 999)}", "category": rng.choice(["Labor", "Material", "Equipment", "Subcontract"])}
+        row.update({name: round(rng.uniform(0, 100000), 2) for name in COLUMNS})
+        rows.append(row)
+    return rows
+
+def loop_sums(rows):
+    by_code = defaultdict(lambda: defaultdict(float))
+    by_division = defaultdict(lambda: defaultdict(float))
+    for row in rows:
+        division = row["cost_code"].split("-")[0]
+        for name in COLUMNS:
+            value = row.get(name)
+            if value is not None:
+                by_code[row["cost_code"]][name] += float(value)
+                by_division[division][name] += float(value)
+    return by_code, by_division
+
+def table_sums(table):
+    divisions = [code.split("-")[0] for code in table.label("cost_code")]
+    return table.group_sum("cost_code"), table.group_sum(divisions)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=500, help="budget rows per project")
+    parser.add_argument("--repeats", type=int, default=5, help="reports run over the same data, e.g. several cuts of one pull")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    projects = [make_rows(args.rows, rng) for _ in range(args.projects)]
+    rows = [row for project in projects for row in project]
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        loop_sums(rows)
+    loop_seconds = (time.perf_counter() - start) / args.repeats
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        table = BudgetTable.from_rows(rows, column_names=COLUMNS)
+    build_seconds = (time.perf_counter() - start) / args.repeats
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        table_sums(table)
+    table_seconds = (time.perf_counter() - start) / args.repeats
+
+    # get_table() builds the table on every call, so one report pays for the build too
+    first_report = build_seconds + table_seconds
+    print(f"{len(rows)} rows x {len(COLUMNS)} columns")
+    print(f"dict loop           {loop_seconds * 1000:10.1f} ms per report")
+    print(f"table build         {build_seconds * 1000:10.1f} ms per get_table()")
+    print(f"table group_sum     {table_seconds * 1000:10.1f} ms per report")
+    print(f"one report (build + group_sum) vs loop: {loop_seconds / first_report:.2f}x")
+    print(f"{args.repeats} reports on one table vs loop: {loop_seconds * args.repeats / (build_seconds + table_seconds * args.repeats):.2f}x")
+
+if __name__ == "__main__":
+    main()
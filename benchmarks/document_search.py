@@ -0,0 +1,63 @@
+"""
+Compares the per-query fuzzywuzzy scan used by search() before SearchIndex against a reusable SearchIndex
+on a synthetic project listing.
+
+Usage
+-----
+python benchmarks/document_search.py --docs 20000 --queries 200
+"""
+import argparse
+import random
+import time
+
+from ProPyCore.access.documents.search import SearchIndex
+
+DISCIPLINES = ["A", "S", "M", "E", "P", "C", "L"]
+WORDS = ["Floor", "Plan", "Ceiling", "Foundation", "Details", "Sections", "Elevations", "Schedule", "Riser", "Roof", "Site", "Grading", "Lighting", "Power"]
+
+def make_docs(n, rng):
+    docs = []
+    for i in range(n):
+        words = " ".join(rng.sample(WORDS, 3))
+        docs.append({"id": i, "name": f"{rng.choice(DISCIPLINES)}-{rng.randint(100, 999)} {words} Rev{rng.randint(0, 9)}.pdf"})
+    return docs
+
+def scan(docs, query):
+    from fuzzywuzzy import fuzz
+    score, result = 0, None
+    for doc in docs:
+        temp_score = fuzz.partial_ratio(query, doc["name"])
+        if temp_score >= score:
+            score, result = temp_score, doc
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=5, help="queries for the slow scan baseline")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    docs = make_docs(args.docs, rng)
+    queries = [f"{rng.choice(DISCIPLINES)}-{rng.randint(100, 999)}" for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    for query in queries[:args.scan_queries]:
+        scan(docs, query)
+    per_scan = (time.perf_counter() - start) / args.scan_queries
+    print(f"fuzzywuzzy scan     {per_scan * 1000:10.2f} ms/query")
+
+    start = time.perf_counter()
+    index = SearchIndex(docs)
+    print(f"index build         {(time.perf_counter() - start) * 1000:10.2f} ms for {len(index)} docs")
+
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, limit=10)
+    per_query = (time.perf_counter() - start) / len(queries)
+    print(f"SearchIndex query   {per_query * 1000:10.2f} ms/query")
+    print(f"speedup: {per_scan / per_query:.1f}x")
+
+if __name__ == "__main__":
+    main()
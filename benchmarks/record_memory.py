@@ -0,0 +1,92 @@
+"""
+Compares the memory held by a listing kept as response dicts against the same listing kept as Document and
+TimecardEntry records, on synthetic rows shaped like the documents and timecard entry responses.
+
+Usage
+-----
+python benchmarks/record_memory.py --rows 100000
+"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from ProPyCore.models import Document, TimecardEntry
+
+def make_document(i, rng):
+    return {
+        "id": i,
+        "name": f"A-{rng.randint(100, 999)}.pdf",
+        "parent_id": rng.randint(1, 500),
+        "name_with_path": f"Drawings/Level {rng.randint(1, 20)}/A-{rng.randint(100, 999)}.pdf",
+        "document_type": "file",
+        "is_deleted": False,
+        "is_recycle_bin": False,
+        "size": rng.randint(10000, 50000000),
+        "private": False,
+        "read_only": False,
+        "is_tracked": False,
+        "tracked_folder": None,
+        "created_at": "2026-03-01T12:00:00Z",
+        "updated_at": "2026-03-02T08:30:00Z",
+        "file_versions": [{"id": i * 10, "created_at": "2026-03-01T12:00:00Z", "size": rng.randint(10000, 50000000), "url": f"https://storage.test/{i}"}],
+    }
+
+def make_timecard_entry(i, rng):
+    return {
+        "id": i,
+        "date": f"2026-03-{rng.randint(1, 28):02d}",
+        "hours": str(rng.choice([4.0, 8.0, 10.0])),
+        "time_in": None,
+        "time_out": None,
+        "billable": True,
+        "description": "",
+        "party": {"id": rng.randint(1, 2000), "name": f"Worker {rng.randint(1, 2000)}"},
+        "timecard_time_type": {"id": 1, "time_type": "Regular Time"},
+        "cost_code": {"id": rng.randint(1, 300), "full_code": f"0{rng.randint(1, 9)}-{rng.randint(100, 999)}", "name": "Concrete"},
+        "login_information": {"id": 7, "name": "Foreman"},
+        "created_at": "2026-03-01T12:00:00Z",
+        "updated_at": "2026-03-02T08:30:00Z",
+    }
+
+def measure(build):
+    # timed on its own - tracing allocations slows the build down several times
+    start = time.perf_counter()
+    build()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, size, seconds
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for label, model, make in (("documents", Document, make_document), ("timecard entries", TimecardEntry, make_timecard_entry)):
+        # JSON text per row, as a streamed listing hands them over a page at a time
+        payloads = [json.dumps(make(i, rng)) for i in range(args.rows)]
+
+        _, dict_bytes, dict_seconds = measure(lambda: [json.loads(payload) for payload in payloads])
+        records, record_bytes, record_seconds = measure(lambda: [model.from_dict(json.loads(payload)) for payload in payloads])
+        _, lazy_bytes, lazy_seconds = measure(lambda: [model.from_json(payload) for payload in payloads])
+
+        start = time.perf_counter()
+        total = sum(record.size or 0 for record in records) if model is Document else sum(float(record.hours) for record in records)
+        read_seconds = time.perf_counter() - start
+
+        print(f"{args.rows} {label}")
+        print(f"dicts               {dict_bytes / 2**20:8.1f} MiB   {dict_seconds * 1000:8.1f} ms to build")
+        print(f"records             {record_bytes / 2**20:8.1f} MiB   {record_seconds * 1000:8.1f} ms to build")
+        print(f"records (from_json) {lazy_bytes / 2**20:8.1f} MiB   {lazy_seconds * 1000:8.1f} ms to build")
+        print(f"reading one field of every record: {read_seconds * 1000:.1f} ms (total {total:.0f})")
+        print(f"memory saved: {1 - record_bytes / dict_bytes:.0%}")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares per-request latency of one-off requests against the pooled ProcoreSession
+using a local stub server that mimics a paginated Procore list endpoint.
+
+Usage
+-----
+python benchmarks/session_latency.py --requests 500
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from ProPyCore.access.base import Base
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive so the pooled session can reuse connections
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = json.dumps([{"id": i, "name": f"Item {i}"} for i in range(25)]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+def time_requests(label, send, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        send()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {n} requests in {elapsed:.3f}s -> {elapsed / n * 1000:.3f} ms/request")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = start_server()
+    server_url = f"http://127.0.0.1:{server.server_address[1]}"
+    api_url = "/rest/v1.0/projects/1/rfis"
+
+    unpooled = time_requests(
+        "requests.get",
+        lambda: requests.get(server_url + api_url, headers={"Authorization": "Bearer token"}).json(),
+        args.requests
+    )
+
+    base = Base(access_token="token", server_url=server_url)
+    pooled = time_requests(
+        "ProcoreSession",
+        lambda: base.get_request(api_url=api_url),
+        args.requests
+    )
+
+    print(f"speedup: {unpooled / pooled:.2f}x")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
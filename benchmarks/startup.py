@@ -0,0 +1,78 @@
+"""
+Measures the cold-start cost of ProPyCore: `import ProPyCore`, constructing Procore, and the first request.
+Each sample runs in a fresh interpreter so nothing is cached between runs. Procore talks to a local stub
+server, so the numbers reflect client overhead rather than network latency.
+
+Usage
+-----
+python benchmarks/startup.py --runs 20
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SAMPLE = """
+import json, time
+start = time.perf_counter()
+import ProPyCore
+imported = time.perf_counter()
+procore = ProPyCore.Procore(client_id="id", client_secret="secret", redirect_uri="", base_url="{url}", oauth_url="{url}")
+constructed = time.perf_counter()
+procore.companies.get()
+requested = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "construct": constructed - imported,
+    "first request": requested - constructed,
+}}))
+"""
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _send(self, body):
+        body = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send({"access_token": "token", "expires_in": 5400})
+
+    def do_GET(self):
+        page = 1 if "page=1" in self.path else 2
+        self._send([{"id": 1, "name": "Company"}] if page == 1 else [])
+
+    def log_message(self, *args):
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    code = SAMPLE.format(url=f"http://127.0.0.1:{server.server_address[1]}")
+
+    samples = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output))
+
+    for stage in samples[0]:
+        times = [sample[stage] * 1000 for sample in samples]
+        print(f"{stage:<15} median {statistics.median(times):8.2f} ms   max {max(times):8.2f} ms")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,12 @@ setup(
     url="https://github.com/rogers-obrien-rad/ProPyCore",
     packages=find_packages(exclude=["snippets", "tests"]),
     install_requires=requirements,
+    extras_require={
+        "async": ["httpx"],
+        "search": ["rapidfuzz"],
+        "tables": ["numpy"],
+        "export": ["pyarrow"]
+    },
     tests_require=[
         'pytest',
         'pytest-mock'
@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from ProPyCore.aio import AsyncProcore, RFI
+from ProPyCore.exceptions import NotFoundItemError, UnauthorizedClientError
+
+
+def mock_client(pages):
+    """
+    Creates an AsyncClient whose transport serves the given pages in order
+    """
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        page = int(request.url.params.get("page", 1))
+        body = pages[page - 1] if page <= len(pages) else []
+        return httpx.Response(200, json=body)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+def test_get_rfis_paginates():
+    client, requests = mock_client([[{"id": 1, "number": "RFI-1"}, {"id": 2, "number": "RFI-2"}]])
+    rfi = RFI(access_token="token", server_url="https://api.test", client=client)
+
+    response = asyncio.run(rfi.get(company_id=123, project_id=456))
+
+    assert response == [{"id": 1, "number": "RFI-1"}, {"id": 2, "number": "RFI-2"}]
+    assert len(requests) == 2
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert requests[0].headers["Procore-Company-Id"] == "123"
+    assert requests[0].url.path == "/rest/v1.0/projects/456/rfis"
+
+def test_find_rfi_not_found():
+    client, _ = mock_client([[{"id": 1, "number": "RFI-1"}]])
+    rfi = RFI(access_token="token", server_url="https://api.test", client=client)
+
+    with pytest.raises(NotFoundItemError):
+        asyncio.run(rfi.find(company_id=123, project_id=456, identifier="RFI-9"))
+
+def test_gather_bounds_concurrency():
+    procore = AsyncProcore("id", "secret", "", "https://api.test", "https://api.test", max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def job(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    results = asyncio.run(procore.gather(*[job(i) for i in range(6)]))
+
+    assert results == list(range(6))
+    assert peak == 2
+
+def test_bad_credentials_raise_procore_error(mocker):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(401, json={"error": "invalid_client"})))
+    mocker.patch("ProPyCore.aio.procore.create_client", return_value=client)
+    procore = AsyncProcore("id", "wrong", "", "https://api.test", "https://api.test")
+
+    with pytest.raises(UnauthorizedClientError):
+        asyncio.run(procore.get_access_token())
+
+def test_get_rfis_starts_at_page():
+    client, requests = mock_client([[{"id": 1}], [{"id": 2}]])
+    rfi = RFI(access_token="token", server_url="https://api.test", client=client)
+
+    response = asyncio.run(rfi.get(company_id=123, project_id=456, page=2))
+
+    assert response == [{"id": 2}]
+    assert [request.url.params["page"] for request in requests] == ["2", "3"]
+
+def test_rate_limited_request_is_retried(mocker):
+    sleep = mocker.patch("ProPyCore.aio.base.asyncio.sleep", new=mocker.AsyncMock())
+    responses = iter([httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={"id": 1})])
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses)))
+    rfi = RFI(access_token="token", server_url="https://api.test", client=client)
+
+    response = asyncio.run(rfi.show(company_id=123, project_id=456, rfi_id=1))
+
+    assert response == {"id": 1}
+    sleep.assert_awaited_once_with(2.0)
@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import MagicMock
+from ProPyCore.access.base import Base
+from ProPyCore.utils.session import ProcoreSession
+
+
+@pytest.fixture
+def session():
+    session = MagicMock(spec=ProcoreSession)
+    response = MagicMock(ok=True)
+    response.json.return_value = [{"id": 1}]
+    session.get.return_value = response
+    return session
+
+def test_get_request_uses_shared_session(session):
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    response = base.get_request(api_url="/rest/v1.0/rfis", additional_headers={"Procore-Company-Id": "1"}, params={"page": 1})
+
+    assert response == [{"id": 1}]
+    session.get.assert_called_once_with(
+        "https://api.test/rest/v1.0/rfis?page=1",
+        headers={"Authorization": "Bearer token", "Procore-Company-Id": "1"}
+    )
+
+def test_default_session_is_pooled():
+    base = Base(access_token="token", server_url="https://api.test")
+    assert isinstance(base._Base__session, ProcoreSession)
+
+def test_session_pool_configuration():
+    session = ProcoreSession(pool_connections=4, pool_maxsize=32, pool_block=True, keep_alive=False)
+    adapter = session.get_adapter("https://api.procore.com")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "close"
+
+def paged_session(pages, headers=None):
+    """
+    Mock session that serves the given pages by the page parameter of the url
+    """
+    session = MagicMock(spec=ProcoreSession)
+
+    def get(url, headers=None, **kwargs):
+        page = int(url.split("page=")[1].split("&")[0])
+        response = MagicMock(ok=True)
+        response.json.return_value = pages[page - 1] if page <= len(pages) else []
+        response.headers = page_headers
+        return response
+
+    page_headers = headers if headers is not None else {}
+    session.get.side_effect = get
+    return session
+
+def test_iter_pages_with_total_header_skips_empty_page():
+    pages = [[{"id": i}] for i in range(1, 8)]
+    session = paged_session(pages, headers={"Total": "7", "Per-Page": "1"})
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    result = list(base.iter_pages(api_url="/rest/v1.0/rfis", per_page=1))
+
+    assert result == pages
+    assert session.get.call_count == 7
+
+def test_iter_pages_without_headers_looks_ahead_in_order():
+    pages = [[{"id": i}] for i in range(1, 11)]
+    session = paged_session(pages)
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    result = list(base.iter_pages(api_url="/rest/v1.0/rfis", per_page=1))
+
+    assert result == pages
+
+def test_iter_pages_stops_when_closed():
+    pages = [[{"id": i}] for i in range(1, 101)]
+    session = paged_session(pages, headers={"Total": "100", "Per-Page": "1"})
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    pager = base.iter_pages(api_url="/rest/v1.0/rfis", per_page=1)
+    assert next(pager) == pages[0]
+    assert next(pager) == pages[1]
+    pager.close()
+
+    assert session.get.call_count <= 2 + Base.page_workers
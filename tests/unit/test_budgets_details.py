@@ -44,3 +44,35 @@ def test_detail_not_found(budget_details_instance, mocker):
     detail = next((d for d in mock_get_response if d['id'] == 999), None)
 
     assert detail is None
+
+ROWS = [
+    {"id": 1, "cost_code": "01-100", "category": "Labor", "Original Budget Amount": "1,000.00", "Direct Costs": 250.0},
+    {"id": 2, "cost_code": "01-100", "category": "Material", "Original Budget Amount": 500, "Direct Costs": None},
+    {"id": 3, "cost_code": "03-300", "category": "Labor", "Original Budget Amount": 2000, "Direct Costs": 1200.5},
+]
+
+def test_get_table_uses_view_columns(budget_details_instance, mocker):
+    np = pytest.importorskip("numpy")
+    mocker.patch.object(budget_details_instance.columns, "get", return_value=[{"id": 1, "name": "Original Budget Amount"}, {"id": 2, "name": "Direct Costs"}])
+    mocker.patch.object(budget_details_instance, "post_request", return_value=ROWS)
+
+    table = budget_details_instance.get_table(company_id=123, project_id=456, budget_view_id=789)
+
+    assert sorted(table.columns) == ["Direct Costs", "Original Budget Amount"]
+    assert sorted(table.labels) == ["category", "cost_code", "id"]
+    assert table.column("Original Budget Amount").dtype == np.float64
+    assert table.total() == {"Original Budget Amount": 3500.0, "Direct Costs": 1450.5}
+
+def test_table_group_sum(budget_details_instance):
+    pytest.importorskip("numpy")
+    from ProPyCore.access.budgets.table import BudgetTable
+    table = BudgetTable.from_rows(ROWS, column_names=["Original Budget Amount", "Direct Costs"])
+
+    by_code = table.group_sum("cost_code").to_rows()
+    divisions = table.group_sum([code.split("-")[0] for code in table.label("cost_code")], columns=["Direct Costs"]).to_rows()
+
+    assert by_code == [
+        {"cost_code": "01-100", "Original Budget Amount": 1500.0, "Direct Costs": 250.0},
+        {"cost_code": "03-300", "Original Budget Amount": 2000.0, "Direct Costs": 1200.5},
+    ]
+    assert divisions == [{"group": "01", "Direct Costs": 250.0}, {"group": "03", "Direct Costs": 1200.5}]
@@ -0,0 +1,49 @@
+import pytest
+from ProPyCore.access.budgets import Budgets
+from ProPyCore.exceptions import NoPrivilegeError
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+@pytest.fixture
+def budgets(mocker):
+    mocker.patch("ProPyCore.access.base.Base.__init__", return_value=None)
+    budgets = Budgets(access_token="token", server_url="https://api.test")
+
+    def iter_views(company_id, project_id):
+        if project_id == 3:
+            raise NoPrivilegeError("403: no access")
+        return iter([{"id": 10 + project_id}])
+
+    mocker.patch.object(budgets.views, "iter_views", side_effect=iter_views)
+    mocker.patch.object(budgets.columns, "get", return_value=[{"id": 1, "name": "Original Budget Amount"}, {"id": 2, "name": "Direct Costs"}])
+    mocker.patch.object(budgets.details, "get", side_effect=lambda company_id, project_id, budget_view_id: [
+        {"id": f"{project_id}-{i}", "cost_code": "01-100", "Original Budget Amount": "1,000.00", "Direct Costs": None}
+        for i in range(5)
+    ])
+    return budgets
+
+def test_export_writes_partitioned_typed_dataset(budgets, tmp_path):
+    report = budgets.export(company_id=8, project_ids=[1, {"id": 2}, 3], root=str(tmp_path), max_workers=2, batch_size=2)
+
+    assert sorted((row["project_id"], row.get("rows")) for row in report) == [(1, 5), (2, 5), (3, None)]
+    assert isinstance(next(row for row in report if row["project_id"] == 3)["error"], NoPrivilegeError)
+
+    dataset = ds.dataset(str(tmp_path), format="parquet", partitioning="hive")
+    table = dataset.to_table()
+    assert table.num_rows == 10
+    assert table.schema.field("Original Budget Amount").type == pa.float64()
+    assert table.schema.field("cost_code").type == pa.string()
+    assert sorted(set(table.column("project_id").to_pylist())) == [1, 2]
+    assert sum(table.column("Original Budget Amount").to_pylist()) == 10000.0
+
+    parquet_file = pq.ParquetFile(next(tmp_path.glob("company_id=8/project_id=1/budget_view_id=11/*.parquet")))
+    assert parquet_file.num_row_groups == 3
+
+def test_export_arrow_format(budgets, tmp_path):
+    budgets.export(company_id=8, project_ids=[1], root=str(tmp_path), file_format="arrow")
+
+    table = ds.dataset(str(tmp_path), format="arrow", partitioning="hive").to_table()
+    assert table.num_rows == 5
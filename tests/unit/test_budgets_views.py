@@ -21,7 +21,7 @@ def test_get_budget_views(budget_views_instance, mocker):
 def test_find_view_by_id(budget_views_instance, mocker):
     # Mock the get method to return a list of budget views
     mock_get_response = [{'id': 1, 'name': 'View-1'}, {'id': 2, 'name': 'View-2'}]
-    mocker.patch.object(budget_views_instance, 'get', return_value=mock_get_response)
+    mocker.patch.object(budget_views_instance, 'get_request', side_effect=[mock_get_response, []])
 
     view_info = budget_views_instance.find(company_id=123, project_id=456, identifier=1)
 
@@ -31,7 +31,7 @@ def test_find_view_by_id(budget_views_instance, mocker):
 def test_find_view_by_name(budget_views_instance, mocker):
     # Mock the get method to return a list of budget views
     mock_get_response = [{'id': 1, 'name': 'View-1'}, {'id': 2, 'name': 'View-2'}]
-    mocker.patch.object(budget_views_instance, 'get', return_value=mock_get_response)
+    mocker.patch.object(budget_views_instance, 'get_request', side_effect=[mock_get_response, []])
 
     view_info = budget_views_instance.find(company_id=123, project_id=456, identifier='View-2')
 
@@ -41,7 +41,7 @@ def test_find_view_by_name(budget_views_instance, mocker):
 def test_find_view_not_found(budget_views_instance, mocker):
     # Mock the get method to return a list of budget views
     mock_get_response = [{'id': 1, 'name': 'View-1'}, {'id': 2, 'name': 'View-2'}]
-    mocker.patch.object(budget_views_instance, 'get', return_value=mock_get_response)
+    mocker.patch.object(budget_views_instance, 'get_request', side_effect=[mock_get_response, []])
 
     with pytest.raises(NotFoundItemError):
         budget_views_instance.find(company_id=123, project_id=456, identifier='Nonexistent View')
@@ -0,0 +1,122 @@
+import multiprocessing
+import pytest
+from unittest.mock import MagicMock
+from ProPyCore.access.base import Base
+from ProPyCore.utils.cache import ConditionalCache, ResponseCache
+from ProPyCore.utils.session import ProcoreSession
+
+URL = "https://api.test/rest/v1.0/companies/8/trades?page=1"
+PATH = "/rest/v1.0/companies/8/trades"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+def test_ttl_only_for_reference_paths(cache):
+    assert cache.ttl_for(PATH) == 24 * 3600
+    assert cache.ttl_for("/rest/v1.0/projects/1/rfis") is None
+
+def test_roundtrip_is_scoped_by_company(cache):
+    cache.set(URL, PATH, 8, '[{"id": 1}]', {"Total": "1", "ETag": "x"}, ttl=60)
+
+    assert cache.get(URL, 8) == ('[{"id": 1}]', {"Total": "1"})
+    assert cache.get(URL, 9) is None
+
+def test_expired_entries_are_dropped(cache, mocker):
+    cache.set(URL, PATH, 8, "[]", {}, ttl=60)
+    mocker.patch("ProPyCore.utils.cache.time.time", return_value=10 ** 12)
+
+    assert cache.get(URL, 8) is None
+    assert len(cache) == 0
+
+def test_least_recently_used_is_evicted(tmp_path, mocker):
+    clock = mocker.patch("ProPyCore.utils.cache.time.time", return_value=1000.0)
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    for i in range(2):
+        clock.return_value += 1
+        cache.set(f"{URL}{i}", PATH, 8, "[]", {}, ttl=60)
+
+    clock.return_value += 1
+    cache.get(f"{URL}0", 8) # 1 is now the least recently used
+    clock.return_value += 1
+    cache.set(f"{URL}2", PATH, 8, "[]", {}, ttl=60)
+
+    assert cache.get(f"{URL}0", 8) is not None
+    assert cache.get(f"{URL}1", 8) is None
+    assert len(cache) == 2
+
+def test_invalidate_by_pattern_and_company(cache):
+    cache.set(URL, PATH, 8, "[]", {}, ttl=60)
+    cache.set("https://api.test/rest/v1.0/companies", "/rest/v1.0/companies", None, "[]", {}, ttl=60)
+
+    assert cache.invalidate("/rest/v1.0/companies/*/trades", company_id=9) == 0
+    assert cache.invalidate("/rest/v1.0/companies/*/trades") == 1
+    assert len(cache) == 1
+
+def _write_entries(path, start):
+    cache = ResponseCache(path)
+    for i in range(start, start + 50):
+        cache.set(f"{URL}{i}", PATH, 8, "[]", {}, ttl=60)
+
+def test_processes_share_one_file(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    ResponseCache(path).close()
+    processes = [multiprocessing.Process(target=_write_entries, args=(path, start)) for start in (0, 50, 100)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0, 0, 0]
+    assert len(ResponseCache(path)) == 150
+
+def test_get_request_served_from_cache(cache):
+    session = MagicMock(spec=ProcoreSession)
+    session.cache = cache
+    response = MagicMock(ok=True, status_code=200, text='[{"id": 1, "name": "Electrical"}]', headers={})
+    response.json.return_value = [{"id": 1, "name": "Electrical"}]
+    session.get.return_value = response
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    for _ in range(2):
+        trades = base.get_request(api_url=PATH, additional_headers={"Procore-Company-Id": "8"}, params={"page": 1})
+
+    assert trades == [{"id": 1, "name": "Electrical"}]
+    assert session.get.call_count == 1
+
+    session.post.return_value = MagicMock(ok=True, status_code=201)
+    base.post_request(api_url=PATH, additional_headers={"Procore-Company-Id": "8"}, data={"name": "Plumbing"})
+    assert len(cache) == 0
+
+def test_conditional_get_serves_304_from_stored_body():
+    conditional = ConditionalCache()
+    session = MagicMock(spec=ProcoreSession)
+    session.cache = None
+    session.conditional_cache = conditional
+    body = '[{"id": 1, "subject": "Door hardware"}]'
+    full = MagicMock(ok=True, status_code=200, text=body, headers={"ETag": 'W/"abc"', "Total": "1"})
+    full.json.return_value = [{"id": 1, "subject": "Door hardware"}]
+    not_modified = MagicMock(ok=True, status_code=304, text="", headers={"ETag": 'W/"abc"'})
+    session.get.side_effect = [full, not_modified]
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    first = base.get_request(api_url="/rest/v1.0/projects/1/rfis", params={"page": 1})
+    second = base.get_request(api_url="/rest/v1.0/projects/1/rfis", params={"page": 1})
+
+    assert first == second == [{"id": 1, "subject": "Door hardware"}]
+    assert "If-None-Match" not in session.get.call_args_list[0].kwargs["headers"]
+    assert session.get.call_args_list[1].kwargs["headers"]["If-None-Match"] == 'W/"abc"'
+    assert conditional.stats() == {"hits": 1, "misses": 1, "revalidations": 1, "bytes_saved": len(body), "entries": 1}
+
+def test_conditional_cache_skips_responses_without_validators():
+    conditional = ConditionalCache(max_entries=1)
+    conditional.store(URL, 8, "[]", {})
+    assert conditional.validators(URL, 8) == {}
+
+    conditional.store(URL, 8, "[]", {"Last-Modified": "Tue, 01 Sep 2026 10:00:00 GMT"})
+    conditional.store(f"{URL}2", 8, "[]", {"ETag": '"b"'})
+    assert conditional.validators(URL, 8) == {}
+    assert conditional.validators(f"{URL}2", 8) == {"If-None-Match": '"b"'}
@@ -1,6 +1,6 @@
 import pytest
 from ProPyCore.access.cost_codes import CostCodes
-from ProPyCore.exceptions import NotFoundItemError
+from ProPyCore.exceptions import NotFoundItemError, NotFoundClientError
 
 # Fixture for CostCodes instance
 @pytest.fixture
@@ -45,8 +45,20 @@ def test_find_cost_code_by_id(cost_codes_instance, mocker):
 
 def test_find_cost_code_not_found(cost_codes_instance, mocker):
     # Mock the get method to return a list of cost codes
-    mock_get_response = [{'id': 1, 'name': 'Code 1'}, {'id': 2, 'name': 'Code 2'}]
-    mocker.patch.object(cost_codes_instance, 'get', return_value=mock_get_response)
+    mocker.patch.object(cost_codes_instance, 'get_request', side_effect=NotFoundClientError('404: Client ID doesn\'t exist'))
 
     with pytest.raises(NotFoundItemError):
-        cost_codes_instance.find(company_id=123, project_id=456, identifier=999)
\ No newline at end of file
+        cost_codes_instance.find(company_id=123, project_id=456, identifier=999)
+
+def test_find_cost_code_by_name_stops_at_match(cost_codes_instance, mocker):
+    # Mock the get_request method with more pages than are needed to find the code
+    mock_response_page_1 = [{'id': 1, 'name': 'Code 1'}, {'id': 2, 'name': 'Code 2'}]
+    mock_show_response = {'id': 2, 'name': 'Code 2'}
+
+    mocker.patch.object(cost_codes_instance, 'get_request', return_value=mock_response_page_1)
+    mocker.patch.object(cost_codes_instance, 'show', return_value=mock_show_response)
+
+    cost_code = cost_codes_instance.find(company_id=123, project_id=456, identifier='Code 2')
+
+    assert cost_code == mock_show_response
+    assert cost_codes_instance.get_request.call_count == 1
\ No newline at end of file
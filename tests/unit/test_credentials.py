@@ -0,0 +1,85 @@
+import threading
+import time
+from unittest.mock import MagicMock
+from ProPyCore.access.base import Base
+from ProPyCore.utils.credentials import AccessToken
+from ProPyCore.utils.session import ProcoreSession
+
+
+def token_fetcher(expires_in=7200, delay=0):
+    calls = []
+    def fetch():
+        time.sleep(delay)
+        calls.append(1)
+        return {"access_token": f"token-{len(calls)}", "expires_in": expires_in}
+    return fetch, calls
+
+def test_token_is_fetched_on_first_use():
+    fetch, calls = token_fetcher()
+    token = AccessToken(fetch)
+
+    assert calls == []
+    assert token.value == "token-1"
+    assert token.value == "token-1"
+    assert len(calls) == 1
+
+def test_token_refreshes_before_expiry(mocker):
+    now = [1000.0]
+    mocker.patch("ProPyCore.utils.credentials.time.monotonic", side_effect=lambda: now[0])
+    fetch, calls = token_fetcher(expires_in=7200)
+    token = AccessToken(fetch, refresh_margin=300)
+
+    assert token.value == "token-1"
+    now[0] += 6899
+    assert token.value == "token-1"
+    now[0] += 1
+    assert token.value == "token-2"
+
+def test_short_lived_token_is_not_refetched_on_every_read(mocker):
+    now = [1000.0]
+    mocker.patch("ProPyCore.utils.credentials.time.monotonic", side_effect=lambda: now[0])
+    fetch, calls = token_fetcher(expires_in=200)
+    token = AccessToken(fetch, refresh_margin=300)
+
+    assert token.value == "token-1"
+    assert token.value == "token-1"
+    now[0] += 100
+    assert token.value == "token-2"
+
+def test_concurrent_readers_share_one_refresh():
+    fetch, calls = token_fetcher(delay=0.05)
+    token = AccessToken(fetch)
+
+    threads = [threading.Thread(target=lambda: token.value) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+
+def test_stale_refresh_is_skipped_once_replaced():
+    fetch, calls = token_fetcher()
+    token = AccessToken(fetch)
+    token.refresh()
+    token.refresh()
+
+    assert token.refresh(stale="token-1") == "token-2"
+    assert len(calls) == 2
+
+def test_request_retried_once_on_401():
+    fetch, calls = token_fetcher()
+    token = AccessToken(fetch)
+    token.refresh()
+
+    session = MagicMock(spec=ProcoreSession)
+    rejected = MagicMock(ok=False, status_code=401)
+    accepted = MagicMock(ok=True, status_code=200)
+    accepted.json.return_value = [{"id": 1}]
+    session.get.side_effect = [rejected, accepted]
+
+    base = Base(access_token=token, server_url="https://api.test", session=session)
+    assert base.get_request(api_url="/rest/v1.0/rfis") == [{"id": 1}]
+
+    sent = [call.kwargs["headers"]["Authorization"] for call in session.get.call_args_list]
+    assert sent == ["Bearer token-1", "Bearer token-2"]
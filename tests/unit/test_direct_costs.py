@@ -124,4 +124,76 @@ def test_create_direct_cost(direct_costs_instance, mocker):
     )
 
     assert isinstance(response, dict)
-    assert response == mock_response
\ No newline at end of file
+    assert response == mock_response
+
+def test_create_sends_header_and_line_items_in_one_request(direct_costs_instance, mocker):
+    post = mocker.patch.object(direct_costs_instance, 'post_request', return_value={'id': 7})
+    patch = mocker.patch.object(direct_costs_instance, 'patch_request')
+
+    response = direct_costs_instance.create(123, 456, {'description': 'Invoice'}, [{'manual_amount': 10}])
+
+    assert response == {'id': 7}
+    assert post.call_args.kwargs['data'] == {'direct_cost': {'description': 'Invoice', 'line_items': [{'manual_amount': 10}]}}
+    assert 'files' not in post.call_args.kwargs
+    patch.assert_not_called()
+
+def test_create_streams_attachments_in_one_upload(direct_costs_instance, mocker, tmp_path):
+    invoice = tmp_path / 'invoice.pdf'
+    invoice.write_bytes(b'%PDF')
+    receipt = tmp_path / 'receipt.png'
+    receipt.write_bytes(b'PNG')
+    mocker.patch.object(direct_costs_instance, 'post_request', return_value={'id': 7})
+    patch = mocker.patch.object(direct_costs_instance, 'patch_request', return_value={'id': 7, 'attachments': [1, 2]})
+
+    response = direct_costs_instance.create(123, 456, {'description': 'Invoice'}, [], attachments=[str(invoice), str(receipt)])
+
+    assert response == {'id': 7, 'attachments': [1, 2]}
+    assert patch.call_count == 1
+    files = patch.call_args.kwargs['files']
+    assert [(name, filename, mime) for name, (filename, _, mime) in files] == [
+        ('attachments[]', 'invoice.pdf', 'application/pdf'),
+        ('attachments[]', 'receipt.png', 'image/png'),
+    ]
+    assert all(handle.closed for _, (_, handle, _) in files)
+
+def test_create_many_reports_each_item(direct_costs_instance, mocker):
+    def post_request(api_url, additional_headers, data):
+        if data['direct_cost']['invoice_number'] == 'B':
+            raise NotFoundItemError('vendor not found')
+        return {'id': data['direct_cost']['invoice_number']}
+    post = mocker.patch.object(direct_costs_instance, 'post_request', side_effect=post_request)
+
+    report = direct_costs_instance.create_many(123, 456, [
+        {'direct_cost_data': {'invoice_number': 'A'}, 'line_items': [{'manual_amount': 1}]},
+        {'direct_cost_data': {'invoice_number': 'B'}},
+        {'direct_cost_data': {'invoice_number': 'C'}, 'attachments': ['missing.pdf']},
+        {'line_items': []},
+    ], max_workers=2)
+
+    assert [item['ok'] for item in report] == [True, False, False, False]
+    assert report[0]['direct_cost'] == {'id': 'A'}
+    assert 'vendor not found' in report[1]['error']
+    assert 'missing.pdf' in report[2]['error']
+    assert 'direct_cost_data' in report[3]['error']
+    assert post.call_count == 2
+
+def test_create_many_reports_partial_failures(direct_costs_instance, mocker, tmp_path):
+    invoice = tmp_path / 'invoice.pdf'
+    invoice.write_bytes(b'%PDF')
+    mocker.patch.object(direct_costs_instance, 'post_request', return_value={'id': 7})
+    mocker.patch.object(direct_costs_instance, 'patch_request', side_effect=NotFoundItemError('upload failed'))
+
+    report = direct_costs_instance.create_many(123, 456, [{'direct_cost_data': {'invoice_number': 'A'}, 'attachments': [str(invoice)]}])
+
+    assert report[0]['ok'] is False
+    assert report[0]['partial'] is True
+    assert report[0]['direct_cost'] == {'id': 7}
+    assert 'upload failed' in report[0]['error']
+
+def test_update_without_changes_returns_current(direct_costs_instance, mocker):
+    show = mocker.patch.object(direct_costs_instance, 'show', return_value={'id': 7})
+    patch = mocker.patch.object(direct_costs_instance, 'patch_request')
+
+    assert direct_costs_instance.update(123, 456, 7) == {'id': 7}
+    show.assert_called_once_with(123, 456, 7)
+    patch.assert_not_called()
@@ -0,0 +1,46 @@
+import sys
+import pytest
+from ProPyCore.access.documents.search import SearchIndex, trigrams
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([
+        {"id": 1, "name": "A-101 Floor Plan.pdf"},
+        {"id": 2, "name": "A-102 Reflected Ceiling Plan.pdf"},
+        {"id": 3, "name": "S-201 Foundation Details.pdf"},
+        {"id": 4, "name": "Specifications.docx"},
+    ])
+
+def test_trigrams():
+    assert trigrams("A-101") == {"a-1", "-10", "101"}
+    assert trigrams("ab") == set()
+
+def test_candidates_share_trigrams(index):
+    assert index.candidates("S-201") == [2]
+    assert index.candidates("zz") == [0, 1, 2, 3]
+
+def test_top_k_ranked(index):
+    matches = index.search("Plan", limit=2)
+
+    assert [doc["id"] for doc, _ in matches] == [1, 2]
+    assert all(score == 100 for _, score in matches)
+
+@pytest.mark.parametrize("rapidfuzz", [True, False])
+def test_scorers_agree(index, monkeypatch, rapidfuzz):
+    if rapidfuzz:
+        pytest.importorskip("rapidfuzz")
+    else:
+        monkeypatch.setitem(sys.modules, "rapidfuzz", None)
+
+    doc, score = index.search("S-201", limit=1)[0]
+
+    assert doc["id"] == 3
+    assert score == 100
+
+def test_cap_keeps_tied_candidates():
+    index = SearchIndex([{"id": i, "name": f"Plan {i}"} for i in range(1000)], max_candidates=10)
+
+    assert len(index.candidates("Plan")) == 1000
+    assert len(index.search("Plan", limit=None)) == 1000
+    assert len(index.search("Plan", limit=10)) == 10
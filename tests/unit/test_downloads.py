@@ -0,0 +1,95 @@
+import hashlib
+import pytest
+from unittest.mock import MagicMock
+from ProPyCore.access.documents.downloads import download_file, file_source
+from ProPyCore.access.documents.files import Files
+from ProPyCore.exceptions import IntegrityError, NotFoundClientError
+
+CONTENT = b"0123456789" * 100
+
+
+def fake_download(status_code, body):
+    response = MagicMock(ok=status_code < 400, status_code=status_code, headers={}, text="")
+    response.iter_content.side_effect = lambda chunk_size: (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+    return response
+
+def test_file_source_uses_latest_version():
+    doc = {"id": 1, "file_versions": [
+        {"created_at": "2026-01-01T00:00:00Z", "url": "https://storage.test/v1", "size": 10},
+        {"created_at": "2026-03-01T00:00:00Z", "prostore_file": {"url": "https://storage.test/v2", "size": 20}},
+    ]}
+
+    assert file_source(doc) == ("https://storage.test/v2", 20)
+
+def test_download_streams_to_disk(tmp_path):
+    endpoint = MagicMock()
+    endpoint.external_request.return_value = fake_download(200, CONTENT)
+    path = str(tmp_path / "Drawings" / "A-101.pdf")
+
+    result = download_file(endpoint, "https://storage.test/a", path, size=len(CONTENT), chunk_size=64)
+
+    assert open(path, "rb").read() == CONTENT
+    assert result["bytes"] == len(CONTENT) and not result["resumed"]
+    assert endpoint.external_request.call_args.kwargs == {"headers": {}, "stream": True}
+
+def test_download_resumes_partial_file(tmp_path):
+    path = tmp_path / "A-101.pdf"
+    (tmp_path / "A-101.pdf.part").write_bytes(CONTENT[:300])
+    endpoint = MagicMock()
+    endpoint.external_request.return_value = fake_download(206, CONTENT[300:])
+
+    result = download_file(endpoint, "https://storage.test/a", str(path), size=len(CONTENT), sha256=hashlib.sha256(CONTENT).hexdigest())
+
+    assert endpoint.external_request.call_args.kwargs["headers"] == {"Range": "bytes=300-"}
+    assert path.read_bytes() == CONTENT
+    assert result["resumed"] and result["bytes"] == len(CONTENT) - 300
+    assert not (tmp_path / "A-101.pdf.part").exists()
+
+def test_download_skips_matching_file(tmp_path):
+    path = tmp_path / "A-101.pdf"
+    path.write_bytes(CONTENT)
+    endpoint = MagicMock()
+
+    result = download_file(endpoint, "https://storage.test/a", str(path), size=len(CONTENT), sha256=hashlib.sha256(CONTENT).hexdigest())
+
+    assert result["skipped"]
+    endpoint.external_request.assert_not_called()
+
+def test_download_rejects_wrong_checksum(tmp_path):
+    endpoint = MagicMock()
+    endpoint.external_request.return_value = fake_download(200, CONTENT)
+
+    with pytest.raises(IntegrityError):
+        download_file(endpoint, "https://storage.test/a", str(tmp_path / "A-101.pdf"), sha256="0" * 64)
+
+    assert list(tmp_path.iterdir()) == []
+
+def test_download_many_reports_failures_and_throughput(mocker, tmp_path):
+    mocker.patch("ProPyCore.access.documents.files.Base.__init__", return_value=None)
+    files = Files(access_token="token", server_url="https://api.test")
+    mocker.patch.object(files, "show", side_effect=lambda company_id, project_id, doc_id: {
+        "id": doc_id, "file_versions": [{"url": f"https://storage.test/{doc_id}", "size": len(CONTENT)}]
+    })
+    mocker.patch.object(files, "external_request", side_effect=lambda method, url, **kwargs: (
+        fake_download(404, b"") if url.endswith("/3") else fake_download(200, CONTENT)
+    ))
+
+    summary = files.download_many(123, 456, {1: str(tmp_path / "a.pdf"), 2: str(tmp_path / "b.pdf"), 3: str(tmp_path / "c.pdf")}, max_workers=2)
+
+    assert summary["bytes"] == 2 * len(CONTENT)
+    assert summary["failed"] == 1
+    assert isinstance(next(result for result in summary["files"] if result["doc_id"] == 3)["error"], NotFoundClientError)
+    assert summary["throughput"] > 0
+
+def test_forced_download_ignores_matching_file(tmp_path):
+    path = tmp_path / "A-101.pdf"
+    path.write_bytes(b"x" * len(CONTENT))
+    (tmp_path / "A-101.pdf.part").write_bytes(b"stale")
+    endpoint = MagicMock()
+    endpoint.external_request.return_value = fake_download(200, CONTENT)
+
+    result = download_file(endpoint, "https://storage.test/a", str(path), size=len(CONTENT), force=True)
+
+    assert not result["skipped"] and not result["resumed"]
+    assert endpoint.external_request.call_args.kwargs["headers"] == {}
+    assert path.read_bytes() == CONTENT
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, mock_open
 from ProPyCore.access.documents.files import Files  # Adjust the import path as needed
+from ProPyCore.exceptions import NotFoundItemError
 
 
 class TestFiles:
@@ -197,3 +198,24 @@ class TestFiles:
         # Assertions
         assert response["id"] == 1
         assert response["search_criteria"]["match"] > 0
+
+    def test_find_by_path(self, files_instance, mocker):
+        """
+        Test the `find_by_path` method refreshes the index once on a miss.
+        """
+        listings = [
+            [[{"id": 2, "name": "Drawings", "document_type": "folder", "parent_id": None}]],
+            [[
+                {"id": 2, "name": "Drawings", "document_type": "folder", "parent_id": None},
+                {"id": 12, "name": "A-101.pdf", "document_type": "file", "parent_id": 2},
+            ]],
+        ]
+        mocker.patch.object(files_instance, "iter_pages", side_effect=lambda **kwargs: iter(listings.pop(0) if len(listings) > 1 else listings[0]))
+
+        doc = files_instance.find_by_path(company_id=123, project_id=456, path="Drawings/A-101.pdf")
+
+        assert doc["id"] == 12
+        assert files_instance.iter_pages.call_count == 2
+
+        with pytest.raises(NotFoundItemError):
+            files_instance.find_by_path(company_id=123, project_id=456, path="Drawings")
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from ProPyCore.access.documents.folders import Folders  # Adjust the import path as needed
+from ProPyCore.access.documents.tree import PathIndex
 
 
 class TestFolders:
@@ -151,3 +152,160 @@ class TestFolders:
             params={"project_id": 456},
             data={"folder": {"name": "Updated Folder"}}
         )
+
+    def test_walk(self, folders_instance, mocker):
+        """
+        Test the `walk` method visits every folder once and builds paths.
+        """
+        tree = {
+            None: {"id": 1, "name": "", "folders": [{"id": 2, "name": "Drawings"}, {"id": 3, "name": "Specs"}], "files": [{"id": 10, "name": "readme.txt"}]},
+            2: {"id": 2, "name": "Drawings", "folders": [{"id": 4, "name": "Arch"}, {"id": 3, "name": "Specs"}], "files": []},
+            3: {"id": 3, "name": "Specs", "folders": [], "files": [{"id": 11, "name": "old.pdf", "is_deleted": True}]},
+            4: {"id": 4, "name": "Arch", "folders": [], "files": [{"id": 12, "name": "A-101.pdf"}]},
+        }
+        mocker.patch.object(folders_instance, "root", side_effect=lambda company_id, project_id: tree[None])
+        mocker.patch.object(folders_instance, "show", side_effect=lambda company_id, project_id, doc_id: tree[doc_id])
+
+        walked = {path: [doc["name"] for doc in files] for path, folder, files in folders_instance.walk(company_id=123, project_id=456, max_workers=2)}
+
+        assert walked == {"": ["readme.txt"], "Drawings": [], "Specs": [], "Drawings/Arch": ["A-101.pdf"]}
+        assert folders_instance.show.call_count == 3
+
+    def test_tree(self, folders_instance, mocker):
+        """
+        Test the `tree` method nests the flat listing by parent_id.
+        """
+        mocker.patch.object(
+            folders_instance,
+            "iter_pages",
+            return_value=iter([[
+                {"id": 4, "name": "Arch", "document_type": "folder", "parent_id": 2, "is_deleted": False},
+                {"id": 2, "name": "Drawings", "document_type": "folder", "parent_id": 1, "is_deleted": False},
+                {"id": 12, "name": "A-101.pdf", "document_type": "file", "parent_id": 4, "is_deleted": False},
+                {"id": 10, "name": "readme.txt", "document_type": "file", "parent_id": 1, "is_deleted": False},
+                {"id": 13, "name": "gone.pdf", "document_type": "file", "parent_id": 4, "is_deleted": True},
+            ]])
+        )
+
+        root = folders_instance.tree(company_id=123, project_id=456)
+
+        assert [doc["name"] for doc in root["files"]] == ["readme.txt"]
+        drawings = root["folders"][0]
+        assert drawings["path"] == "Drawings"
+        arch = drawings["folders"][0]
+        assert arch["path"] == "Drawings/Arch"
+        assert [doc["name"] for doc in arch["files"]] == ["A-101.pdf"]
+
+    @pytest.fixture
+    def listing(self):
+        return [[
+            {"id": 1, "name": "", "document_type": "folder", "parent_id": None, "is_root": True},
+            {"id": 4, "name": "Arch", "document_type": "folder", "parent_id": 2},
+            {"id": 2, "name": "Drawings", "document_type": "folder", "parent_id": 1},
+            {"id": 12, "name": "A-101.pdf", "document_type": "file", "parent_id": 4},
+        ]]
+
+    def test_find_by_path(self, folders_instance, listing, mocker):
+        """
+        Test the `find_by_path` method resolves nested folders from one listing.
+        """
+        mocker.patch.object(folders_instance, "iter_pages", return_value=iter(listing))
+
+        folder = folders_instance.find_by_path(company_id=123, project_id=456, path="/Drawings/Arch/")
+        index = folders_instance.path_index(company_id=123, project_id=456)
+
+        assert folder["id"] == 4
+        assert index.path_for(12) == "Drawings/Arch/A-101.pdf"
+        assert folders_instance.iter_pages.call_count == 1
+
+    def test_ensure_path(self, folders_instance, listing, mocker):
+        """
+        Test the `ensure_path` method only creates the missing folders.
+        """
+        mocker.patch.object(folders_instance, "iter_pages", return_value=iter(listing))
+        created = iter([20, 21])
+        mocker.patch.object(
+            folders_instance,
+            "create",
+            side_effect=lambda company_id, project_id, folder_name, folder_id: {"id": next(created), "name": folder_name, "parent_id": folder_id}
+        )
+
+        folder_id = folders_instance.ensure_path(company_id=123, project_id=456, path="Drawings/Arch/Rev3/Sheets")
+
+        assert folder_id == 21
+        assert [call.kwargs["folder_id"] for call in folders_instance.create.call_args_list] == [4, 20]
+        assert folders_instance.path_index(company_id=123, project_id=456).id_for("Drawings/Arch/Rev3") == 20
+
+    def test_path_index_follows_renames(self, listing):
+        """
+        Test a renamed folder moves the paths below it.
+        """
+        index = PathIndex(listing[0])
+
+        index.update([{"id": 2, "name": "Plans", "document_type": "folder", "parent_id": 1}])
+
+        assert index.id_for("Drawings/Arch") is None
+        assert index.id_for("Plans/Arch/A-101.pdf") == 12
+
+        index.remove(2)
+        assert len(index) == 0
+
+    def test_path_index_moves_subtree(self, listing):
+        """
+        Test moving a folder carries its descendants and leaves its siblings alone, whatever order updates come in.
+        """
+        index = PathIndex(listing[0])
+        index.update([{"id": 13, "name": "A-102.pdf", "document_type": "file", "parent_id": 5}])
+        index.update([{"id": 5, "name": "Specs", "document_type": "folder", "parent_id": 1}])
+
+        index.update([{"id": 4, "name": "Arch", "document_type": "folder", "parent_id": 5}])
+
+        assert index.id_for("Specs/A-102.pdf") == 13
+        assert index.id_for("Specs/Arch/A-101.pdf") == 12
+        assert index.id_for("Drawings") == 2
+        assert index.id_for("Drawings/Arch") is None
+
+    def test_path_index_concurrent_updates(self, listing):
+        """
+        Test updates from several threads while another thread reads the index.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        index = PathIndex(listing[0])
+
+        def add(i):
+            index.update([{"id": 100 + i, "name": f"S-{i}.pdf", "document_type": "file", "parent_id": 4}])
+            return sum(1 for _ in index.items("Drawings"))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(add, range(500)))
+
+        assert len(index) == 503
+        assert index.id_for("Drawings/Arch/S-499.pdf") == 599
+
+    def test_files_and_folders_share_path_index(self, mocker):
+        """
+        Test Files and Folders on one session keep a single index current through creates and moves.
+        """
+        from ProPyCore.access.documents.files import Files
+
+        mocker.patch("ProPyCore.access.documents.files.Base.__init__", return_value=None)
+        session = MagicMock()
+        files = Files(access_token="token", server_url="https://api.test", session=session)
+        folders = Folders(access_token="token", server_url="https://api.test", session=session)
+        mocker.patch.object(folders, "iter_pages", return_value=iter([[
+            {"id": 1, "name": "", "document_type": "folder", "is_root": True},
+            {"id": 2, "name": "Drawings", "document_type": "folder", "parent_id": 1},
+            {"id": 3, "name": "A-101.pdf", "document_type": "file", "parent_id": 2},
+        ]]))
+        index = folders.path_index(company_id=123, project_id=456)
+
+        mocker.patch.object(folders, "post_request", return_value={"id": 4, "name": "Specs"})
+        folders.create(company_id=123, project_id=456, folder_name="Specs")
+        mocker.patch.object(files, "patch_request", return_value={"id": 3, "name": "A-101.pdf", "parent_id": 4})
+        files.update(company_id=123, project_id=456, doc_id=3, folder_id=4)
+
+        assert files.path_index(company_id=123, project_id=456) is index
+        assert index.id_for("Specs") == 4
+        assert index.id_for("Specs/A-101.pdf") == 3
+        assert index.id_for("Drawings/A-101.pdf") is None
@@ -0,0 +1,61 @@
+import pickle
+import pytest
+from ProPyCore.models import Document, Rfi, TimecardEntry
+
+RFI = {
+    "id": 1,
+    "number": "12",
+    "subject": "Door hardware",
+    "status": "open",
+    "assignees": [{"id": 3, "name": "Architect"}],
+    "cost_impact": {"status": "tbd", "value": None},
+    "private": False,
+}
+
+
+def test_round_trips_to_dict():
+    rfi = Rfi.from_dict(RFI)
+
+    assert rfi.to_dict() == RFI
+    assert not hasattr(rfi, "__dict__")
+
+def test_fields_decode_on_access():
+    rfi = Rfi.from_dict(RFI)
+
+    assert rfi.subject == "Door hardware"
+    assert rfi.assignees == [{"id": 3, "name": "Architect"}]
+    assert rfi.due_date is None
+    assert rfi["cost_impact"] == {"status": "tbd", "value": None}
+    assert rfi.get("due_date", "none") == "none"
+    with pytest.raises(KeyError):
+        rfi["not_a_field"]
+
+def test_from_json_is_lazy():
+    entry = TimecardEntry.from_json('{"id": 5, "hours": "8.0", "party": {"id": 9}, "login_information": {"id": 7}}')
+
+    with pytest.raises(AttributeError):
+        TimecardEntry._members["id"].__get__(entry)
+
+    assert entry.hours == "8.0"
+    assert entry.party == {"id": 9}
+    assert entry.to_dict() == {"id": 5, "hours": "8.0", "party": {"id": 9}, "login_information": {"id": 7}}
+
+def test_set_and_pickle():
+    doc = Document.from_rows([{"id": 1, "name": "A-101.pdf", "parent_id": 2}])[0]
+    doc.name = "A-102.pdf"
+    with pytest.raises(AttributeError):
+        doc.file_versions = []
+
+    copy = pickle.loads(pickle.dumps(doc))
+
+    assert copy == doc
+    assert copy.to_dict() == {"id": 1, "name": "A-102.pdf", "parent_id": 2}
+    assert repr(copy) == "Document(id=1, name='A-102.pdf', parent_id=2)"
+
+def test_models_do_not_shadow_endpoint_classes():
+    import ProPyCore
+    from ProPyCore.access.submittals import Submittal
+    from ProPyCore.access.tasks import Task
+
+    assert ProPyCore.Task is Task
+    assert ProPyCore.Submittal is Submittal
@@ -0,0 +1,127 @@
+import subprocess
+import sys
+import threading
+import pytest
+from unittest.mock import MagicMock
+from ProPyCore.procore import Procore
+from ProPyCore.access.rfis import RFI
+from ProPyCore.exceptions import NotFoundItemError, UnauthorizedClientError
+
+
+@pytest.fixture
+def procore(mocker):
+    session = MagicMock(cache=None, conditional_cache=None)
+    token = MagicMock(ok=True)
+    token.json.return_value = {"access_token": "token", "expires_in": 5400}
+    session.post.return_value = token
+    mocker.patch("ProPyCore.procore.ProcoreSession", return_value=session)
+    client = Procore(
+        client_id="id",
+        client_secret="secret",
+        redirect_uri="",
+        base_url="https://api.test",
+        oauth_url="https://login.test"
+    )
+    return client, session
+
+def test_import_skips_heavy_modules():
+    code = (
+        "import sys, ProPyCore; "
+        "print(sorted(m for m in sys.modules if m.startswith(('fuzzywuzzy', 'httpx', 'ProPyCore.access', 'ProPyCore.aio'))))"
+    )
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+    assert loaded == "[]"
+
+def test_init_does_not_fetch_token(procore):
+    _, session = procore
+    session.post.assert_not_called()
+
+def test_endpoints_built_on_first_access(procore):
+    client, _ = procore
+    assert "rfis" not in vars(client)
+
+    rfis = client.rfis
+
+    assert isinstance(rfis, RFI)
+    assert client.rfis is rfis
+    assert "rfis" in vars(client)
+
+def test_token_fetched_once_on_first_request(procore):
+    client, session = procore
+    response = MagicMock(ok=True, status_code=200)
+    response.json.return_value = [{"id": 1, "name": "Company"}]
+    session.get.return_value = response
+
+    client.companies.get_request(api_url="/rest/v1.0/companies")
+    client.projects.get_request(api_url="/rest/v1.0/companies")
+
+    assert session.post.call_count == 1
+    assert session.get.call_args.kwargs["headers"]["Authorization"] == "Bearer token"
+
+def test_unknown_attribute_raises(procore):
+    client, _ = procore
+    with pytest.raises(AttributeError):
+        client.not_an_endpoint
+
+def test_fan_out_streams_results_and_errors(procore):
+    client, _ = procore
+
+    def get(company_id, project_id):
+        if project_id == 2:
+            raise NotFoundItemError("404: project not found")
+        return [{"id": project_id * 10, "company_id": company_id}]
+
+    results = dict(client.fan_out(get, [1, {"id": 2, "company": {"id": 9}}, (8, 3)], company_id=7, concurrency=2))
+
+    assert results[1] == [{"id": 10, "company_id": 7}]
+    assert isinstance(results[2], NotFoundItemError)
+    assert results[3] == [{"id": 30, "company_id": 8}]
+
+def test_fan_out_by_company(procore):
+    client, _ = procore
+
+    results = dict(client.fan_out(lambda company_id: company_id * 2, [{"id": 1}, 2], key="company_id"))
+
+    assert results == {1: 2, 2: 4}
+
+def test_fan_out_times_out_slow_calls(procore):
+    client, _ = procore
+    release = threading.Event()
+
+    def get(company_id, project_id):
+        if project_id == 1:
+            release.wait(5)
+        return project_id
+
+    try:
+        results = list(client.fan_out(get, [1, 2, 3], company_id=7, concurrency=2, timeout=0.2))
+    finally:
+        release.set()
+
+    assert dict(results)[2] == 2 and dict(results)[3] == 3
+    assert isinstance(dict(results)[1], TimeoutError)
+    assert results[-1][0] == 1
+
+def test_fan_out_cancels_on_fatal_error(procore):
+    client, _ = procore
+    calls = []
+
+    def get(company_id, project_id):
+        calls.append(project_id)
+        if project_id == 1:
+            raise UnauthorizedClientError("401: Wrong client secret or/and refresh token")
+        return project_id
+
+    with pytest.raises(UnauthorizedClientError):
+        list(client.fan_out(get, range(1, 100), company_id=7, concurrency=1))
+
+    assert calls == [1]
+
+def test_star_import_exports_client_and_endpoints():
+    namespace = {}
+    exec("from ProPyCore import *", namespace)
+
+    assert namespace["Procore"] is Procore
+    assert namespace["RFI"] is RFI
+    assert "importlib" not in namespace
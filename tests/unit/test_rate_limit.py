@@ -0,0 +1,145 @@
+import io
+import time
+import pytest
+import requests
+from unittest.mock import MagicMock
+from ProPyCore.exceptions import RateLimitError, raise_exception
+from ProPyCore.utils.rate_limit import RateLimiter, backoff_delay, retry_after
+from ProPyCore.utils.session import ProcoreSession
+
+
+def fake_response(status_code, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {}, text="")
+    return response
+
+@pytest.fixture
+def sleeps(mocker):
+    calls = []
+    mocker.patch("ProPyCore.utils.session.time.sleep", side_effect=calls.append)
+    return calls
+
+@pytest.fixture
+def clock(mocker):
+    """Fake clock shared by time.monotonic, time.time and time.sleep in the limiter"""
+    now = [1000.0]
+    sleeps = []
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+    mocker.patch("ProPyCore.utils.rate_limit.time.monotonic", side_effect=lambda: now[0])
+    mocker.patch("ProPyCore.utils.rate_limit.time.time", side_effect=lambda: now[0])
+    mocker.patch("ProPyCore.utils.rate_limit.time.sleep", side_effect=sleep)
+    return now, sleeps
+
+def test_bucket_paces_after_burst(clock):
+    _, sleeps = clock
+    limiter = RateLimiter(rate=2, burst=2)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert sleeps == [pytest.approx(0.5)]
+
+def test_limiter_waits_for_server_reset(clock):
+    now, sleeps = clock
+    limiter = RateLimiter()
+    limiter.update({"X-Rate-Limit-Remaining": "1", "X-Rate-Limit-Reset": str(now[0] + 30)})
+
+    limiter.acquire()
+    assert sleeps == []
+
+    # quota spent - the next caller waits for the window to reset
+    limiter.acquire()
+    assert sleeps == [pytest.approx(30)]
+
+def test_limiter_keeps_lowest_remaining_in_window():
+    limiter = RateLimiter()
+    reset = str(time.time() + 60)
+    limiter.update({"X-Rate-Limit-Remaining": "10", "X-Rate-Limit-Reset": reset})
+    limiter.update({"X-Rate-Limit-Remaining": "12", "X-Rate-Limit-Reset": reset})
+
+    assert limiter._remaining == 10
+
+def test_retry_after_seconds_and_date():
+    assert retry_after({"Retry-After": "7"}) == 7
+    assert retry_after({}) is None
+    http_date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 20))
+    assert 15 < retry_after({"Retry-After": http_date}) <= 20
+
+def test_backoff_is_capped():
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, backoff_factor=1, backoff_max=5) <= 5
+
+def test_session_honours_retry_after(mocker, sleeps):
+    send = mocker.patch.object(requests.Session, "request", side_effect=[
+        fake_response(429, {"Retry-After": "3"}),
+        fake_response(200)
+    ])
+    limiter = RateLimiter()
+    mocker.patch.object(limiter, "pause")
+    session = ProcoreSession(rate_limiter=limiter)
+
+    response = session.get("https://api.test/rest/v1.0/rfis")
+
+    assert response.status_code == 200
+    assert send.call_count == 2
+    assert sleeps == [3]
+    limiter.pause.assert_called_once_with(3)
+
+def test_session_gives_up_after_max_retries(mocker, sleeps):
+    send = mocker.patch.object(requests.Session, "request", return_value=fake_response(503))
+    session = ProcoreSession(max_retries=2)
+
+    response = session.get("https://api.test/rest/v1.0/rfis")
+
+    assert response.status_code == 503
+    assert send.call_count == 3
+    assert len(sleeps) == 2
+
+def test_session_does_not_retry_post_on_503(mocker, sleeps):
+    send = mocker.patch.object(requests.Session, "request", return_value=fake_response(503))
+    session = ProcoreSession()
+
+    session.post("https://api.test/rest/v1.0/rfis", json={})
+
+    assert send.call_count == 1
+    assert sleeps == []
+
+def test_session_rewinds_files_on_retry(mocker, sleeps):
+    upload = io.BytesIO(b"drawing")
+    def send(method, url, **kwargs):
+        kwargs["files"][0][1][1].read()
+        return responses.pop(0)
+    responses = [fake_response(429, {"Retry-After": "0"}), fake_response(201)]
+    mocker.patch.object(requests.Session, "request", side_effect=send)
+    session = ProcoreSession()
+
+    session.post("https://api.test/rest/v1.0/files", files=[("file[data]", ("plan.pdf", upload))])
+
+    assert upload.tell() == len(b"drawing")
+    assert sleeps == [0]
+
+def test_session_skips_limiter_for_external_requests(mocker):
+    send = mocker.patch.object(requests.Session, "request", return_value=fake_response(200, {"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": "0"}))
+    limiter = RateLimiter(rate=1, burst=1)
+    acquire = mocker.patch.object(limiter, "acquire")
+    update = mocker.patch.object(limiter, "update")
+    session = ProcoreSession(rate_limiter=limiter)
+
+    session.request("GET", "https://storage.test/a", rate_limited=False)
+
+    assert send.call_count == 1
+    acquire.assert_not_called()
+    update.assert_not_called()
+
+def test_raise_rate_limit_error():
+    with pytest.raises(RateLimitError):
+        raise_exception(fake_response(429, {"Retry-After": "5"}))
+
+def test_utils_star_import_exports_only_classes():
+    import ProPyCore
+    from ProPyCore.utils.rate_limit import RateLimiter as Limiter
+    from ProPyCore.access.time import Time
+
+    assert ProPyCore.RateLimiter is Limiter
+    assert ProPyCore.ProcoreSession is ProcoreSession
+    assert ProPyCore.time.Time is Time
@@ -67,3 +67,18 @@ def test_find_rfi_not_found(rfi_instance, mocker):
 
     with pytest.raises(NotFoundItemError):
         rfi_instance.find(company_id=123, project_id=456, identifier='Nonexistent RFI')
+
+def test_iter_rfis(rfi_instance, mocker):
+    # Mock the get_request method to return two pages of RFIs
+    mock_response_page_1 = [{'id': 1, 'number': 'RFI-1'}, {'id': 2, 'number': 'RFI-2'}]
+    mock_response_page_2 = [{'id': 3, 'number': 'RFI-3'}]
+    pages = {1: mock_response_page_1, 2: mock_response_page_2}
+
+    mocker.patch.object(rfi_instance, 'get_request', side_effect=lambda api_url, additional_headers, params: pages.get(params["page"], []))
+
+    rfis = rfi_instance.iter_rfis(company_id=123, project_id=456)
+
+    # records are yielded one at a time and only the first page is requested up front
+    assert next(rfis) == {'id': 1, 'number': 'RFI-1'}
+    assert rfi_instance.get_request.call_count == 1
+    assert list(rfis) == [{'id': 2, 'number': 'RFI-2'}, {'id': 3, 'number': 'RFI-3'}]
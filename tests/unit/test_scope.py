@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import MagicMock
+from ProPyCore.procore import Procore
+from ProPyCore.access.rfis import RFI
+from ProPyCore.access.directory.people import People
+from ProPyCore.scope import CompanyScope
+from ProPyCore.exceptions import NotFoundItemError
+
+SETTINGS = {
+    "client_id": "id",
+    "client_secret": "secret",
+    "redirect_uri": "",
+    "base_url": "https://api.test",
+    "oauth_url": "https://login.test",
+    "rate_limit": 8,
+    "burst": 8,
+}
+
+
+@pytest.fixture
+def procore(mocker):
+    session = MagicMock(cache=None, conditional_cache=None)
+    mocker.patch("ProPyCore.procore.ProcoreSession", return_value=session)
+    return Procore(**SETTINGS)
+
+def test_for_company_binds_company_id(procore, mocker):
+    get = mocker.patch.object(RFI, "get", autospec=True, return_value=[{"id": 1}])
+
+    scope = procore.for_company(123)
+
+    assert isinstance(scope, CompanyScope)
+    assert procore.for_company(123) is scope
+    assert scope.rfis.get(456) == [{"id": 1}]
+    get.assert_called_once_with(procore.rfis, company_id=123, project_id=456)
+
+def test_for_company_binds_sub_endpoints(procore, mocker):
+    iter_people = mocker.patch.object(People, "iter_people", autospec=True, return_value=iter([]))
+
+    list(procore.for_company(123).directory.people.iter_people(project_id=456, per_page=100))
+
+    iter_people.assert_called_once_with(procore.directory.people, company_id=123, project_id=456, per_page=100)
+
+def test_reference_fetched_once(procore, mocker):
+    get = mocker.patch.object(procore.directory.vendors, "get", return_value=[{"id": 1, "name": "Acme"}])
+    scope = procore.for_company(123)
+
+    assert scope.reference("vendors") == [{"id": 1, "name": "Acme"}]
+    assert scope.reference("vendors") == [{"id": 1, "name": "Acme"}]
+    get.assert_called_once_with(company_id=123)
+
+    scope.reference("vendors", refresh=True)
+    assert get.call_count == 2
+
+    with pytest.raises(ValueError):
+        scope.reference("not_reference_data")
+
+def pipeline(scope):
+    if scope.company_id == 3:
+        raise NotFoundItemError("404: company not found")
+    return scope.company_id * 10, scope.procore.rate_limiter.rate, scope.procore.rate_limiter.burst
+
+def test_run_companies_in_worker_processes(procore):
+    results = dict(procore.run_companies(pipeline, [1, {"id": 2}, 3], processes=2))
+
+    assert results[1] == (10, 4, 4)
+    assert results[2] == (20, 4, 4)
+    assert isinstance(results[3], NotFoundItemError)
@@ -0,0 +1,181 @@
+import itertools
+import pytest
+from unittest.mock import MagicMock
+from ProPyCore.access.documents.downloads import download_file
+from ProPyCore.access.documents.tree import PathIndex
+from ProPyCore.sync import DirectorySync, IncrementalSync
+
+
+@pytest.fixture
+def procore():
+    return MagicMock()
+
+@pytest.fixture
+def syncer(procore, tmp_path):
+    return IncrementalSync(procore, str(tmp_path / "state.sqlite"))
+
+def test_first_sync_pulls_everything(syncer, procore):
+    procore.rfis.get.return_value = [
+        {"id": 1, "updated_at": "2026-09-01T10:00:00Z"},
+        {"id": 2, "updated_at": "2026-09-03T08:30:00.250Z"},
+    ]
+
+    changes = syncer.sync(company_id=8, project_id=1, tool="rfis")
+
+    procore.rfis.get.assert_called_once_with(company_id=8, project_id=1)
+    assert [record["id"] for record in changes["upserts"]] == [1, 2]
+    assert changes["deletions"] == []
+    assert changes["until"] == "2026-09-03T08:30:00Z"
+    assert syncer.state.get_ids(8, 1, "rfis") == {"1", "2"}
+
+def test_next_sync_filters_by_mark(syncer, procore):
+    procore.quality.punch.get.return_value = [{"id": 1, "updated_at": "2026-09-01T10:00:00Z"}]
+    syncer.sync(company_id=8, project_id=1, tool="punch_items")
+
+    procore.quality.punch.get.return_value = [
+        {"id": 3, "updated_at": "2026-09-05T10:00:00Z"},
+        {"id": 1, "updated_at": "2026-09-06T10:00:00Z", "deleted_at": "2026-09-06T10:00:00Z"},
+    ]
+    changes = syncer.sync(company_id=8, project_id=1, tool="punch_items")
+
+    updated_at = procore.quality.punch.get.call_args.kwargs["filters"]["updated_at"]
+    assert updated_at.startswith("2026-09-01T10:00:00Z...")
+    assert [record["id"] for record in changes["upserts"]] == [3]
+    assert changes["deletions"] == [1]
+    assert syncer.state.get_ids(8, 1, "punch_items") == {"3"}
+    assert syncer.state.get_mark(8, 1, "punch_items") == "2026-09-06T10:00:00Z"
+
+def test_uncommitted_sync_leaves_state(syncer, procore):
+    procore.tasks.get.return_value = [{"id": 1, "updated_at": "2026-09-01T10:00:00Z"}]
+
+    changes = syncer.sync(company_id=8, project_id=1, tool="tasks", commit=False)
+    assert syncer.state.get_mark(8, 1, "tasks") is None
+
+    syncer.commit(changes)
+    assert syncer.state.get_mark(8, 1, "tasks") == "2026-09-01T10:00:00Z"
+
+def test_reconcile_reports_removed_records(syncer, procore):
+    procore.change_events.get.return_value = [
+        {"id": 1, "updated_at": "2026-09-01T10:00:00Z"},
+        {"id": 2, "updated_at": "2026-09-01T11:00:00Z"},
+    ]
+    syncer.sync(company_id=8, project_id=1, tool="change_events")
+
+    procore.change_events.get.return_value = [{"id": 1, "updated_at": "2026-09-01T10:00:00Z"}]
+    changes = syncer.sync(company_id=8, project_id=1, tool="change_events", reconcile=True)
+
+    assert changes["upserts"] == []
+    assert changes["deletions"] == [2]
+
+def test_reconcile_lists_soft_deleted_records_once(syncer, procore):
+    procore.change_events.get.return_value = [
+        {"id": 1, "updated_at": "2026-09-01T10:00:00Z"},
+        {"id": 2, "updated_at": "2026-09-01T11:00:00Z"},
+    ]
+    syncer.sync(company_id=8, project_id=1, tool="change_events")
+
+    procore.change_events.get.return_value = [
+        {"id": 1, "updated_at": "2026-09-01T10:00:00Z"},
+        {"id": 2, "updated_at": "2026-09-02T11:00:00Z", "deleted_at": "2026-09-02T11:00:00Z"},
+    ]
+    changes = syncer.sync(company_id=8, project_id=1, tool="change_events", reconcile=True)
+
+    assert changes["deletions"] == [2]
+
+def test_unknown_tool(syncer):
+    with pytest.raises(ValueError):
+        syncer.sync(company_id=8, project_id=1, tool="drawings")
+
+@pytest.fixture
+def documents(procore):
+    """Remote Documents tool backed by a PathIndex, with create/ensure_path/download faked on top"""
+    index = PathIndex([
+        {"id": 1, "name": "", "document_type": "folder", "parent_id": None, "is_root": True},
+        {"id": 2, "name": "Specs", "document_type": "folder", "parent_id": 1},
+        {"id": 3, "name": "spec.pdf", "document_type": "file", "parent_id": 2, "updated_at": "2026-09-01T10:00:00Z"},
+    ])
+    ids = itertools.count(100)
+    procore.folders.path_index.return_value = index
+
+    def ensure_path(company_id, project_id, path):
+        parent_id = index.root_id
+        current = ""
+        for name in [segment for segment in path.split("/") if segment]:
+            current = f"{current}/{name}" if current else name
+            if index.id_for(current) is None:
+                index.update([{"id": next(ids), "name": name, "document_type": "folder", "parent_id": parent_id}])
+            parent_id = index.id_for(current)
+        return parent_id
+
+    def create(company_id, project_id, filepath, folder_id=None):
+        doc = {"id": next(ids), "name": filepath.rsplit("/", 1)[-1], "document_type": "file", "parent_id": folder_id, "updated_at": "2026-09-02T10:00:00Z"}
+        index.update([doc])
+        return doc
+
+    def download(company_id, project_id, doc_id, path, force=False):
+        with open(path, "wb") as handle:
+            handle.write(b"remote spec")
+
+    procore.folders.ensure_path.side_effect = ensure_path
+    procore.files.create.side_effect = create
+    procore.files.download.side_effect = download
+    return index
+
+def test_directory_sync_transfers_only_changes(procore, documents, tmp_path, mocker):
+    (tmp_path / "Drawings" / "Arch").mkdir(parents=True)
+    (tmp_path / "Drawings" / "Arch" / "A-101.pdf").write_bytes(b"plan")
+    (tmp_path / "Specs").mkdir()
+    mirror = DirectorySync(procore, str(tmp_path))
+
+    report = mirror.sync(company_id=8, project_id=2)
+
+    assert report["created"] == ["Drawings/Arch/A-101.pdf"]
+    assert report["downloaded"] == ["Specs/spec.pdf"]
+    assert report["folders_created"] == 2
+    assert (tmp_path / "Specs" / "spec.pdf").read_bytes() == b"remote spec"
+
+    hashes = mocker.patch("ProPyCore.sync._sha256_of")
+    report = mirror.sync(company_id=8, project_id=2)
+
+    assert report["created"] == report["updated"] == report["downloaded"] == []
+    assert sorted(report["unchanged"]) == ["Drawings/Arch/A-101.pdf", "Specs/spec.pdf"]
+    assert procore.files.create.call_count == 1
+    hashes.assert_not_called()
+
+def test_directory_sync_pulls_remote_edit_of_same_size(procore, documents, tmp_path):
+    remote = {"body": b"v1"}
+    storage = MagicMock()
+
+    def fetch(method, url, headers, stream):
+        response = MagicMock(ok=True, status_code=200)
+        response.iter_content.return_value = [remote["body"]]
+        return response
+
+    storage.external_request.side_effect = fetch
+    procore.files.download.side_effect = lambda company_id, project_id, doc_id, path, force=False: download_file(
+        storage, "https://storage.test/3", path, size=len(remote["body"]), force=force
+    )
+    (tmp_path / "Specs").mkdir()
+    mirror = DirectorySync(procore, str(tmp_path))
+    mirror.sync(company_id=8, project_id=2, direction="pull")
+
+    remote["body"] = b"v2"
+    documents.update([dict(documents.doc_for("Specs/spec.pdf"), updated_at="2026-09-05T10:00:00Z")])
+    report = mirror.sync(company_id=8, project_id=2, direction="pull")
+
+    assert report["downloaded"] == ["Specs/spec.pdf"]
+    assert storage.external_request.call_count == 2
+    assert (tmp_path / "Specs" / "spec.pdf").read_bytes() == b"v2"
+
+def test_directory_sync_reports_conflicts(procore, documents, tmp_path):
+    (tmp_path / "Specs").mkdir()
+    mirror = DirectorySync(procore, str(tmp_path))
+    mirror.sync(company_id=8, project_id=2)
+
+    (tmp_path / "Specs" / "spec.pdf").write_bytes(b"local edit")
+    documents.update([dict(documents.doc_for("Specs/spec.pdf"), updated_at="2026-09-05T10:00:00Z")])
+    report = mirror.sync(company_id=8, project_id=2)
+
+    assert report["conflicts"] == ["Specs/spec.pdf"]
+    procore.files.update.assert_not_called()
+    assert (tmp_path / "Specs" / "spec.pdf").read_bytes() == b"local edit"
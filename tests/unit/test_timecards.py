@@ -109,3 +109,95 @@ class TestTimecards:
             ),
         ]
         timecards_instance.get_request.assert_has_calls(expected_calls)
+
+    def test_create_many_resolves_references_once(self, timecards_instance, mocker):
+        """
+        Test create_many downloads each reference listing once and reports per row.
+        """
+        iter_people = mocker.patch.object(timecards_instance.people, "iter_people", return_value=iter([
+            {"id": 7, "name": "Dana Lee", "contact": {"email": "dana@example.com"}},
+        ]))
+        get_time_types = mocker.patch.object(timecards_instance, "get_time_types", return_value=[
+            {"id": 1, "name": "Salary"}, {"id": 2, "name": "Overtime"},
+        ])
+        iter_codes = mocker.patch.object(timecards_instance.cost_codes, "iter_codes", return_value=iter([
+            {"id": 30, "name": "Concrete"},
+        ]))
+        show = mocker.patch.object(timecards_instance.cost_codes, "show", return_value={"id": 30, "line_item_types": [{"id": 4}]})
+        post = mocker.patch.object(timecards_instance, "post_request", side_effect=lambda api_url, additional_headers, data: {"id": data["timecard_entry"]["hours"]})
+
+        entries = [
+            {"party_id": "dana@example.com", "hours": 8, "cost_code_id": "Concrete", "date": "2026-09-01"},
+            {"party_id": "Dana Lee", "hours": 2, "timecard_time_type_id": "Overtime", "cost_code_id": "Concrete", "date": "2026-09-01"},
+            {"party_id": "nobody@example.com", "hours": 8, "date": "2026-09-01"},
+            {"party_id": 7, "date": "2026-09-01"},
+        ]
+        report = timecards_instance.create_many(company_id=123, project_id=456, entries=entries, max_workers=2)
+
+        assert [row["ok"] for row in report] == [True, True, False, False]
+        assert report[2]["error"] == "Person 'nobody@example.com' not found."
+        assert report[3]["error"] == "Input data must have an 'hours' field."
+        assert iter_people.call_count == get_time_types.call_count == iter_codes.call_count == show.call_count == 1
+        assert post.call_count == 2
+
+        first = next(call.kwargs["data"]["timecard_entry"] for call in post.call_args_list if call.kwargs["data"]["timecard_entry"]["hours"] == "8")
+        assert first == {
+            "party_id": 7, "hours": "8", "timecard_time_type_id": 1, "cost_code_id": 30, "line_item_type_id": 4,
+            "date": "2026-09-01", "datetime": "2026-09-01T12:00:00Z",
+        }
+        assert entries[0]["party_id"] == "dana@example.com"  # caller's rows are left untouched
+
+    def test_get_for_specified_period_shards_range(self, timecards_instance, mocker):
+        """
+        Test get_for_specified_period fetches weekly shards and drops duplicate entries.
+        """
+        def get_request(api_url, additional_headers, params):
+            if params["page"] > 1:
+                return []
+            day = int(params["start_date"][-2:])
+            # the entry on the shard boundary comes back from both shards
+            return [{"id": day}, {"id": 8}] if day in (1, 8) else [{"id": day}]
+
+        get = mocker.patch.object(timecards_instance, "get_request", side_effect=get_request)
+
+        timecards = timecards_instance.get_for_specified_period(
+            company_id=123,
+            start_date=datetime(2026, 9, 1),
+            end_date=datetime(2026, 9, 20),
+            shard_days=7,
+        )
+
+        assert [timecard["id"] for timecard in timecards] == [1, 8, 15]
+        ranges = {(call.kwargs["params"]["start_date"], call.kwargs["params"]["end_date"]) for call in get.call_args_list}
+        assert ranges == {("2026-09-01", "2026-09-07"), ("2026-09-08", "2026-09-14"), ("2026-09-15", "2026-09-20")}
+
+    def test_iter_sharded_window(self):
+        """
+        Test iter_sharded keeps at most max_workers shards in flight and stops fetching when the consumer stops.
+        """
+        import threading
+        import time
+        from ProPyCore.access.time.shards import iter_sharded
+
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0, "fetched": 0}
+
+        def fetch(start, end):
+            with lock:
+                state["running"] += 1
+                state["fetched"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return [{"id": start}]
+
+        shards = [(day, day) for day in range(20)]
+        assert [record["id"] for record in iter_sharded(fetch, shards, max_workers=3)] == list(range(20))
+        assert state["peak"] <= 3
+
+        state["fetched"] = 0
+        records = iter_sharded(fetch, shards, max_workers=3)
+        next(records)
+        records.close()
+        assert state["fetched"] <= 4
@@ -0,0 +1,114 @@
+import io
+import json
+import os
+import pytest
+import requests
+from email.parser import BytesParser
+from unittest.mock import MagicMock
+from ProPyCore.access.base import Base
+from ProPyCore.access.documents.files import Files
+from ProPyCore.access.documents.uploads import plan_segments, upload_segmented
+from ProPyCore.exceptions import ServiceUnavailableError
+from ProPyCore.utils.multipart import MultipartEncoder
+from ProPyCore.utils.session import ProcoreSession
+
+
+def parse(encoder, body):
+    message = BytesParser().parsebytes(f"Content-Type: {encoder.content_type}\r\n\r\n".encode() + body)
+    return {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+
+def test_encoder_streams_fields_and_files(tmp_path):
+    drawing = tmp_path / "A-101.pdf"
+    drawing.write_bytes(b"%PDF" + bytes(range(256)) * 1000)
+
+    with open(drawing, "rb") as handle:
+        encoder = MultipartEncoder(fields={"file[name]": "A-101.pdf", "file[parent_id]": 7}, files=[("file[data]", handle)])
+        chunks = iter(lambda: encoder.read(1000), b"")
+        body = b"".join(chunks)
+
+    assert len(body) == len(encoder)
+    parts = parse(encoder, body)
+    assert parts["file[name]"].get_payload() == "A-101.pdf"
+    assert parts["file[parent_id]"].get_payload() == "7"
+    assert parts["file[data]"].get_filename() == "A-101.pdf"
+    assert parts["file[data]"].get_content_type() == "application/pdf"
+    assert parts["file[data]"].get_payload(decode=True) == drawing.read_bytes()
+
+def test_encoder_rewinds_for_retries():
+    upload = io.BytesIO(b"drawing")
+    encoder = MultipartEncoder(files=[("file[data]", ("plan.pdf", upload))], boundary="b")
+
+    first = encoder.read()
+    encoder.seek(0)
+
+    assert encoder.read() == first
+    assert requests.utils.super_len(encoder) == 0
+    encoder.seek(0)
+    assert requests.utils.super_len(encoder) == len(first)
+
+def test_post_request_streams_files():
+    session = MagicMock(spec=ProcoreSession)
+    session.post.return_value = MagicMock(ok=True, status_code=201)
+    base = Base(access_token="token", server_url="https://api.test", session=session)
+
+    base.post_request(api_url="/rest/v1.0/files", data={"file[name]": "plan.pdf"}, files=[("file[data]", io.BytesIO(b"drawing"))])
+
+    kwargs = session.post.call_args.kwargs
+    assert "files" not in kwargs
+    assert isinstance(kwargs["data"], MultipartEncoder)
+    assert kwargs["headers"]["Content-Type"] == kwargs["data"].content_type
+
+def test_plan_segments(tmp_path):
+    model = tmp_path / "model.rvt"
+    model.write_bytes(b"0123456789")
+
+    segments = plan_segments(str(model), part_size=4)
+
+    assert [segment["size"] for segment in segments] == [4, 4, 2]
+
+def test_segmented_upload_resumes(tmp_path):
+    model = tmp_path / "model.rvt"
+    model.write_bytes(b"0123456789")
+    state_path = str(tmp_path / "model.upload.json")
+
+    endpoint = MagicMock()
+    endpoint.post_request.return_value = {
+        "uuid": "01ABC",
+        "segments": [{"url": f"https://storage.test/{i}", "headers": {"x-amz-checksum": str(i)}} for i in range(3)],
+    }
+    puts = []
+    def put(method, url, data, headers):
+        puts.append((url, data))
+        if url.endswith("/1") and [put_url for put_url, _ in puts].count(url) == 1:
+            return MagicMock(ok=False, status_code=503, headers={}, text="")
+        return MagicMock(ok=True, headers={"ETag": f'"{url[-1]}"'})
+    endpoint.external_request.side_effect = put
+
+    with pytest.raises(ServiceUnavailableError):
+        upload_segmented(endpoint, 8, 2, str(model), part_size=4, max_workers=2, state_path=state_path)
+
+    with open(state_path) as handle:
+        etags = json.load(handle)["etags"]
+    assert etags[0] == '"0"' and etags[1] is None
+    resumed = len(puts)
+
+    upload_uuid = upload_segmented(endpoint, 8, 2, str(model), part_size=4, max_workers=2, state_path=state_path)
+
+    assert upload_uuid == "01ABC"
+    assert endpoint.post_request.call_count == 1
+    assert ("https://storage.test/1", b"4567") in puts[resumed:]
+    assert ("https://storage.test/0", b"0123") not in puts[resumed:]
+    completed = endpoint.patch_request.call_args.kwargs
+    assert completed["api_url"] == "/rest/v1.1/projects/2/uploads/01ABC"
+    assert [segment["etag"] for segment in completed["data"]["segments"]] == ['"0"', '"1"', '"2"']
+    assert not os.path.exists(state_path)
+
+def test_files_upload_creates_file_from_upload(mocker):
+    mocker.patch("ProPyCore.access.documents.files.Base.__init__", return_value=None)
+    files = Files(access_token="token", server_url="https://api.test")
+    mocker.patch("ProPyCore.access.documents.files.upload_segmented", return_value="01ABC")
+    post = mocker.patch.object(files, "post_request", return_value={"id": 1, "name": "model.rvt"})
+
+    files.upload(company_id=8, project_id=2, filepath="/models/model.rvt", folder_id="5")
+
+    assert post.call_args.kwargs["data"] == {"file": {"name": "model.rvt", "upload_uuid": "01ABC", "parent_id": 5}}